@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Parser benchmark for the standings scrapers.
+Times each parser over recorded pages (a --record snapshot archive) and synthetic
+inflated pages, reports throughput, peak memory and result equality, and flags
+regressions against a stored baseline.
+
+Usage:
+    python benchmark_parsers.py [snapshots.zip] [--save-baseline] [--tolerance 0.25]
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from scrape_brasileirao_simple import BrasileiroScraper, CBFStandingsParser, SnapshotArchive
+
+BASELINE_FILE = "benchmark_baseline.json"
+
+# Source name by URL fragment of the recorded page
+SOURCES_BY_URL = {
+    'cbf.com.br': 'cbf',
+    'espn.com.br': 'espn',
+    'gazetaesportiva.com': 'gazeta',
+    'ge.globo.com': 'ge',
+}
+
+# How many times each page is inflated with filler markup for the synthetic cases
+INFLATE_FACTORS = (1, 20)
+
+
+def get_parsers(scraper):
+    """Parsers to benchmark for each source; the first one is the reference for equality"""
+    def cbf_stream(html_content, team_match_map):
+        parser = scraper.run_stream_parser(CBFStandingsParser, scraper.iter_chunks(html_content))
+        return scraper.parse_cbf_standings_stream(parser, team_match_map)
+
+    return {
+        'cbf': [
+            ('parse_cbf_standings_html', scraper.parse_cbf_standings_html),
+            ('parse_cbf_standings_regex', scraper.parse_cbf_standings_regex),
+            ('cbf_stream_64k', cbf_stream),
+            ('parse_embedded_json_standings', scraper.parse_embedded_json_standings),
+        ],
+        'espn': [('parse_espn_standings_html', scraper.parse_espn_standings_html)],
+        'gazeta': [('parse_gazeta_standings_html', scraper.parse_gazeta_standings_html)],
+        'ge': [('parse_ge_standings_html', scraper.parse_ge_standings_html)],
+    }
+
+
+def synthetic_pages(teams):
+    """Minimal pages in each source's markup, built from the predicted teams"""
+    cbf_rows = []
+    espn_rows = []
+    gazeta_rows = []
+    ge_rows = []
+    for position, team in enumerate(teams, 1):
+        points = 60 - 2 * position
+        cbf_rows.append(
+            f'<tr><td class="styles_teamPosition__CFIvz"><strong class="styles_position__x">{position}</strong>'
+            f'<strong class="styles_teamName__x">{team}</strong></td><td>{points}</td><td>23</td><td>10</td></tr>'
+        )
+        espn_rows.append(
+            f'<tr><td>{position}</td><td><a href="/time">{team}</a></td><td>23</td><td>10</td><td>5</td><td>{points}</td></tr>'
+        )
+        gazeta_rows.append(f'<tr><td>{position}</td><td>{team}</td><td>{points}</td><td>23</td></tr>')
+        ge_rows.append(f'<tr><td>{position}</td><td>{team}</td><td>{points}</td></tr>')
+
+    return {
+        'cbf': ('<html><body><h2>GRUPO ÚNICO</h2><table><tbody>' + "".join(cbf_rows) +
+                '</tbody></table></body></html>'),
+        'espn': '<html><body><table>' + "".join(espn_rows) + '</table></body></html>',
+        'gazeta': '<html><body><table><tr><th>Time</th></tr>' + "".join(gazeta_rows) + '</table></body></html>',
+        'ge': '<html><body><table>' + "".join(ge_rows) + '</table></body></html>',
+    }
+
+
+def inflate_page(html_content, factor):
+    """Pad a page with filler markup before and after its content"""
+    if factor <= 1:
+        return html_content
+    filler = '<div class="filler"><p>Notícias &amp; destaques da rodada</p><a href="/x">link</a></div>\n' * (200 * factor)
+    body_start = html_content.find('<body')
+    body_start = html_content.find('>', body_start) + 1 if body_start >= 0 else 0
+    body_end = html_content.rfind('</body>')
+    if body_end < body_start:
+        body_end = len(html_content)
+    return html_content[:body_start] + filler + html_content[body_start:body_end] + filler + html_content[body_end:]
+
+
+def collect_cases(archive_path, teams):
+    """(case name, source, page) for every recorded and synthetic page"""
+    cases = []
+    if archive_path:
+        archive = SnapshotArchive(archive_path)
+        for url, timestamp, name in archive.entries():
+            source = next((src for fragment, src in SOURCES_BY_URL.items() if fragment in url), None)
+            if not source:
+                continue
+            page = archive.load(name)
+            for factor in INFLATE_FACTORS:
+                cases.append((f"{source}@{timestamp:%Y%m%d-%H%M%S}x{factor}", source, inflate_page(page, factor)))
+
+    for source, page in synthetic_pages(teams).items():
+        for factor in INFLATE_FACTORS:
+            cases.append((f"{source}@syntheticx{factor}", source, inflate_page(page, factor)))
+    return cases
+
+
+def result_hash(result):
+    """Stable hash of a parser result for equality checks across runs"""
+    data = json.dumps(result, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()[:12]
+
+
+def time_parser(parser, page, team_match_map, repeats):
+    """Best wall time, peak traced memory and result of a parser on a page"""
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = parser(page, team_match_map)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    parser(page, team_match_map)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def run_benchmark(archive_path=None, predictions_file="bolao.json", repeats=5):
+    """Benchmark every parser over every case; returns a dict of results by case/parser"""
+    scraper = BrasileiroScraper(attempts_file=None, http_cache_file=None)
+    predictions = scraper.load_predictions(predictions_file) or {}
+    teams = sorted(scraper.get_teams_from_predictions(predictions))
+    team_match_map = scraper.build_team_match_map(teams)
+    parsers = get_parsers(scraper)
+
+    results = {}
+    print(f"{'Case':<32} {'Parser':<32} {'ms':>9} {'MB/s':>8} {'Peak KB':>9} {'Rows':>5}  Equal")
+    print("-" * 110)
+    for case_name, source, page in collect_cases(archive_path, teams):
+        size_mb = len(page.encode('utf-8')) / 1e6
+        reference_hash = None
+        for parser_name, parser in parsers[source]:
+            seconds, peak, result = time_parser(parser, page, team_match_map, repeats)
+            digest = result_hash(result)
+            if reference_hash is None:
+                reference_hash = digest
+            # The embedded JSON path only answers when the page has JSON
+            equal = digest == reference_hash or (parser_name == 'parse_embedded_json_standings' and result is None)
+            results[f"{case_name}/{parser_name}"] = {
+                'seconds': seconds,
+                'peak_bytes': peak,
+                'rows': len(result or []),
+                'hash': digest,
+            }
+            print(f"{case_name:<32} {parser_name:<32} {seconds * 1000:>9.2f} {size_mb / seconds if seconds else 0:>8.1f} "
+                  f"{peak / 1024:>9.0f} {len(result or []):>5}  {'✅' if equal else '❌'}")
+    return results
+
+
+# Timing differences below this are treated as noise (seconds)
+MIN_TIME_DELTA = 0.002
+
+
+def compare_with_baseline(results, baseline, tolerance):
+    """List regressions: slower than baseline by more than tolerance, or different results"""
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if not previous:
+            continue
+        if current['hash'] != previous['hash']:
+            regressions.append(f"{key}: result changed ({previous['hash']} -> {current['hash']})")
+        if (current['seconds'] > previous['seconds'] * (1 + tolerance)
+                and current['seconds'] - previous['seconds'] > MIN_TIME_DELTA):
+            regressions.append(f"{key}: {previous['seconds'] * 1000:.2f}ms -> {current['seconds'] * 1000:.2f}ms")
+        if current['peak_bytes'] > previous['peak_bytes'] * (1 + tolerance):
+            regressions.append(f"{key}: peak {previous['peak_bytes'] // 1024}KB -> {current['peak_bytes'] // 1024}KB")
+    return regressions
+
+
+def main():
+    args = sys.argv[1:]
+    save_baseline = "--save-baseline" in args
+    tolerance = 0.25
+    if "--tolerance" in args:
+        tolerance = float(args[args.index("--tolerance") + 1])
+    positional = [arg for i, arg in enumerate(args)
+                  if not arg.startswith("--") and (i == 0 or args[i - 1] != "--tolerance")]
+    archive_path = positional[0] if positional else None
+
+    results = run_benchmark(archive_path)
+
+    if save_baseline:
+        with open(BASELINE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📌 Baseline saved to {BASELINE_FILE}")
+        return 0
+
+    if not os.path.exists(BASELINE_FILE):
+        print(f"\nℹ️  No baseline yet - run with --save-baseline to create {BASELINE_FILE}")
+        return 0
+
+    with open(BASELINE_FILE, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare_with_baseline(results, baseline, tolerance)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) against {BASELINE_FILE}:")
+        for regression in regressions:
+            print(f"- {regression}")
+        return 1
+
+    print(f"\n✅ No regressions against {BASELINE_FILE} (tolerance {tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,36 +4,1703 @@ Brazilian Soccer Championship 2026 Classification Scraper
 Compares actual standings with player predictions and calculates scores.
 """
 
+import codecs
+import contextlib
+import hashlib
+import heapq
+import importlib
+import importlib.util
+import io
 import json
+import mmap
 import os
-import urllib.request
+import time
+import math
+import threading
 import urllib.parse
-import ssl
 import re
 import html
+from html.parser import HTMLParser
 from datetime import datetime
 import base64
-import unicodedata
+import bisect
+import zipfile
+import zlib
+from collections import deque
+from itertools import chain
+from concurrent.futures import Future, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from types import MappingProxyType
 
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.dates as mdates
-    from matplotlib.backends.backend_agg import FigureCanvasAgg
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
 
-class BrasileiroScraper:
+class LazyModule:
+    """Module imported on first attribute access.
+
+    Keeps heavy imports off the startup path of a poll that ends with "nothing
+    changed" (see --profile-startup).
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.module = None
+
+    def __getattr__(self, attribute):
+        if self.module is None:
+            self.module = importlib.import_module(self.name)
+        return getattr(self.module, attribute)
+
+    @property
+    def loaded(self):
+        return self.module is not None
+
+
+# Imported on first use: HTTP/TLS only when a page is actually fetched, matplotlib only
+# when a chart has to be drawn, numpy only for large pools, history columns and simulations
+http_client = LazyModule("http.client")
+urllib_error = LazyModule("urllib.error")
+ssl = LazyModule("ssl")
+unicodedata = LazyModule("unicodedata")
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec("matplotlib") is not None
+plt = LazyModule("matplotlib.pyplot")
+# pyplot state is global to the process: charts are drawn one at a time
+PYPLOT_LOCK = threading.Lock()
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+np = LazyModule("numpy")
+
+# Returned by fetch_url when the server answers 304 Not Modified to a conditional request
+NOT_MODIFIED = object()
+
+
+def submit_daemon(function, *args):
+    """Run function(*args) on a daemon thread and return its Future.
+
+    Unlike ThreadPoolExecutor workers, which are joined at interpreter exit, a
+    request that lost a race (slower source, hedged duplicate) never keeps the
+    process alive.
+    """
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = function(*args)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+class ThreadOutput:
+    """sys.stdout stand-in that keeps each capturing thread's prints apart.
+
+    contextlib.redirect_stdout swaps the stream for the whole process; with this
+    installed, a thread inside capture() writes to its own buffer and every other
+    thread still writes to the wrapped stream (used by --batch pool threads).
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.buffers = {}
+
+    def write(self, text):
+        return self.buffers.get(threading.get_ident(), self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    @contextlib.contextmanager
+    def capture(self):
+        """Collect the current thread's prints into a StringIO"""
+        buffer = io.StringIO()
+        self.buffers[threading.get_ident()] = buffer
+        try:
+            yield buffer
+        finally:
+            del self.buffers[threading.get_ident()]
+
+
+class PooledResponse:
+    """HTTP response read from a pooled connection, decompressed and decoded incrementally"""
+
+    def __init__(self, pool, key, connection, response, url):
+        self.pool = pool
+        self.key = key
+        self.connection = connection
+        self.response = response
+        self.url = url
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+
+    def iter_text(self, chunk_size=65536):
+        """Yield decoded text chunks as they arrive from the socket.
+
+        The connection goes back to the pool when the body has been read to the
+        end; stopping early closes it instead.
+        """
+        encoding = (self.headers.get('Content-Encoding') or '').strip().lower()
+        decompressor = None
+        if encoding in ('gzip', 'x-gzip'):
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == 'deflate':
+            decompressor = zlib.decompressobj()
+        decoder = codecs.getincrementaldecoder('utf-8')()
+
+        first_chunk = True
+        try:
+            while True:
+                data = self.response.read(chunk_size)
+                if not data:
+                    break
+                if decompressor is not None:
+                    try:
+                        data = decompressor.decompress(data)
+                    except zlib.error:
+                        if not (first_chunk and encoding == 'deflate'):
+                            raise
+                        # Some servers send raw deflate without the zlib header
+                        decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+                        data = decompressor.decompress(data)
+                first_chunk = False
+                text = decoder.decode(data)
+                if text:
+                    yield text
+
+            tail = decompressor.flush() if decompressor is not None else b''
+            text = decoder.decode(tail, final=True)
+            if text:
+                yield text
+            self.release()
+        finally:
+            self.close()
+
+    def read_text(self):
+        """Read and decode the whole body"""
+        return "".join(self.iter_text())
+
+    def release(self):
+        """Give the connection back to the pool (body must have been fully read)"""
+        if self.connection is not None:
+            if self.response.will_close:
+                self.connection.close()
+            else:
+                self.pool.release(self.key, self.connection)
+            self.connection = None
+
+    def close(self):
+        """Drop the connection unless it was already released"""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections shared across sources, retries and runs"""
+
+    REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+    def __init__(self, ssl_context=None, max_idle_per_host=4, ssl_context_factory=None):
+        # The SSL context is created on the first HTTPS connection when only a factory is given
+        self.ssl_context = ssl_context
+        self.ssl_context_factory = ssl_context_factory
+        self.max_idle_per_host = max_idle_per_host
+        self.idle = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def stale_errors():
+        """Errors that mean an idle keep-alive connection was closed by the server"""
+        return (http_client.RemoteDisconnected, http_client.BadStatusLine,
+                ConnectionResetError, BrokenPipeError)
+
+    def get_ssl_context(self):
+        """SSL context for HTTPS connections, created on first use"""
+        if self.ssl_context is None and self.ssl_context_factory is not None:
+            with self.lock:
+                if self.ssl_context is None:
+                    self.ssl_context = self.ssl_context_factory()
+        return self.ssl_context
+
+    def get_connection(self, key, timeout):
+        """Return (connection, reused) for (scheme, host, port)"""
+        with self.lock:
+            connections = self.idle.get(key)
+            if connections:
+                connection = connections.pop()
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                return connection, True
+        return self.new_connection(key, timeout), False
+
+    def new_connection(self, key, timeout):
+        """Open a new (not yet connected) connection for (scheme, host, port)"""
+        scheme, host, port = key
+        if scheme == 'https':
+            return http_client.HTTPSConnection(host, port, timeout=timeout, context=self.get_ssl_context())
+        return http_client.HTTPConnection(host, port, timeout=timeout)
+
+    def release(self, key, connection):
+        """Keep an idle connection for the next request to the same host"""
+        with self.lock:
+            connections = self.idle.setdefault(key, [])
+            if len(connections) < self.max_idle_per_host:
+                connections.append(connection)
+                return
+        connection.close()
+
+    def close(self):
+        """Close every idle connection"""
+        with self.lock:
+            for connections in self.idle.values():
+                for connection in connections:
+                    connection.close()
+            self.idle = {}
+
+    def urlopen(self, url, headers=None, timeout=None, max_redirects=5):
+        """GET url over a pooled connection, following redirects.
+
+        Returns a PooledResponse; read it to the end (or close it) to give the
+        connection back.
+        """
+        for _ in range(max_redirects + 1):
+            parts = urllib.parse.urlsplit(url)
+            scheme = parts.scheme.lower()
+            port = parts.port or (443 if scheme == 'https' else 80)
+            key = (scheme, parts.hostname, port)
+            path = parts.path or '/'
+            if parts.query:
+                path += '?' + parts.query
+
+            connection, reused = self.get_connection(key, timeout)
+            try:
+                try:
+                    connection.request('GET', path, headers=headers or {})
+                    response = connection.getresponse()
+                except self.stale_errors():
+                    if not reused:
+                        raise
+                    # The server dropped the idle connection - retry once on a fresh one
+                    connection.close()
+                    connection = self.new_connection(key, timeout)
+                    connection.request('GET', path, headers=headers or {})
+                    response = connection.getresponse()
+            except Exception:
+                connection.close()
+                raise
+
+            pooled = PooledResponse(self, key, connection, response, url)
+            location = response.getheader('Location')
+            if response.status in self.REDIRECT_CODES and location:
+                response.read()
+                pooled.release()
+                url = urllib.parse.urljoin(url, location)
+                continue
+            return pooled
+
+        raise http_client.HTTPException(f"Too many redirects for {url}")
+
+
+def to_list(values):
+    """Plain list from a NumPy array or any iterable"""
+    return values.tolist() if hasattr(values, 'tolist') else list(values)
+
+
+class ScoringEngine:
+    """Bolão scoring compiled from the predictions once and applied to any standings.
+
+    Predictions become a players x teams matrix of predicted positions (0 = team
+    not predicted) plus per-player champion and bottom-four picks, so a table is
+    scored with a handful of NumPy array operations. Without NumPy the same
+    compiled data is scored with plain loops. Results match calculate_score and
+    calculate_bonus_points.
+    """
+
+    # Smaller pools are scored with plain loops by default: faster than importing NumPy
+    NUMPY_MIN_PLAYERS = 64
+
+    def __init__(self, predictions, normalize_team_name, min_score=200, max_score=406, use_numpy=None):
+        self.normalize_team_name = normalize_team_name
+        self.min_score = min_score
+        self.max_score = max_score
+        if use_numpy is None:
+            use_numpy = len(predictions) >= self.NUMPY_MIN_PLAYERS
+        self.use_numpy = use_numpy and NUMPY_AVAILABLE
+        self.players = list(predictions.keys())
+        all_predictions = list(predictions.values())
+
+        # Predicted positions by exact team name (first position wins, as in the old scan)
+        # (flattened with chain / map: this runs over every pick of every player)
+        names = list(chain.from_iterable(p.values() for p in all_predictions))
+        keys = list(chain.from_iterable(all_predictions))
+        position_of_key = {key: int(key) for key in set(keys)}
+        self.team_ids = {name: team_id for team_id, name in enumerate(dict.fromkeys(names))}
+
+        if self.use_numpy:
+            player_index = np.repeat(np.arange(len(self.players)), list(map(len, all_predictions)))
+            team_index = np.fromiter(map(self.team_ids.__getitem__, names), dtype=np.int64, count=len(names))
+            # Keys repeat across players: map each one to a small id, then look ids up in arrays
+            distinct_keys = list(position_of_key)
+            key_ids = {key: key_id for key_id, key in enumerate(distinct_keys)}
+            key_index = np.fromiter(map(key_ids.__getitem__, keys), dtype=np.int64, count=len(keys))
+            positions = np.array([position_of_key[key] for key in distinct_keys], dtype=np.int64)[key_index]
+            _, first = np.unique(player_index * max(1, len(self.team_ids)) + team_index, return_index=True)
+            dtype = np.int8 if positions.size == 0 or positions.max() <= 127 else np.int32
+            self.predicted = np.zeros((len(self.players), len(self.team_ids)), dtype=dtype)
+            self.predicted[player_index[first], team_index[first]] = positions[first]
+        else:
+            self.predicted = []
+            for player_predictions in all_predictions:
+                player_positions = {}
+                for key, name in player_predictions.items():
+                    player_positions.setdefault(self.team_ids[name], position_of_key[key])
+                self.predicted.append(player_positions)
+
+        # Champion and bottom-four picks by normalized team name
+        self.bonus_ids = {}
+        bonus_id_by_name = {}
+
+        def bonus_id(team):
+            if not team:
+                return -1
+            if team not in bonus_id_by_name:
+                bonus_id_by_name[team] = self.get_bonus_id(team)
+            return bonus_id_by_name[team]
+
+        if self.use_numpy:
+            # Picked team of each bonus position from the flattened predictions: columns
+            # 0-4 for keys '1', '17'-'20', 5-9 for int keys (p.get('1') or p.get(1))
+            bonus_keys = ['1', '17', '18', '19', '20', 1, 17, 18, 19, 20]
+            key_columns = np.array([bonus_keys.index(key) if key in bonus_keys else -1 for key in distinct_keys],
+                                   dtype=np.int64)[key_index]
+            picked = key_columns >= 0
+            picks = np.full((len(self.players), len(bonus_keys)), -1, dtype=np.int64)
+            picks[player_index[picked], key_columns[picked]] = team_index[picked]
+            team_names = list(self.team_ids)
+            named = np.array([bool(name) for name in team_names] + [False])
+            picks = np.where(named[picks[:, :5]], picks[:, :5], picks[:, 5:])
+            bonus_of_team = np.full(len(team_names) + 1, -1, dtype=np.int32)
+            for team_id in np.unique(picks[picks >= 0]):
+                bonus_of_team[team_id] = bonus_id(team_names[team_id])
+            bonus = bonus_of_team[picks]
+            self.champions = bonus[:, 0].copy()
+            self.bottom_fours = bonus[:, 1:].copy()
+            # The same team picked twice in the bottom four only counts once
+            for column in range(1, 4):
+                repeated = (self.bottom_fours[:, :column] == self.bottom_fours[:, column:column + 1]).any(axis=1)
+                self.bottom_fours[repeated, column] = -1
+        else:
+            self.champions = [bonus_id(p.get('1') or p.get(1)) for p in all_predictions]
+            self.bottom_fours = [[bonus_id(p.get(str(pos)) or p.get(pos)) for pos in range(17, 21)]
+                                 for p in all_predictions]
+            # The same team picked twice in the bottom four only counts once
+            self.bottom_fours = [[team_id if team_id not in bottom[:column] else -1
+                                  for column, team_id in enumerate(bottom)]
+                                 for bottom in self.bottom_fours]
+
+    def player_positions(self, player_index, team_columns):
+        """A player's predicted position for each given team column (0 = not predicted)"""
+        if self.use_numpy:
+            row = self.predicted[player_index]
+            return [int(row[column]) if column >= 0 else 0 for column in team_columns]
+        row = self.predicted[player_index]
+        return [row.get(column, 0) if column >= 0 else 0 for column in team_columns]
+
+    def get_bonus_id(self, team):
+        """Id of a normalized team name for bonus comparisons"""
+        name = self.normalize_team_name(team)
+        return self.bonus_ids.setdefault(name, len(self.bonus_ids))
+
+    def prepare(self, actual_standings):
+        """Team columns, actual positions and champion / bottom-four ids of a table"""
+        team_columns = [self.team_ids.get(self.normalize_team_name(team_data['team']), -1)
+                        for team_data in actual_standings]
+        actual_positions = [int(team_data['position']) for team_data in actual_standings]
+
+        actual_by_position = {}
+        for team_data in actual_standings:
+            try:
+                position = int(team_data.get('position'))
+            except (TypeError, ValueError):
+                continue
+            actual_by_position[position] = self.normalize_team_name(team_data.get('team', ''))
+        actual_first_team = actual_by_position.get(1)
+        actual_first_id = self.bonus_ids.get(actual_first_team, -2) if actual_first_team else -2
+        actual_bottom_four = {actual_by_position.get(pos) for pos in range(17, 21)}
+        actual_bottom_four.discard(None)
+        actual_bottom_ids = [self.bonus_ids[team] for team in actual_bottom_four if team in self.bonus_ids]
+        return team_columns, actual_positions, actual_first_id, actual_bottom_ids
+
+    def score(self, actual_standings):
+        """Score every player against a standings table.
+
+        Returns a dict with 'predicted' and 'team_scores' (one row per standings
+        row, one column per player; predicted position 0 / score -1 when the
+        player didn't predict that team), and per-player 'base', 'bonus', 'raw' and
+        'normalized' scores in self.players order.
+        """
+        if self.use_numpy:
+            return self.score_numpy(*self.prepare(actual_standings))
+        return self.score_python(*self.prepare(actual_standings))
+
+    def update(self, previous, previous_standings, actual_standings, diff):
+        """Rescore after a standings change, touching only the teams that moved.
+
+        previous is the score() result for previous_standings and diff the
+        StandingsDiff between both tables. Base totals change by the score delta
+        of each moved team and the bonuses are only re-evaluated when positions
+        1 or 17-20 changed. Teams added or removed fall back to score().
+        """
+        if diff.structural:
+            return self.score(actual_standings)
+        team_columns, actual_positions, actual_first_id, actual_bottom_ids = self.prepare(actual_standings)
+        known_columns = [column for column in team_columns if column >= 0]
+        if len(set(known_columns)) != len(known_columns):
+            return self.score(actual_standings)
+
+        previous_rows = {team_data['team']: row for row, team_data in enumerate(previous_standings)}
+        order = [previous_rows[team_data['team']] for team_data in actual_standings]
+        moved_teams = {team for team, _, _ in diff.moves}
+        moved_rows = [row for row, team_data in enumerate(actual_standings) if team_data['team'] in moved_teams]
+
+        if self.use_numpy:
+            predicted = previous['predicted'][order]
+            team_scores = previous['team_scores'][order]
+            base = previous['base'].copy()
+            for row in moved_rows:
+                row_predicted = predicted[row]
+                scores = np.where(row_predicted > 0, np.maximum(0, 20 - np.abs(row_predicted - actual_positions[row])), -1)
+                base += np.where(row_predicted > 0, scores - team_scores[row], 0)
+                team_scores[row] = scores
+        else:
+            predicted = [list(previous['predicted'][row]) for row in order]
+            team_scores = [list(previous['team_scores'][row]) for row in order]
+            base = list(previous['base'])
+            for row in moved_rows:
+                for p, predicted_pos in enumerate(predicted[row]):
+                    if predicted_pos:
+                        score = max(0, 20 - abs(predicted_pos - actual_positions[row]))
+                        base[p] += score - team_scores[row][p]
+                        team_scores[row][p] = score
+
+        if diff.bonus_positions_changed:
+            bonus = self.bonus(actual_first_id, actual_bottom_ids)
+        else:
+            bonus = previous['bonus']
+        if self.use_numpy:
+            raw = base + bonus
+        else:
+            raw = [b + extra for b, extra in zip(base, bonus)]
+
+        return {
+            'predicted': predicted,
+            'team_scores': team_scores,
+            'base': base,
+            'bonus': bonus,
+            'raw': raw,
+            'normalized': self.normalize(raw),
+        }
+
+    def bonus(self, actual_first_id, actual_bottom_ids):
+        """Champion and bottom-four bonus of every player"""
+        if self.use_numpy:
+            champion_hits = self.champions == actual_first_id
+            bottom_hits = np.isin(self.bottom_fours, actual_bottom_ids).sum(axis=1) >= 3
+            return 3 * champion_hits.astype(np.int64) + 3 * bottom_hits.astype(np.int64)
+
+        bottom_set = set(actual_bottom_ids)
+        bonus = []
+        for champion, bottom in zip(self.champions, self.bottom_fours):
+            player_bonus = 3 if champion == actual_first_id else 0
+            if sum(1 for team_id in bottom if team_id in bottom_set) >= 3:
+                player_bonus += 3
+            bonus.append(player_bonus)
+        return bonus
+
+    def normalize(self, raw):
+        """Raw totals scaled to 0-100 like normalize_score"""
+        if self.use_numpy:
+            if self.max_score <= self.min_score:
+                return np.zeros_like(raw)
+            return np.clip(np.round((raw - self.min_score) * 100 / (self.max_score - self.min_score)), 0, 100).astype(np.int64)
+
+        normalized = []
+        for raw_score in raw:
+            if self.max_score <= self.min_score:
+                normalized.append(0)
+            else:
+                value = round((raw_score - self.min_score) * 100 / (self.max_score - self.min_score))
+                normalized.append(max(0, min(100, value)))
+        return normalized
+
+    def score_numpy(self, team_columns, actual_positions, actual_first_id, actual_bottom_ids):
+        columns = np.array(team_columns, dtype=np.int64)
+        known = columns >= 0
+        predicted = np.zeros((len(columns), len(self.players)), dtype=np.int16)
+        predicted[known] = self.predicted[:, columns[known]].T
+        actual = np.array(actual_positions, dtype=np.int16)[:, None]
+        team_scores = np.where(predicted > 0, np.maximum(0, 20 - np.abs(predicted - actual)), 0)
+        base = team_scores.sum(axis=0, dtype=np.int64)
+        bonus = self.bonus(actual_first_id, actual_bottom_ids)
+        raw = base + bonus
+
+        return {
+            'predicted': predicted,
+            'team_scores': np.where(predicted > 0, team_scores, -1),
+            'base': base,
+            'bonus': bonus,
+            'raw': raw,
+            'normalized': self.normalize(raw),
+        }
+
+    def score_python(self, team_columns, actual_positions, actual_first_id, actual_bottom_ids):
+        predicted = []
+        team_scores = []
+        base = [0] * len(self.players)
+        for team_id, actual_pos in zip(team_columns, actual_positions):
+            predicted_row = []
+            score_row = []
+            for p, positions in enumerate(self.predicted):
+                predicted_pos = positions.get(team_id, 0)
+                score = max(0, 20 - abs(predicted_pos - actual_pos)) if predicted_pos else -1
+                if predicted_pos:
+                    base[p] += score
+                predicted_row.append(predicted_pos)
+                score_row.append(score)
+            predicted.append(predicted_row)
+            team_scores.append(score_row)
+
+        bonus = self.bonus(actual_first_id, actual_bottom_ids)
+        raw = [b + extra for b, extra in zip(base, bonus)]
+
+        return {
+            'predicted': predicted,
+            'team_scores': team_scores,
+            'base': base,
+            'bonus': bonus,
+            'raw': raw,
+            'normalized': self.normalize(raw),
+        }
+
+
+class FinalTableSearch:
+    """Best and worst bolão score a player can still reach, over every possible final table.
+
+    Each team can finish with any reachable total between its current points and
+    current points + 3 x remaining games (ties can be broken either way). Who
+    plays whom is not known, so the set of final tables is a superset of the
+    real one: the maximum is an upper bound and the minimum a lower bound, which
+    keeps "eliminated" verdicts safe. Final tables are built rank by rank with
+    a depth-first search: each team only goes to ranks it can still reach, a
+    branch is cut when its optimistic bound can't beat the best sibling found,
+    and suffix results are memoized by (teams left, points cap, bottom hits).
+    """
+
+    NEGATIVE = -10 ** 6
+    BOTTOM_RANKS = range(16, 20)  # 0-based ranks of positions 17-20
+
+    def __init__(self, points, remaining, node_budget=50000):
+        self.low = list(points)
+        self.remaining = list(remaining)
+        self.high = [p + 3 * r for p, r in zip(self.low, self.remaining)]
+        self.node_budget = node_budget
+        team_count = len(self.low)
+        # Ranks each team can still finish in (0-based, inclusive)
+        self.rank_range = [
+            (sum(1 for u in range(team_count) if self.low[u] > self.high[t]),
+             team_count - 1 - sum(1 for u in range(team_count) if self.high[u] < self.low[t]))
+            for t in range(team_count)
+        ]
+
+    def highest_total(self, team, cap):
+        """Highest reachable final points of a team not above cap (None if none)"""
+        total = min(cap, self.high[team])
+        # 3r - 1 extra points would need one game more than r (r - 1 wins and 2 draws)
+        if self.remaining[team] and total == self.high[team] - 1:
+            total -= 1
+        return total if total >= self.low[team] else None
+
+    def best(self, values, bonus_ids, champion, bottom_picks, bonus=3):
+        """Highest total of values[team][rank] + bonuses over the possible final tables.
+
+        Returns (score, exact); exact is False when the node budget ran out and the
+        score is only the relaxed bound (each team at its best reachable rank).
+        Call with negated values and bonus for the lowest score.
+        """
+        team_count = len(values)
+        best_from = [[max((values[t][k] for k in range(max(depth, self.rank_range[t][0]), self.rank_range[t][1] + 1)),
+                          default=self.NEGATIVE)
+                      for depth in range(team_count + 1)]
+                     for t in range(team_count)]
+        bottom_picks = set(bottom_picks)
+        bottom_hit = [bonus_ids[t] in bottom_picks for t in range(team_count)]
+        bonus_bound = max(0, bonus)
+        memo = {}
+        nodes = [0]
+
+        def suffix(mask, cap, hits, depth):
+            if not mask:
+                return bonus if hits >= 3 else 0
+            teams = [t for t in range(team_count) if mask >> t & 1]
+            # Caps above every remaining team's best total are all equivalent
+            cap = min(cap, max(self.high[t] for t in teams))
+            key = (mask, cap, hits)
+            if key in memo:
+                return memo[key]
+            nodes[0] += 1
+            if nodes[0] > self.node_budget:
+                raise OverflowError("node budget exhausted")
+
+            lows = sorted((self.low[t] for t in teams), reverse=True)
+            rest_bound = sum(best_from[t][depth + 1] for t in teams)
+            open_bonus = bonus_bound if depth <= self.BOTTOM_RANKS[-1] and team_count >= 20 else 0
+            # Most promising teams first, so later siblings get pruned
+            candidates = sorted(teams, key=lambda t: values[t][depth] - best_from[t][depth + 1], reverse=True)
+            best_value = None
+            for t in candidates:
+                total = self.highest_total(t, cap)
+                if total is None or not self.rank_range[t][0] <= depth <= self.rank_range[t][1]:
+                    continue
+                # Every team placed below has to fit under this total
+                other_low = lows[0] if self.low[t] != lows[0] else lows[1] if len(lows) > 1 else None
+                if other_low is not None and other_low > total:
+                    continue
+                gain = values[t][depth]
+                if depth == 0 and bonus_ids[t] == champion:
+                    gain += bonus
+                if best_value is not None and gain + rest_bound - best_from[t][depth + 1] + open_bonus <= best_value:
+                    continue
+                child_hits = hits + (1 if depth in self.BOTTOM_RANKS and bottom_hit[t] else 0)
+                value = suffix(mask & ~(1 << t), total, child_hits, depth + 1)
+                if value is not None and (best_value is None or gain + value > best_value):
+                    best_value = gain + value
+            memo[key] = best_value
+            return best_value
+
+        try:
+            result = suffix((1 << team_count) - 1, float('inf'), 0, 0)
+            return result, True
+        except OverflowError:
+            # Every team at its best reachable rank, or every rank with its best team
+            by_team = sum(best_from[t][0] for t in range(team_count))
+            by_rank = sum(max(values[t][k] for t in range(team_count)
+                              if self.rank_range[t][0] <= k <= self.rank_range[t][1])
+                          for k in range(team_count))
+            return min(by_team, by_rank) + 2 * bonus_bound, False
+
+
+@dataclass(frozen=True)
+class StandingsDiff:
+    """What changed between two standings tables (falsy when nothing did).
+
+    moves lists (team, old position, new position) for every team whose position
+    changed; structural is set when there is no previous table or teams were
+    added / removed, in which case everything has to be recomputed.
+    """
+
+    moves: tuple = ()
+    points_changed: tuple = ()
+    reordered: bool = False
+    structural: bool = False
+
+    def __bool__(self):
+        return bool(self.structural or self.moves or self.points_changed or self.reordered)
+
+    @property
+    def bonus_positions_changed(self):
+        """True when positions 1 or 17-20 (the bonus positions) changed hands"""
+        bonus_positions = {1, 17, 18, 19, 20}
+        return self.structural or any(int(old) in bonus_positions or int(new) in bonus_positions
+                                      for _, old, new in self.moves)
+
+
+@dataclass(frozen=True)
+class ScoreReport:
+    """Everything one run computes about the scores, shared by every output stage.
+
+    Built once per run by BrasileiroScraper.build_score_report and passed to the
+    console printer, README renderer, history writer and chart generator.
+    predicted / team_scores have one row per standings row and one column per
+    player (predicted position 0 / score -1 when a team wasn't predicted).
+    """
+
+    timestamp: str
+    round: int
+    standings: tuple
+    players: tuple
+    predicted: object
+    team_scores: object
+    bonus: MappingProxyType
+    raw_scores: MappingProxyType
+    normalized_scores: MappingProxyType
+    ranking: tuple
+
+    @classmethod
+    def from_engine_result(cls, standings, players, result, current_round, timestamp):
+        """Wrap a ScoringEngine result (arrays are made read-only)"""
+        for key in ('predicted', 'team_scores'):
+            if hasattr(result[key], 'flags'):
+                result[key].flags.writeable = False
+        raw_scores = dict(zip(players, to_list(result['raw'])))
+        return cls(
+            timestamp=timestamp,
+            round=current_round,
+            standings=tuple(standings),
+            players=tuple(players),
+            predicted=result['predicted'],
+            team_scores=result['team_scores'],
+            bonus=MappingProxyType(dict(zip(players, to_list(result['bonus'])))),
+            raw_scores=MappingProxyType(raw_scores),
+            normalized_scores=MappingProxyType(dict(zip(players, to_list(result['normalized'])))),
+            # Highest raw score first (stable for ties, in predictions order)
+            ranking=tuple(sorted(players, key=lambda player: raw_scores[player], reverse=True)),
+        )
+
+    def row_cells(self, row):
+        """(predicted position, score) for every player on one standings row"""
+        return list(zip(to_list(self.predicted[row]), to_list(self.team_scores[row])))
+
+
+class TeamAliasIndex(dict):
+    """Team alias -> canonical name, with compiled substring lookups.
+
+    Exact lookups work like the plain dict build_team_match_map used to return.
+    On top of that an Aho-Corasick automaton finds the first alias (in insertion
+    order) that occurs inside a text in O(len(text)), and a search over the joined
+    aliases finds the first alias that contains a text. Substring results are
+    memoized, so repeated names cost a dict lookup.
+    """
+
+    SEPARATOR = '\x00'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.compiled = None
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.compiled = None
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.compiled = None
+
+    def compile(self):
+        """Build the automaton and the joined alias string (rebuilt after changes)"""
+        aliases = list(self.items())
+
+        # Aho-Corasick: goto transitions, failure links and matched alias indices per state
+        transitions = [{}]
+        failure = [0]
+        outputs = [[]]
+        for index, (alias, _) in enumerate(aliases):
+            if not alias:
+                continue
+            state = 0
+            for char in alias:
+                next_state = transitions[state].get(char)
+                if next_state is None:
+                    next_state = len(transitions)
+                    transitions[state][char] = next_state
+                    transitions.append({})
+                    failure.append(0)
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(index)
+
+        queue = deque(transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in transitions[state].items():
+                queue.append(next_state)
+                fallback = failure[state]
+                while fallback and char not in transitions[fallback]:
+                    fallback = failure[fallback]
+                failure[next_state] = transitions[fallback].get(char, 0)
+                outputs[next_state] = outputs[next_state] + outputs[failure[next_state]]
+
+        joined = self.SEPARATOR.join(alias for alias, _ in aliases)
+        starts = []
+        offset = 0
+        for alias, _ in aliases:
+            starts.append(offset)
+            offset += len(alias) + len(self.SEPARATOR)
+
+        self.compiled = {
+            'values': [value for _, value in aliases],
+            'transitions': transitions,
+            'failure': failure,
+            'outputs': outputs,
+            'joined': joined,
+            'starts': starts,
+            'contained': {},
+            'containing': {},
+        }
+        return self.compiled
+
+    def first_contained(self, text):
+        """Index of the first alias occurring inside text (None if there is none)"""
+        compiled = self.compiled or self.compile()
+        memo = compiled['contained']
+        if text in memo:
+            return memo[text]
+
+        transitions = compiled['transitions']
+        failure = compiled['failure']
+        outputs = compiled['outputs']
+        best = None
+        state = 0
+        for char in text:
+            while state and char not in transitions[state]:
+                state = failure[state]
+            state = transitions[state].get(char, 0)
+            if outputs[state]:
+                found = min(outputs[state])
+                if best is None or found < best:
+                    best = found
+        memo[text] = best
+        return best
+
+    def first_containing(self, text):
+        """Index of the first alias that contains text (None if there is none)"""
+        compiled = self.compiled or self.compile()
+        memo = compiled['containing']
+        if text in memo:
+            return memo[text]
+
+        best = None
+        if self.SEPARATOR not in text:
+            offset = compiled['joined'].find(text)
+            if offset >= 0:
+                # The first occurrence in the joined string is in the lowest-index alias
+                best = bisect.bisect_right(compiled['starts'], offset) - 1
+        memo[text] = best
+        return best
+
+    def alias_in(self, text):
+        """Canonical name of the first alias occurring inside text"""
+        index = self.first_contained(text)
+        return None if index is None else self.compiled['values'][index]
+
+    def related_alias(self, text):
+        """Canonical name of the first alias that occurs inside text or contains it"""
+        indices = [index for index in (self.first_contained(text), self.first_containing(text)) if index is not None]
+        return self.compiled['values'][min(indices)] if indices else None
+
+
+class SnapshotArchive:
+    """Compressed archive of raw responses keyed by URL and timestamp.
+
+    A zip file with one deflated entry per recorded response; the entry name
+    carries the timestamp and the entry comment the URL.
+    """
+
+    TIMESTAMP_FORMAT = '%Y%m%d-%H%M%S'
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+
+    def record(self, url, body, timestamp=None):
+        """Append a response body for url"""
+        timestamp = timestamp or datetime.now()
+        url_hash = hashlib.sha1(url.encode('utf-8')).hexdigest()[:10]
+        info = zipfile.ZipInfo(f"{timestamp.strftime(self.TIMESTAMP_FORMAT)}-{url_hash}.html",
+                               date_time=timestamp.timetuple()[:6])
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.comment = url.encode('utf-8')
+        with self.lock:
+            with zipfile.ZipFile(self.path, 'a', compression=zipfile.ZIP_DEFLATED) as archive:
+                archive.writestr(info, body.encode('utf-8'))
+
+    def entries(self):
+        """List (url, timestamp, entry name) of every recorded response, oldest first"""
+        if not os.path.exists(self.path):
+            return []
+        with self.lock:
+            with zipfile.ZipFile(self.path) as archive:
+                infos = archive.infolist()
+        entries = []
+        for info in infos:
+            try:
+                timestamp = datetime.strptime(info.filename[:15], self.TIMESTAMP_FORMAT)
+            except ValueError:
+                continue
+            entries.append((info.comment.decode('utf-8'), timestamp, info.filename))
+        entries.sort(key=lambda entry: entry[1])
+        return entries
+
+    def load(self, name):
+        """Body of one recorded response"""
+        with self.lock:
+            with zipfile.ZipFile(self.path) as archive:
+                return archive.read(name).decode('utf-8')
+
+    def latest(self, url):
+        """Most recent recorded body for url (None if it was never recorded)"""
+        names = [name for entry_url, _, name in self.entries() if entry_url == url]
+        return self.load(names[-1]) if names else None
+
+
+class SourceHealth:
+    """Success and latency history of each standings source, persisted between runs.
+
+    Every source attempt is kept as (outcome, latency, rows) over the last WINDOW
+    attempts, with outcome 'ok', 'invalid' (no table or too few teams - the
+    scrapers report failed downloads the same way), 'error' or 'abandoned'
+    (still running when a lower-priority source had already won). rank() puts
+    the sources that usually give a valid table fastest first and skips the
+    ones that keep failing, letting a skipped source through again every
+    PROBE_INTERVAL seconds so it can recover.
+    """
+
+    WINDOW = 20
+    MIN_SAMPLES = 3
+    DEMOTE_SUCCESS_RATE = 0.5
+    PROBE_INTERVAL = 6 * 3600
+
+    def __init__(self, path="source_health.json"):
+        self.path = path
+        self.sources = None
+        self.lock = threading.Lock()
+
+    def load(self):
+        """Source name -> {'samples': [[outcome, latency, rows], ...], 'last_attempt': epoch}"""
+        with self.lock:
+            if self.sources is None:
+                self.sources = {}
+                if self.path and os.path.exists(self.path):
+                    try:
+                        with open(self.path, 'r', encoding='utf-8') as f:
+                            self.sources = json.load(f)
+                    except Exception as e:
+                        print(f"⚠️ Could not read source health: {e}")
+            return self.sources
+
+    def record(self, name, outcome, latency, rows=0):
+        sources = self.load()
+        with self.lock:
+            source = sources.setdefault(name, {'samples': [], 'last_attempt': 0})
+            source['samples'].append([outcome, round(latency, 3), rows])
+            del source['samples'][:-self.WINDOW]
+            source['last_attempt'] = time.time()
+
+    def save(self):
+        if not self.path or self.sources is None:
+            return
+        with self.lock:
+            data = json.dumps(self.sources, ensure_ascii=False)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(temp_path, self.path)
+
+    def stats(self, name):
+        """Success rate, p50 / p95 latency of valid answers, failures and last row count"""
+        source = self.load().get(name) or {'samples': [], 'last_attempt': 0}
+        samples = source['samples']
+        latencies = sorted(latency for outcome, latency, _ in samples if outcome == 'ok')
+
+        def percentile(fraction):
+            if not latencies:
+                return None
+            return latencies[min(len(latencies) - 1, max(0, math.ceil(fraction * len(latencies)) - 1))]
+
+        return {
+            'samples': len(samples),
+            'success_rate': len(latencies) / len(samples) if samples else None,
+            'p50': percentile(0.5),
+            'p95': percentile(0.95),
+            'parse_failures': sum(1 for outcome, _, _ in samples if outcome == 'invalid'),
+            'errors': sum(1 for outcome, _, _ in samples if outcome == 'error'),
+            'abandoned': sum(1 for outcome, _, _ in samples if outcome == 'abandoned'),
+            'rows': next((rows for outcome, _, rows in reversed(samples) if outcome == 'ok'), None),
+            'last_outcome': samples[-1][0] if samples else None,
+            'last_attempt': source['last_attempt'],
+        }
+
+    def is_demoted(self, stats):
+        """Enough recent failures to stop querying a source (a successful probe lifts it)"""
+        return (stats['samples'] >= self.MIN_SAMPLES and stats['success_rate'] < self.DEMOTE_SUCCESS_RATE
+                and stats['last_outcome'] != 'ok')
+
+    def rank(self, names, now=None):
+        """(names to query in order, names skipped) for sources given in default priority order.
+
+        Sources are ordered by success rate (in steps of 10%), then by p50
+        latency in whole seconds, then by the default priority, so small
+        latency differences never reorder them. Sources without history keep
+        their place.
+        """
+        now = time.time() if now is None else now
+        ranked = []
+        probes = []
+        skipped = []
+        for index, name in enumerate(names):
+            stats = self.stats(name)
+            if self.is_demoted(stats):
+                if now - stats['last_attempt'] >= self.PROBE_INTERVAL:
+                    probes.append(name)
+                else:
+                    skipped.append(name)
+                continue
+            if stats['samples'] < self.MIN_SAMPLES:
+                key = (0, 0, index)
+            else:
+                key = (-round(stats['success_rate'], 1), math.ceil(stats['p50'] or 0), index)
+            ranked.append((key, name))
+
+        order = [name for _, name in sorted(ranked)] + probes
+        if not order:
+            # Every source is failing - try them all rather than none
+            return list(names), []
+        return order, skipped
+
+
+class ScoreHistoryStore:
+    """Append-only score history: one JSON entry per line plus a small index.
+
+    The index file maps each round to the offset of its latest entry and keeps
+    the offset of the last entry, so appends never rewrite the history and the
+    "latest entry per round" view reads one line per round. The index is caught
+    up from the log when it is behind (or rebuilt if the log shrank). A
+    read_only store catches up in memory only and never migrates or saves.
+    """
+
+    def __init__(self, path="score_history.jsonl", legacy_path="score_history.json", read_only=False):
+        self.path = path
+        self.index_path = f"{os.path.splitext(path)[0]}.index.json"
+        self.legacy_path = legacy_path
+        self.read_only = read_only
+        self.index = None
+
+    def load_index(self):
+        """Index for the current log, reading only the lines it hasn't seen yet"""
+        if self.index is None:
+            if not self.read_only:
+                self.migrate_legacy()
+            self.index = {'size': 0, 'count': 0, 'last': None, 'rounds': {}}
+            if os.path.exists(self.index_path):
+                try:
+                    with open(self.index_path, 'r', encoding='utf-8') as f:
+                        self.index = json.load(f)
+                except (OSError, json.JSONDecodeError):
+                    pass
+
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        if size < self.index['size']:
+            self.index = {'size': 0, 'count': 0, 'last': None, 'rounds': {}}
+        if size > self.index['size']:
+            with open(self.path, 'rb') as f:
+                f.seek(self.index['size'])
+                offset = self.index['size']
+                for line in f:
+                    if line.endswith(b'\n'):
+                        self.index_entry(offset, line)
+                        offset += len(line)
+                self.index['size'] = offset
+            if not self.read_only:
+                self.save_index()
+        return self.index
+
+    def index_entry(self, offset, line):
+        try:
+            entry = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            print(f"⚠️ {self.path}@{offset}: entrada inválida ignorada")
+            return
+        # Latest timestamp wins for each round, as filter_unique_rounds does
+        round_key = str(entry.get('round', 0))
+        latest = self.index['rounds'].get(round_key)
+        if latest is None or entry.get('timestamp', '') >= latest[1]:
+            self.index['rounds'][round_key] = [offset, entry.get('timestamp', '')]
+        self.index['last'] = offset
+        self.index['count'] += 1
+
+    def save_index(self):
+        temp_path = f"{self.index_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f)
+        os.replace(temp_path, self.index_path)
+
+    def read_at(self, offset):
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+    def encode(self, entry):
+        return (json.dumps(entry, ensure_ascii=False) + '\n').encode('utf-8')
+
+    def append(self, entry):
+        """Add an entry at the end of the log"""
+        index = self.load_index()
+        line = self.encode(entry)
+        with open(self.path, 'ab') as f:
+            f.write(line)
+        self.index_entry(index['size'], line)
+        index['size'] += len(line)
+        self.save_index()
+
+    def replace_last(self, entry):
+        """Overwrite the last entry in place (appends if the line length or round changes)"""
+        index = self.load_index()
+        if index['last'] is None:
+            return self.append(entry)
+        line = self.encode(entry)
+        if (index['last'] + len(line) != index['size']
+                or self.read_at(index['last']).get('round', 0) != entry.get('round', 0)):
+            return self.append(entry)
+        with open(self.path, 'r+b') as f:
+            f.seek(index['last'])
+            f.write(line)
+        round_key = str(entry.get('round', 0))
+        latest = index['rounds'][round_key]
+        if latest[0] == index['last'] or entry.get('timestamp', '') >= latest[1]:
+            index['rounds'][round_key] = [index['last'], entry.get('timestamp', '')]
+        self.save_index()
+
+    def last(self):
+        """Most recent entry (None when the history is empty)"""
+        index = self.load_index()
+        return self.read_at(index['last']) if index['last'] is not None else None
+
+    def latest_per_round(self):
+        """Latest entry of each round, sorted by round"""
+        index = self.load_index()
+        rounds = sorted(index['rounds'].items(), key=lambda item: int(item[0]))
+        if not rounds:
+            return []
+        with open(self.path, 'rb') as f:
+            history = []
+            for _, (offset, _) in rounds:
+                f.seek(offset)
+                history.append(json.loads(f.readline()))
+        return history
+
+    def migrate_legacy(self):
+        """One-shot import of the old score_history.json list (kept as it was)"""
+        if os.path.exists(self.path) or not self.legacy_path or not os.path.exists(self.legacy_path):
+            return
+        try:
+            with open(self.legacy_path, 'r', encoding='utf-8') as f:
+                history = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            print(f"⚠️ {self.legacy_path} inválido ou vazio - histórico não migrado")
+            return
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'wb') as f:
+            for entry in history:
+                f.write(self.encode(entry))
+        os.replace(temp_path, self.path)
+        if os.path.exists(self.index_path):
+            os.remove(self.index_path)
+        print(f"📦 Histórico migrado de {self.legacy_path} para {self.path} ({len(history)} entradas)")
+
+
+class ScoreHistoryColumns:
+    """Score history as columns: a rounds x players matrix per score kind.
+
+    Row i holds the latest entry of rounds[i] (sorted), column j the scores of
+    players[j]; players without a score in a round hold MISSING. On disk the
+    matrices are .npy files opened memory-mapped, plus players.json with the
+    player dictionary. sync() only reads the log lines of rounds whose latest
+    entry changed since the last sync. Without NumPy the same data is kept in
+    plain lists, in memory only.
+
+    Each save writes a new generation of .npy files (named <array>.<gen>.npy)
+    and then points players.json at it, so files that are still memory-mapped
+    are never replaced (Windows refuses to replace or delete a mapped file);
+    older generations are deleted once nothing maps them any more.
+    """
+
+    MISSING = -1
+    FIELDS = ('normalized', 'raw')
+    TIMESTAMP_DTYPE = 'S32'
+
+    def __init__(self, players, rounds, offsets, timestamps, normalized, raw):
+        self.players = list(players)
+        self.rounds = rounds
+        self.offsets = offsets
+        self.timestamps = timestamps
+        self.normalized = normalized
+        self.raw = raw
+
+    def __len__(self):
+        return len(self.rounds)
+
+    @classmethod
+    def from_entries(cls, entries, offsets=None):
+        """Columns for history entries (the latest entry of each round is kept)"""
+        latest = {}
+        for position, entry in enumerate(entries):
+            round_num = entry.get('round', 0)
+            if round_num not in latest or entry.get('timestamp', '') > latest[round_num][1].get('timestamp', ''):
+                latest[round_num] = (position, entry)
+        rows = sorted(latest.items())
+        players = cls.order_players([], [entry for _, (_, entry) in rows], rows[-1][1][1] if rows else None)
+        matrices = {}
+        for field in cls.FIELDS:
+            key = f"{field}_scores"
+            matrices[field] = [[entry.get(key, {}).get(player, cls.MISSING) for player in players]
+                               for _, (_, entry) in rows]
+        rounds = [round_num for round_num, _ in rows]
+        offsets = [offsets[position] if offsets else position for _, (position, _) in rows]
+        timestamps = [entry.get('timestamp', '') for _, (_, entry) in rows]
+        if NUMPY_AVAILABLE:
+            width = len(players)
+            for field in cls.FIELDS:
+                matrices[field] = np.array(matrices[field], dtype=np.int32).reshape(len(rows), width)
+            rounds = np.array(rounds, dtype=np.int64)
+            offsets = np.array(offsets, dtype=np.int64)
+            timestamps = np.array([t.encode('utf-8') for t in timestamps], dtype=cls.TIMESTAMP_DTYPE)
+        return cls(players, rounds, offsets, timestamps, matrices['normalized'], matrices['raw'])
+
+    @staticmethod
+    def order_players(players, entries, latest_entry=None):
+        """Player dictionary: the players of the latest entry first, in its order (ties
+        in the README ranking follow that order), then everyone else as first seen."""
+        seen = list(dict.fromkeys(list(players) + [player for entry in entries
+                                                    for player in entry.get('normalized_scores', {})]))
+        if not latest_entry:
+            return seen
+        first = list(latest_entry.get('normalized_scores', {}))
+        first_set = set(first)
+        return first + [player for player in seen if player not in first_set]
+
+    @classmethod
+    def load(cls, directory):
+        """Memory-mapped columns saved in directory (None if missing or inconsistent)"""
+        try:
+            with open(os.path.join(directory, 'players.json'), 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            players = saved['players']
+            arrays = {name: np.load(cls.array_path(directory, name, saved.get('generation')), mmap_mode='r')
+                      for name in ('rounds', 'offsets', 'timestamps') + cls.FIELDS}
+        except (OSError, ValueError, KeyError, json.JSONDecodeError):
+            return None
+        shape = (len(arrays['rounds']), len(players))
+        if (arrays['offsets'].shape != shape[:1] or arrays['timestamps'].shape != shape[:1]
+                or any(arrays[field].shape != shape for field in cls.FIELDS)):
+            return None
+        return cls(players, arrays['rounds'], arrays['offsets'], arrays['timestamps'],
+                   arrays['normalized'], arrays['raw'])
+
+    @staticmethod
+    def array_path(directory, name, generation=None):
+        """Path of one saved array (files from before generations have none)"""
+        if generation is None:
+            return os.path.join(directory, f"{name}.npy")
+        return os.path.join(directory, f"{name}.{generation}.npy")
+
+    def save(self, directory):
+        """Write a new generation of .npy files, then switch players.json to it"""
+        os.makedirs(directory, exist_ok=True)
+        generation = 1
+        try:
+            with open(os.path.join(directory, 'players.json'), 'r', encoding='utf-8') as f:
+                generation = json.load(f).get('generation', 0) + 1
+        except (OSError, ValueError, AttributeError):
+            pass
+
+        arrays = {'rounds': self.rounds, 'offsets': self.offsets, 'timestamps': self.timestamps,
+                  'normalized': self.normalized, 'raw': self.raw}
+        current_files = set()
+        for name, array in arrays.items():
+            path = self.array_path(directory, name, generation)
+            temp_path = f"{path}.tmp"
+            with open(temp_path, 'wb') as f:
+                np.save(f, np.ascontiguousarray(array))
+            os.replace(temp_path, path)
+            current_files.add(os.path.basename(path))
+        temp_path = os.path.join(directory, 'players.json.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'players': self.players, 'generation': generation}, f, ensure_ascii=False)
+        os.replace(temp_path, os.path.join(directory, 'players.json'))
+
+        # Older generations; one still mapped somewhere is removed by a later save
+        for filename in os.listdir(directory):
+            if filename.endswith('.npy') and filename not in current_files:
+                try:
+                    os.remove(os.path.join(directory, filename))
+                except OSError:
+                    pass
+
+    @classmethod
+    def sync(cls, directory, store, save=True):
+        """Columns matching a ScoreHistoryStore, updating the saved files if it changed
+        (with save=False the updated columns are only kept in memory)"""
+        index = store.load_index()
+        # Rows are identified by round, log offset and timestamp of their entry
+        latest = sorted((int(round_key), offset, timestamp.encode('utf-8'))
+                        for round_key, (offset, timestamp) in index['rounds'].items())
+        if not NUMPY_AVAILABLE:
+            return cls.from_entries(store.latest_per_round())
+
+        current = cls.load(directory)
+        current_keys = []
+        if current is not None:
+            current_keys = list(zip(to_list(current.rounds), to_list(current.offsets), to_list(current.timestamps)))
+        if current is not None and current_keys == latest:
+            return current
+
+        # Rows whose round still points at the same log entry are copied over
+        kept = {key: row for row, key in enumerate(current_keys)}
+        old_players = list(current.players) if current is not None else []
+        new_entries = {key[0]: store.read_at(key[1]) for key in latest if key not in kept}
+        latest_entry = new_entries.get(latest[-1][0]) if latest else None
+        players = cls.order_players(old_players, list(new_entries.values()), latest_entry)
+        player_columns = {player: column for column, player in enumerate(players)}
+
+        matrices = {field: np.full((len(latest), len(players)), cls.MISSING, dtype=np.int32) for field in cls.FIELDS}
+        copies = [(row, kept[key]) for row, key in enumerate(latest) if key in kept]
+        if copies:
+            new_rows, old_rows = (np.array(rows) for rows in zip(*copies))
+            old_columns = np.array([player_columns[player] for player in old_players], dtype=np.int64)
+            for field in cls.FIELDS:
+                matrices[field][np.ix_(new_rows, old_columns)] = getattr(current, field)[old_rows]
+        for row, (round_num, _, _) in enumerate(latest):
+            entry = new_entries.get(round_num)
+            if entry is None:
+                continue
+            for field in cls.FIELDS:
+                for player, score in entry.get(f"{field}_scores", {}).items():
+                    matrices[field][row, player_columns[player]] = score
+
+        columns = cls(players, np.array([key[0] for key in latest], dtype=np.int64),
+                      np.array([key[1] for key in latest], dtype=np.int64),
+                      np.array([key[2] for key in latest], dtype=cls.TIMESTAMP_DTYPE),
+                      matrices['normalized'], matrices['raw'])
+        if not save:
+            return columns
+        columns.save(directory)
+        return cls.load(directory) or columns
+
+    def column(self, player, field='normalized'):
+        """Scores of one player in every round (missing rounds as 0)"""
+        column = self.players.index(player)
+        matrix = getattr(self, field)
+        if NUMPY_AVAILABLE and hasattr(matrix, 'shape'):
+            values = matrix[:, column]
+            return to_list(np.where(values == self.MISSING, 0, values))
+        return [row[column] if row[column] != self.MISSING else 0 for row in matrix]
+
+    def row(self, index, field='normalized'):
+        """player -> score of one round, only for players with a score in it"""
+        values = to_list(getattr(self, field)[index])
+        return {player: score for player, score in zip(self.players, values) if score != self.MISSING}
+
+
+class EmbeddedJSONScanner:
+    """Collect embedded JSON blocks (__NEXT_DATA__, JSON-LD, window globals) from HTML.
+
+    Works on a whole document or on streamed chunks; only the text of the matching
+    <script> blocks is kept, in self.blocks.
+    """
+
+    SCRIPT_START_RE = re.compile(
+        r'<script[^>]*(?:id=["\']__NEXT_DATA__["\']|type=["\']application/(?:ld\+)?json["\'])[^>]*>'
+        r'|<script[^>]*>\s*window(?:\[["\']__\w+__["\']\]|\.__\w+__)\s*=',
+        re.IGNORECASE)
+    SCRIPT_END = '</script>'
+    # Text kept between chunks so a tag split across them is still found
+    CARRY = 256
+
     def __init__(self):
-        # Create SSL context that doesn't verify certificates (for testing)
-        self.ssl_context = ssl.create_default_context()
-        self.ssl_context.check_hostname = False
-        self.ssl_context.verify_mode = ssl.CERT_NONE
-        
+        self.blocks = []
+        self.current = None
+        self.carry = ''
+
+    def feed(self, data):
+        data = self.carry + data
+        self.carry = ''
+        pos = 0
+        while True:
+            if self.current is None:
+                start_match = self.SCRIPT_START_RE.search(data, pos)
+                if not start_match:
+                    self.carry = data[max(pos, len(data) - self.CARRY):]
+                    return
+                self.current = []
+                pos = start_match.end()
+
+            end = data.find(self.SCRIPT_END, pos)
+            if end < 0:
+                keep_from = max(pos, len(data) - len(self.SCRIPT_END))
+                self.current.append(data[pos:keep_from])
+                self.carry = data[keep_from:]
+                return
+
+            self.current.append(data[pos:end])
+            self.blocks.append("".join(self.current))
+            self.current = None
+            pos = end + len(self.SCRIPT_END)
+
+
+class CBFStandingsParser(HTMLParser):
+    """Streaming parser for the 'GRUPO ÚNICO' table of the CBF standings page.
+
+    Feed it chunks of the page as they arrive; feed() returns True once the group
+    table body has closed, so the rest of the response can be skipped. Everything
+    before the group heading is only scanned for the heading, and a chunk is only
+    tokenized up to the </tbody> that closes the table, not to its end. Each
+    row is kept in self.rows as (position, team_name, clean_cells) with the same
+    text cleanup as the regex parser.
+
+    Embedded JSON blocks are collected along the way (self.json_scanner); if the
+    group table has no usable rows the whole page is read so they can be used instead.
+    """
+
+    TEAM_ROW_MARKER = 'styles_teamPosition__CFIvz'
+    GROUP_HEADING_RE = re.compile(r'<h2[^>]*>\s*grupo', re.IGNORECASE)
+    TBODY_END_RE = re.compile(r'</tbody\s*>', re.IGNORECASE)
+    # Enough text to keep between chunks so a heading split across them is still found
+    HEADING_CARRY = 64
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows = []
+        self.done = False
+        self.started = False
+        self.carry = ''
+        self.table_failed = False
+        self.json_scanner = EmbeddedJSONScanner()
+        self.in_heading = False
+        self.heading_text = []
+        self.found_group = False
+        self.in_tbody = False
+        self.row = None
+        self.cell = None
+        self.strong = None
+
+    def feed(self, data):
+        if self.done:
+            return True
+        self.json_scanner.feed(data)
+        if self.table_failed:
+            return False
+        if not self.started:
+            data = self.carry + data
+            heading_match = self.GROUP_HEADING_RE.search(data)
+            if not heading_match:
+                self.carry = data[-self.HEADING_CARRY:]
+                return False
+            self.started = True
+            self.carry = ''
+            data = data[heading_match.start():]
+        # Tokenize up to each </tbody>: once the group table has closed (or turned out
+        # empty) the rest of the chunk is left untouched
+        while data and not (self.done or self.table_failed):
+            tbody_end = self.TBODY_END_RE.search(data)
+            cut = tbody_end.end() if tbody_end else len(data)
+            super().feed(data[:cut])
+            data = data[cut:]
+        return self.done
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if tag == 'br':
+            self.handle_data('\n')
+            return
+
+        if not self.in_tbody:
+            if tag == 'h2':
+                self.in_heading = True
+                self.heading_text = []
+            elif tag == 'tbody' and self.found_group:
+                self.in_tbody = True
+            return
+
+        if tag == 'tr':
+            self.row = {'marker': False, 'position': None, 'team': None, 'cells': []}
+            return
+        if self.row is None:
+            return
+
+        if any(value and self.TEAM_ROW_MARKER in value for _, value in attrs):
+            self.row['marker'] = True
+        if self.cell is not None:
+            self.cell.append(' ')
+        if self.strong is not None:
+            # Nested markup: the regex parser only accepts plain text inside <strong>
+            self.strong['valid'] = False
+
+        if tag == 'td':
+            self.cell = []
+        elif tag == 'strong':
+            css_class = dict(attrs).get('class') or ''
+            kind = None
+            if 'styles_position' in css_class:
+                kind = 'position'
+            elif 'styles_teamName' in css_class:
+                kind = 'team'
+            self.strong = {'kind': kind, 'text': [], 'valid': True} if kind else None
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        if self.done:
+            return
+
+        if not self.in_tbody:
+            if tag == 'h2' and self.in_heading:
+                self.in_heading = False
+                heading = "".join(self.heading_text).strip().upper()
+                if heading == 'GRUPO ÚNICO':
+                    self.found_group = True
+            return
+
+        if tag == 'tbody':
+            if self.rows:
+                self.done = True
+            else:
+                # Markup changed - keep reading for the embedded JSON only
+                self.table_failed = True
+                self.in_tbody = False
+            return
+        if self.row is None:
+            return
+
+        if self.cell is not None:
+            self.cell.append(' ')
+
+        if tag == 'strong' and self.strong is not None:
+            text = "".join(self.strong['text'])
+            if self.strong['valid'] and self.row[self.strong['kind']] is None:
+                if self.strong['kind'] == 'position' and text.strip().isdigit():
+                    self.row['position'] = int(text.strip())
+                elif self.strong['kind'] == 'team' and text:
+                    self.row['team'] = re.sub(r'\s+', ' ', text).strip()
+            self.strong = None
+        elif tag == 'td' and self.cell is not None:
+            self.row['cells'].append(re.sub(r'\s+', ' ', "".join(self.cell)).strip())
+            self.cell = None
+        elif tag == 'tr':
+            if self.row['marker'] and self.row['position'] is not None and self.row['team'] is not None:
+                self.rows.append((self.row['position'], self.row['team'], self.row['cells']))
+            self.row = None
+            self.cell = None
+            self.strong = None
+
+    def handle_data(self, data):
+        if self.done:
+            return
+        if self.in_heading:
+            self.heading_text.append(data)
+        if self.row is None:
+            return
+        if self.TEAM_ROW_MARKER in data:
+            self.row['marker'] = True
+        if self.cell is not None:
+            self.cell.append(data)
+        if self.strong is not None:
+            self.strong['text'].append(data)
+
+
+class BrasileiroScraper:
+    def __init__(self, concurrent_fetch=True, priority_grace=2.0, request_timeout=15.0,
+                 run_deadline=None, max_retries=2, retry_backoff=1.0, hedge_percentile=None,
+                 attempts_file="fetch_attempts.jsonl", http_cache_file="http_cache.json",
+                 record_archive=None, replay_archive=None, simulations=0, workers=1,
+                 elimination_analysis=False, history_file="score_history.jsonl", chart_backend=None,
+                 source_health_file="source_health.json", output_dir=None):
         self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept-Encoding': 'gzip, deflate',
         }
+
+        # Keep-alive connections reused across sources, retries and runs (e.g. in daemon mode);
+        # the SSL context is only created when the first HTTPS connection is opened
+        self.connection_pool = ConnectionPool(ssl_context_factory=self.create_ssl_context)
+
+        # Query all sources at once instead of one after another
+        self.concurrent_fetch = concurrent_fetch
+        # Seconds to keep waiting for a higher-priority source once a lower one succeeded
+        self.priority_grace = priority_grace
+
+        # Network limits: per-request timeout, overall run deadline (seconds, None = no limit),
+        # bounded retries with exponential backoff and optional hedged requests
+        self.request_timeout = request_timeout
+        self.run_deadline = run_deadline
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        # Send a second request if the first one is slower than this latency percentile (e.g. 0.9)
+        self.hedge_percentile = hedge_percentile
+        self.deadline_at = None
+
+        # Every fetch attempt is kept in memory and appended to attempts_file for tuning
+        self.attempts_file = attempts_file
+        self.fetch_attempts = []
+        self.fetch_latencies = None
+        self.attempts_lock = threading.Lock()
+
+        # Conditional-request cache: ETag / Last-Modified and parsed standings per URL
+        # (None disables it)
+        self.http_cache_file = http_cache_file
+        self.http_cache = None
+        self.response_validators = {}
+        self.http_cache_lock = threading.Lock()
+
+        # Per-source success / latency history used to order and skip sources (None = not persisted)
+        self.source_health = SourceHealth(source_health_file)
+
+        # Memoized team name resolution (see TeamAliasIndex)
+        self.name_alias_index = None
+        self.normalized_names = {}
+        self.team_keys = {}
+
+        # (predictions, ScoringEngine) compiled for the last predictions scored
+        self.scoring_engine = None
+        # (engine, standings, result) of the last scored table, for incremental rescoring
+        self.last_score = None
+
+        # Record raw responses to a snapshot archive, or replay them instead of the network
+        self.record_archive = SnapshotArchive(record_archive) if record_archive else None
+        self.replay_archive = SnapshotArchive(replay_archive) if replay_archive else None
+        # Monte Carlo title odds (0 = off) and processes used for them
+        self.simulations = simulations
+        self.workers = workers
+        # Directory of the published files (README.md, last_standings.json, score
+        # history and chart); None = the current directory
+        self.output_dir = output_dir
+        # Append-only score history (migrates score_history.json on first use)
+        history_file = self.output_path(history_file)
+        self.history_store = ScoreHistoryStore(history_file, legacy_path=self.output_path("score_history.json"))
+        self.history_columns_dir = f"{os.path.splitext(history_file)[0]}.columns"
+        # 'png' (matplotlib) or 'svg' (built-in); None picks png when matplotlib is installed
+        self.chart_backend = chart_backend
+        # Reachable score ranges / eliminated players (--bounds)
+        self.elimination_analysis = elimination_analysis
     
+    def output_path(self, filename):
+        """Path of a published file inside output_dir"""
+        return os.path.join(self.output_dir, filename) if self.output_dir else filename
+
+    def prepare_output_dir(self, template_readme="README.md"):
+        """Create output_dir, starting its README.md as a copy of template_readme"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        readme_path = self.output_path("README.md")
+        if not os.path.exists(readme_path) and os.path.exists(template_readme):
+            with open(template_readme, 'r', encoding='utf-8') as f:
+                self.write_text_atomic(readme_path, f.read())
+
+    @staticmethod
+    def create_ssl_context():
+        """SSL context that doesn't verify certificates (for testing).
+
+        Built directly rather than with ssl.create_default_context(), which loads
+        the system CA bundle (tens of milliseconds) only for it to go unused.
+        """
+        ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+        return ssl_context
+
     def load_predictions(self, json_file="bolao.json"):
         """Load player predictions from JSON file"""
         try:
@@ -49,18 +1716,503 @@ class BrasileiroScraper:
             print(f"Error loading predictions: {e}")
             return None
     
-    def fetch_url(self, url):
-        """Fetch URL content"""
+    def iter_pool_predictions(self, pool_file, start=0, end=None):
+        """Stream (player, predictions) records from a JSONL pool file.
+
+        One participant per line, either {"name": ..., "predictions": {...}} or
+        {"Player": {...}} (the bolao.json layout split one player per line).
+        Predictions may also be a list of teams in predicted order. The file is
+        memory-mapped; start/end select the lines that begin in that byte range,
+        so shards of one file can be read independently.
+        """
+        with open(pool_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                end = len(data) if end is None else min(end, len(data))
+                offset = start
+                if start > 0:
+                    # Lines are owned by the shard their first byte falls in
+                    newline = data.find(b'\n', start - 1)
+                    offset = len(data) if newline < 0 else newline + 1
+                while offset < end:
+                    newline = data.find(b'\n', offset)
+                    line_end = len(data) if newline < 0 else newline
+                    line = data[offset:line_end].strip()
+                    line_offset = offset
+                    offset = line_end + 1
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        print(f"⚠️ {pool_file}@{line_offset}: linha inválida ignorada")
+                        continue
+                    if 'predictions' in record:
+                        # Unnamed participants are named by their byte offset in the file
+                        items = [(record.get('name') or f"#{line_offset}", record['predictions'])]
+                    else:
+                        items = record.items()
+                    for player, player_predictions in items:
+                        if isinstance(player_predictions, list):
+                            player_predictions = {str(pos): team for pos, team in enumerate(player_predictions, 1)}
+                        yield player, player_predictions
+
+    def iter_pool_batches(self, records, batch_size=10000):
+        """Group streamed records into predictions dicts of at most batch_size players"""
+        batch = {}
+        for player, player_predictions in records:
+            # Duplicate names would collide in the dict - keep both entries
+            if player in batch:
+                player = f"{player} ({len(batch)})"
+            batch[player] = player_predictions
+            if len(batch) >= batch_size:
+                yield batch
+                batch = {}
+        if batch:
+            yield batch
+
+    def close(self):
+        """Close pooled connections"""
+        self.connection_pool.close()
+
+    def start_run(self):
+        """Start the overall run deadline clock"""
+        if self.run_deadline:
+            self.deadline_at = time.monotonic() + self.run_deadline
+        else:
+            self.deadline_at = None
+
+    def remaining_run_time(self):
+        """Seconds left before the run deadline (None if there is no deadline)"""
+        if self.deadline_at is None:
+            return None
+        return self.deadline_at - time.monotonic()
+
+    def fetch_url(self, url, extra_headers=None, stream_parser=None):
+        """Fetch URL content with timeout, bounded retries and optional hedging.
+
+        Returns NOT_MODIFIED if extra_headers made the request conditional and the
+        server answered 304. If stream_parser (a parser class such as
+        CBFStandingsParser) is given, the body is fed to a new instance chunk by
+        chunk and that parser is returned instead of the text.
+        """
+        if self.replay_archive is not None:
+            return self.replay_url(url, stream_parser)
+
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                backoff = self.retry_backoff * (2 ** (attempt - 1))
+                remaining = self.remaining_run_time()
+                if remaining is not None:
+                    backoff = min(backoff, max(0, remaining))
+                time.sleep(backoff)
+
+            remaining = self.remaining_run_time()
+            if remaining is not None and remaining <= 0:
+                print(f"Error fetching {url}: run deadline exceeded")
+                self.record_fetch_attempt(url, attempt, "deadline", 0.0)
+                return None
+
+            content, retryable = self.fetch_with_hedge(url, attempt, extra_headers, stream_parser)
+            if content is not None:
+                return content
+            if not retryable:
+                break
+
+        return None
+
+    def fetch_with_hedge(self, url, attempt, extra_headers=None, stream_parser=None):
+        """Run one attempt, sending a hedged duplicate if the first is unusually slow"""
+        hedge_delay = self.get_hedge_delay(url)
+        if hedge_delay is None:
+            return self.fetch_once(url, attempt, False, extra_headers, stream_parser)
+
+        primary = submit_daemon(self.fetch_once, url, attempt, False, extra_headers, stream_parser)
+        done, _ = wait([primary], timeout=hedge_delay)
+        if done:
+            return primary.result()
+
+        print(f"Hedging request to {url} (no answer after {hedge_delay:.2f}s)")
+        pending = {primary, submit_daemon(self.fetch_once, url, attempt, True, extra_headers, stream_parser)}
+        retryable = False
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                content, future_retryable = future.result()
+                if content is not None:
+                    return content, False
+                retryable = retryable or future_retryable
+        return None, retryable
+
+    def fetch_once(self, url, attempt, hedged=False, extra_headers=None, stream_parser=None):
+        """Single HTTP request; returns (content, retryable)"""
+        timeout = self.request_timeout
+        remaining = self.remaining_run_time()
+        if remaining is not None:
+            timeout = max(0.1, min(timeout, remaining))
+
+        start = time.monotonic()
         try:
-            req = urllib.request.Request(url, headers=self.headers)
-            with urllib.request.urlopen(req, context=self.ssl_context) as response:
-                return response.read().decode('utf-8')
+            headers = dict(self.headers)
+            if extra_headers:
+                headers.update(extra_headers)
+            response = self.connection_pool.urlopen(url, headers, timeout)
+            try:
+                if response.status == 304:
+                    response.read_text()  # empty body; keeps the connection reusable
+                    raise urllib_error.HTTPError(url, 304, response.reason, response.headers, None)
+                if response.status >= 400:
+                    raise urllib_error.HTTPError(url, response.status, response.reason, response.headers, None)
+                if self.record_archive is not None:
+                    # The whole page is needed for the archive, so no early stop here
+                    content = response.read_text()
+                    self.record_archive.record(url, content)
+                    if stream_parser is not None:
+                        content = self.run_stream_parser(stream_parser, self.iter_chunks(content))
+                elif stream_parser is not None:
+                    # Stop reading as soon as the parser has what it needs
+                    content = self.run_stream_parser(stream_parser, response.iter_text())
+                else:
+                    content = response.read_text()
+                validators = {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                }
+            finally:
+                response.close()
+            with self.http_cache_lock:
+                self.response_validators[url] = validators
+            self.record_fetch_attempt(url, attempt, "ok", time.monotonic() - start, hedged)
+            return content, False
+        except urllib_error.HTTPError as e:
+            if e.code == 304:
+                self.record_fetch_attempt(url, attempt, "not modified", time.monotonic() - start, hedged)
+                return NOT_MODIFIED, False
+            print(f"Error fetching {url}: {e}")
+            self.record_fetch_attempt(url, attempt, f"http {e.code}", time.monotonic() - start, hedged)
+            # Client errors won't get better by asking again (except rate limiting)
+            return None, e.code >= 500 or e.code == 429
         except Exception as e:
             print(f"Error fetching {url}: {e}")
+            outcome = "timeout" if "timed out" in str(e) else "error"
+            self.record_fetch_attempt(url, attempt, outcome, time.monotonic() - start, hedged)
+            return None, True
+
+    def replay_url(self, url, stream_parser=None):
+        """Serve url from the replay archive instead of the network"""
+        content = self.replay_archive.latest(url)
+        if content is None:
+            print(f"Error fetching {url}: not in replay archive {self.replay_archive.path}")
             return None
-    
+        if stream_parser is not None:
+            return self.run_stream_parser(stream_parser, self.iter_chunks(content))
+        return content
+
+    def iter_chunks(self, text, chunk_size=65536):
+        """Split text into chunks, as they would arrive from the socket"""
+        for start in range(0, len(text), chunk_size):
+            yield text[start:start + chunk_size]
+
+    def run_stream_parser(self, stream_parser, chunks):
+        """Feed chunks to a new stream parser until it reports it is done"""
+        parser = stream_parser()
+        for chunk in chunks:
+            if parser.feed(chunk):
+                break
+        return parser
+
+    # The attempts log is cut back to its last ATTEMPTS_TAIL_BYTES once it grows past
+    # ATTEMPTS_MAX_BYTES; latencies are only read from that tail (~1500 attempts)
+    ATTEMPTS_MAX_BYTES = 1024 * 1024
+    ATTEMPTS_TAIL_BYTES = 256 * 1024
+
+    def record_fetch_attempt(self, url, attempt, outcome, latency, hedged=False):
+        """Keep the outcome and latency of a fetch attempt and append it to the attempts log"""
+        entry = {
+            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'url': url,
+            'attempt': attempt,
+            'hedged': hedged,
+            'outcome': outcome,
+            'latency': round(latency, 3),
+        }
+        with self.attempts_lock:
+            self.fetch_attempts.append(entry)
+            if outcome == "ok" and self.fetch_latencies is not None:
+                self.fetch_latencies.setdefault(url, []).append(entry['latency'])
+            if self.attempts_file:
+                try:
+                    with open(self.attempts_file, 'a', encoding='utf-8') as f:
+                        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                        size = f.tell()
+                    if size > self.ATTEMPTS_MAX_BYTES:
+                        self.write_text_atomic(self.attempts_file, "".join(
+                            line + "\n" for line in self.read_attempts_tail()))
+                except Exception as e:
+                    print(f"⚠️ Could not record fetch attempt: {e}")
+
+    def read_attempts_tail(self):
+        """Complete lines in the last ATTEMPTS_TAIL_BYTES of the attempts log"""
+        with open(self.attempts_file, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            start = max(0, f.tell() - self.ATTEMPTS_TAIL_BYTES)
+            f.seek(start)
+            data = f.read()
+        lines = data.decode('utf-8', errors='replace').split("\n")
+        # The first line is cut unless the tail starts at the beginning of the file
+        if start > 0:
+            lines = lines[1:]
+        return [line for line in lines if line]
+
+    def load_fetch_latencies(self, max_samples=100):
+        """Load recent successful latencies per URL from the tail of the attempts log"""
+        latencies = {}
+        if self.attempts_file and os.path.exists(self.attempts_file):
+            try:
+                for line in self.read_attempts_tail():
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if entry.get('outcome') == "ok":
+                        samples = latencies.setdefault(entry.get('url'), [])
+                        samples.append(entry.get('latency', 0))
+                        if len(samples) > max_samples:
+                            del samples[0]
+            except Exception as e:
+                print(f"⚠️ Could not read fetch attempts: {e}")
+        return latencies
+
+    def get_hedge_delay(self, url, min_samples=5):
+        """Latency percentile after which a hedged request is sent (None = don't hedge)"""
+        if not self.hedge_percentile:
+            return None
+
+        with self.attempts_lock:
+            if self.fetch_latencies is None:
+                self.fetch_latencies = self.load_fetch_latencies()
+            samples = sorted(self.fetch_latencies.get(url, []))
+
+        if len(samples) < min_samples:
+            return None
+
+        index = min(len(samples) - 1, max(0, math.ceil(self.hedge_percentile * len(samples)) - 1))
+        return min(samples[index], self.request_timeout)
+
+    def get_match_map_key(self, team_match_map):
+        """Hash of the team match map, since parsed standings depend on it"""
+        data = json.dumps(sorted((team_match_map or {}).items()), ensure_ascii=False)
+        return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+    def load_http_cache(self):
+        """Load cached validators and parsed standings per URL"""
+        with self.http_cache_lock:
+            if self.http_cache is None:
+                self.http_cache = {}
+                if self.http_cache_file and os.path.exists(self.http_cache_file):
+                    try:
+                        with open(self.http_cache_file, 'r', encoding='utf-8') as f:
+                            self.http_cache = json.load(f)
+                    except Exception as e:
+                        print(f"⚠️ Could not read HTTP cache: {e}")
+            return self.http_cache
+
+    def update_http_cache(self, url, standings, match_key):
+        """Store the validators of the last response for url with its parsed standings"""
+        cache = self.load_http_cache()
+        with self.http_cache_lock:
+            validators = self.response_validators.pop(url, None) or {}
+            if not standings or not (validators.get('etag') or validators.get('last_modified')):
+                # Nothing to revalidate later
+                if cache.pop(url, None) is None:
+                    return
+            else:
+                cache[url] = {
+                    'etag': validators.get('etag'),
+                    'last_modified': validators.get('last_modified'),
+                    'match_key': match_key,
+                    'standings': standings,
+                }
+            try:
+                self.write_text_atomic(self.http_cache_file, json.dumps(cache, ensure_ascii=False))
+            except Exception as e:
+                print(f"⚠️ Could not save HTTP cache: {e}")
+
+    def fetch_standings(self, url, parser, team_match_map=None, stream_parser=None):
+        """Fetch a standings page and parse it, revalidating against the HTTP cache.
+
+        If the cached copy of url is still valid (304 Not Modified) the cached
+        parsed standings are returned without downloading or parsing the page.
+        With stream_parser, parser receives the fed stream parser instead of the text.
+        """
+        if not self.http_cache_file:
+            return parser(self.fetch_url(url, stream_parser=stream_parser), team_match_map)
+
+        match_key = self.get_match_map_key(team_match_map)
+        entry = self.load_http_cache().get(url)
+        conditional_headers = {}
+        if entry and entry.get('match_key') == match_key and entry.get('standings'):
+            if entry.get('etag'):
+                conditional_headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                conditional_headers['If-Modified-Since'] = entry['last_modified']
+
+        html_content = self.fetch_url(url, conditional_headers or None, stream_parser)
+        if html_content is NOT_MODIFIED:
+            print(f"♻️ {url} not modified - reusing cached standings")
+            return entry['standings']
+
+        standings = parser(html_content, team_match_map)
+        self.update_http_cache(url, standings, match_key)
+        return standings
+
     def parse_cbf_standings_html(self, html_content, team_match_map=None):
-        """Parse standings rows from the CBF table using the actual HTML structure."""
+        """Parse standings rows from a whole CBF page (embedded JSON, then the group table).
+
+        The page is already in memory, so the table is read by the regex parser,
+        which is faster on a whole document; CBFStandingsParser is for pages read
+        from the socket (see parse_cbf_standings_stream).
+        """
+        if not html_content:
+            return None
+
+        teams = self.parse_embedded_json_standings(html_content, team_match_map)
+        if teams:
+            return teams
+
+        return self.parse_cbf_standings_regex(html_content, team_match_map)
+
+    def parse_cbf_standings_stream(self, parser, team_match_map=None):
+        """Build standings from a CBFStandingsParser fed straight from the socket"""
+        if not parser:
+            return None
+        teams = self.build_cbf_standings(parser.rows, team_match_map)
+        if teams:
+            return teams
+        return self.standings_from_json_blocks(parser.json_scanner.blocks, team_match_map)
+
+    def parse_embedded_json_standings(self, html_content, team_match_map=None):
+        """Extract standings from JSON embedded in the page (__NEXT_DATA__, JSON-LD, ...)"""
+        if not html_content:
+            return None
+        scanner = EmbeddedJSONScanner()
+        scanner.feed(html_content)
+        return self.standings_from_json_blocks(scanner.blocks, team_match_map)
+
+    def standings_from_json_blocks(self, blocks, team_match_map=None):
+        """Decode embedded JSON blocks and return the first standings table found in them"""
+        decoder = json.JSONDecoder()
+        for block in blocks:
+            block = block.strip()
+            if not block.startswith(('{', '[')):
+                continue
+            try:
+                data, _ = decoder.raw_decode(block)
+            except ValueError:
+                continue
+            teams = self.find_json_standings(data, team_match_map)
+            if teams:
+                return teams
+        return None
+
+    # Field names used for standings rows by the sites' embedded data (lower case)
+    JSON_POSITION_KEYS = ('posicao', 'position', 'pos', 'rank', 'colocacao', 'ordem')
+    JSON_POINTS_KEYS = ('pontos', 'points', 'pts', 'pontos_ganhos')
+    JSON_GAMES_KEYS = ('jogos', 'partidas', 'games', 'gamesplayed', 'played', 'jogos_disputados', 'pj')
+    JSON_TEAM_KEYS = ('equipe', 'team', 'clube', 'nome_popular', 'nome', 'displayname', 'name', 'time')
+
+    def find_json_standings(self, data, team_match_map=None):
+        """Find a list of ~20 standings-like objects anywhere in decoded JSON"""
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                stack.extend(value for value in node.values() if isinstance(value, (dict, list)))
+                continue
+            if not isinstance(node, list):
+                continue
+
+            if 15 <= len(node) <= 24 and all(isinstance(item, dict) for item in node):
+                teams = self.json_rows_to_standings(node, team_match_map)
+                if teams:
+                    return teams
+            stack.extend(item for item in node if isinstance(item, (dict, list)))
+        return None
+
+    def json_rows_to_standings(self, items, team_match_map=None):
+        """Convert standings-like JSON objects into standings rows, or None if they aren't"""
+        teams = []
+        known_teams = 0
+        for item in items:
+            fields = {str(key).lower(): value for key, value in item.items()}
+            # ESPN style: "stats": [{"name": "points", "value": 42}, ...]
+            stats = fields.get('stats')
+            if isinstance(stats, list):
+                for stat in stats:
+                    if isinstance(stat, dict) and stat.get('name') is not None:
+                        fields.setdefault(str(stat['name']).lower(), stat.get('value', stat.get('displayValue')))
+
+            position = self.json_int(fields, self.JSON_POSITION_KEYS)
+            points = self.json_int(fields, self.JSON_POINTS_KEYS)
+            games = self.json_int(fields, self.JSON_GAMES_KEYS)
+            team_name = self.json_team_name(fields)
+            if position is None or points is None or games is None or not team_name:
+                return None
+            if not (1 <= position <= 24 and 0 <= points <= 114 and 0 <= games <= 38):
+                return None
+
+            team_name = re.sub(r'\s+', ' ', team_name).strip()
+            if team_match_map:
+                team_key = self.normalize_team_key(team_name)
+                if team_key in team_match_map:
+                    team_name = team_match_map[team_key]
+                    known_teams += 1
+
+            teams.append({
+                'position': position,
+                'team': self.normalize_team_name(team_name),
+                'points': str(points),
+                'games': str(games)
+            })
+
+        # Guard against other lists of ~20 objects (players, matches...)
+        if team_match_map and known_teams < 15:
+            return None
+        if len({team['position'] for team in teams}) != len(teams):
+            return None
+
+        teams.sort(key=lambda team: team['position'])
+        return teams[:20]
+
+    def json_int(self, fields, keys):
+        """First integer value among keys"""
+        for key in keys:
+            value = fields.get(key)
+            if isinstance(value, bool):
+                continue
+            if isinstance(value, (int, float)) and value == int(value):
+                return int(value)
+            if isinstance(value, str) and value.strip().isdigit():
+                return int(value.strip())
+        return None
+
+    def json_team_name(self, fields):
+        """Team name from a row's own fields or from a nested team object"""
+        for key in self.JSON_TEAM_KEYS:
+            value = fields.get(key)
+            if isinstance(value, str) and len(value.strip()) > 2:
+                return value
+            if isinstance(value, dict):
+                nested = {str(k).lower(): v for k, v in value.items()}
+                for nested_key in ('nome_popular', 'nome', 'shortdisplayname', 'displayname', 'name'):
+                    nested_value = nested.get(nested_key)
+                    if isinstance(nested_value, str) and len(nested_value.strip()) > 2:
+                        return nested_value
+        return None
+
+    def parse_cbf_standings_regex(self, html_content, team_match_map=None):
+        """Regex-based CBF parser for a whole document"""
         if not html_content:
             return None
 
@@ -74,7 +2226,7 @@ class BrasileiroScraper:
         tbody = section_match.group(1)
         rows = re.findall(r'<tr[^>]*>(.*?)</tr>', tbody, re.IGNORECASE | re.DOTALL)
 
-        teams = []
+        parsed_rows = []
         for row in rows:
             if 'styles_teamPosition__CFIvz' not in row:
                 continue
@@ -89,13 +2241,6 @@ class BrasileiroScraper:
                 continue
 
             team_name = re.sub(r'\s+', ' ', team_name_match.group(1)).strip()
-            if not team_name or len(team_name) <= 2:
-                continue
-
-            if team_match_map:
-                team_key = self.normalize_team_key(team_name)
-                if team_key in team_match_map:
-                    team_name = team_match_map[team_key]
 
             cells = re.findall(r'<td[^>]*>(.*?)</td>', row, re.IGNORECASE | re.DOTALL)
             clean_cells = []
@@ -104,6 +2249,22 @@ class BrasileiroScraper:
                 clean_text = re.sub(r'\s+', ' ', clean_text).strip()
                 clean_cells.append(clean_text)
 
+            parsed_rows.append((position, team_name, clean_cells))
+
+        return self.build_cbf_standings(parsed_rows, team_match_map)
+
+    def build_cbf_standings(self, rows, team_match_map=None):
+        """Turn (position, team_name, clean_cells) rows from the CBF table into standings"""
+        teams = []
+        for position, team_name, clean_cells in rows:
+            if not team_name or len(team_name) <= 2:
+                continue
+
+            if team_match_map:
+                team_key = self.normalize_team_key(team_name)
+                if team_key in team_match_map:
+                    team_name = team_match_map[team_key]
+
             points = None
             games = None
             for cell in clean_cells[1:3]:
@@ -135,22 +2296,23 @@ class BrasileiroScraper:
         url = "https://www.cbf.com.br/futebol-brasileiro/tabelas/campeonato-brasileiro/serie-a/2026"
         
         print("Fetching standings from CBF official website...")
-        html_content = self.fetch_url(url)
-        
-        if not html_content:
-            return None
-
-        return self.parse_cbf_standings_html(html_content, team_match_map)
+        return self.fetch_standings(url, self.parse_cbf_standings_stream, team_match_map, CBFStandingsParser)
 
     def scrape_espn_standings(self, team_match_map=None):
         """Scrape standings from ESPN Brazil"""
         url = "https://www.espn.com.br/futebol/liga/_/nome/bra.1"
         
         print("Fetching standings from ESPN Brazil...")
-        html_content = self.fetch_url(url)
-        
+        return self.fetch_standings(url, self.parse_espn_standings_html, team_match_map)
+
+    def parse_espn_standings_html(self, html_content, team_match_map=None):
+        """Parse standings rows from the ESPN Brazil page."""
         if not html_content:
             return None
+
+        teams = self.parse_embedded_json_standings(html_content, team_match_map)
+        if teams:
+            return teams
         
         # Parse the HTML to extract standings
         teams = []
@@ -217,12 +2379,15 @@ class BrasileiroScraper:
         url = "https://www.gazetaesportiva.com/campeonatos/brasileiro-serie-a/"
         
         print("Fetching standings from Gazeta Esportiva...")
-        html_content = self.fetch_url(url)
-        
+        return self.fetch_standings(url, self.parse_gazeta_standings_html, team_match_map)
+
+    def parse_gazeta_standings_html(self, html_content, team_match_map=None):
+        """Parse standings rows from the Gazeta Esportiva table."""
         if not html_content:
             return None
         
         teams = []
+        alias_index = self.get_alias_index(team_match_map)
         
         # Encontrar a tabela principal
         table_match = re.search(r'<table[^>]*>.*?</table>', html_content, re.DOTALL)
@@ -254,11 +2419,7 @@ class BrasileiroScraper:
                     team_name = None
                     if team_match_map:
                         for cell in clean_cells:
-                            cell_key = self.normalize_team_key(cell)
-                            for team_key, canonical in team_match_map.items():
-                                if team_key and team_key in cell_key:
-                                    team_name = canonical
-                                    break
+                            team_name = alias_index.alias_in(self.normalize_team_key(cell))
                             if team_name:
                                 break
                     else:
@@ -309,11 +2470,17 @@ class BrasileiroScraper:
         url = "https://ge.globo.com/futebol/brasileirao-serie-a/"
 
         print("Fetching standings from Globo Esporte...")
-        html_content = self.fetch_url(url)
+        return self.fetch_standings(url, self.parse_ge_standings_html, team_match_map)
 
+    def parse_ge_standings_html(self, html_content, team_match_map=None):
+        """Parse standings rows from the Globo Esporte page."""
         if not html_content:
             return None
 
+        teams = self.parse_embedded_json_standings(html_content, team_match_map)
+        if teams:
+            return teams
+
         teams = []
         rows = re.findall(r'<tr[^>]*>.*?</tr>', html_content, re.DOTALL | re.IGNORECASE)
 
@@ -393,72 +2560,227 @@ class BrasileiroScraper:
             ("Gazeta Esportiva", lambda: self.scrape_gazeta_standings(team_match_map)),
             ("Globo Esporte", lambda: self.scrape_ge_standings(team_match_map)),
         ]
-        
-        for source_name, scraper_func in sources:
-            try:
-                standings = scraper_func()
-                if standings and len(standings) >= 15:  # At least 15 teams found
-                    print(f"✅ Successfully scraped {len(standings)} teams from {source_name}")
+        sources, source_run = self.rank_sources(sources)
+
+        try:
+            if self.concurrent_fetch:
+                standings = self.get_standings_concurrently(sources)
+                if standings:
                     return standings
-                else:
-                    print(f"❌ {source_name}: Insufficient data ({len(standings) if standings else 0} teams)")
+            else:
+                for source_name, scraper_func in sources:
+                    try:
+                        standings = scraper_func()
+                        if self.is_valid_standings(standings):
+                            print(f"✅ Successfully scraped {len(standings)} teams from {source_name}")
+                            return standings
+                        else:
+                            print(f"❌ {source_name}: Insufficient data ({len(standings) if standings else 0} teams)")
+                    except Exception as e:
+                        print(f"❌ {source_name}: Error - {e}")
+        finally:
+            try:
+                self.finish_source_run(source_run)
+                self.source_health.save()
             except Exception as e:
-                print(f"❌ {source_name}: Error - {e}")
+                print(f"⚠️ Could not save source health: {e}")
         
         # No fallback - if scraping fails, return None
         print("❌ All scraping sources failed")
         return None
+
+    def rank_sources(self, sources):
+        """Order (name, scraper) sources by their recorded health, dropping demoted ones.
+
+        Each scraper is wrapped to record its outcome, latency and row count in
+        SourceHealth. Returns the wrapped sources and the state of this run for
+        finish_source_run.
+        """
+        by_name = dict(sources)
+        order, skipped = self.source_health.rank([name for name, _ in sources])
+        if order != [name for name, _ in sources] or skipped:
+            note = f" (skipping {', '.join(skipped)})" if skipped else ""
+            print(f"🩺 Source order by health: {', '.join(order)}{note}")
+
+        source_run = {'order': order, 'started': {}, 'outcomes': {}, 'finished': False, 'lock': threading.Lock()}
+
+        def record(name, outcome, start, rows=0):
+            with source_run['lock']:
+                if source_run['finished']:
+                    return  # already recorded as abandoned
+                source_run['outcomes'][name] = outcome
+            self.source_health.record(name, outcome, time.perf_counter() - start, rows)
+
+        def tracked(name, scraper_func):
+            def run():
+                start = time.perf_counter()
+                with source_run['lock']:
+                    source_run['started'][name] = start
+                try:
+                    standings = scraper_func()
+                except Exception:
+                    record(name, 'error', start)
+                    raise
+                record(name, 'ok' if self.is_valid_standings(standings) else 'invalid', start, len(standings or []))
+                return standings
+            return run
+
+        return [(name, tracked(name, by_name[name])) for name in order], source_run
+
+    def finish_source_run(self, source_run):
+        """Record the sources still running when get_current_standings returns.
+
+        A source ranked before the winner that hasn't answered yet is recorded
+        as 'abandoned' (too slow to matter), so a stalled source gets demoted
+        even though the process exits before it finishes. Lower-ranked sources
+        lost the race through no fault of their own and are left out.
+        """
+        with source_run['lock']:
+            source_run['finished'] = True
+            outcomes = dict(source_run['outcomes'])
+            started = dict(source_run['started'])
+        now = time.perf_counter()
+        for name in source_run['order']:
+            if outcomes.get(name) == 'ok':
+                break
+            if name in started and name not in outcomes:
+                self.source_health.record(name, 'abandoned', now - started[name])
+
+    def print_source_health(self):
+        """Print the recorded health of every source (--source-health)"""
+        names = ["CBF Official", "ESPN Brazil", "Gazeta Esportiva", "Globo Esporte"]
+        order, skipped = self.source_health.rank(names)
+        print(f"{'Source':<18} {'N':>3} {'OK':>5} {'p50':>6} {'p95':>6} {'Parse':>5} {'Err':>4} {'Slow':>4} {'Rows':>4}  Status")
+        print("-" * 77)
+        for name in order + skipped:
+            stats = self.source_health.stats(name)
+            rate = f"{stats['success_rate']:.0%}" if stats['success_rate'] is not None else "-"
+            p50 = f"{stats['p50']:.2f}" if stats['p50'] is not None else "-"
+            p95 = f"{stats['p95']:.2f}" if stats['p95'] is not None else "-"
+            if name in skipped:
+                status = "⛔ ignorada"
+            elif self.source_health.is_demoted(stats):
+                status = "🔎 sondagem"
+            else:
+                status = "✅"
+            print(f"{name:<18} {stats['samples']:>3} {rate:>5} {p50:>6} {p95:>6} {stats['parse_failures']:>5} "
+                  f"{stats['errors']:>4} {stats['abandoned']:>4} {stats['rows'] if stats['rows'] is not None else '-':>4}  {status}")
+
+    def is_valid_standings(self, standings):
+        """Check if a scraped table has enough teams to be trusted"""
+        return bool(standings) and len(standings) >= 15  # At least 15 teams found
+
+    def get_standings_concurrently(self, sources):
+        """Start every source at once and return the first valid result in priority order.
+
+        A valid result is returned as soon as every higher-priority source has
+        finished (or failed). If a higher-priority source is still running, it gets
+        ``priority_grace`` seconds to answer before the best result so far wins.
+        Remaining requests run on daemon threads and are simply ignored.
+        """
+        # Daemon threads: sources still running when the winner is picked don't delay the exit
+        futures = {submit_daemon(scraper_func): index for index, (_, scraper_func) in enumerate(sources)}
+        results = {}
+        pending = set(futures)
+        deadline = None
+
+        while pending:
+            timeout = None if deadline is None else max(0, deadline - time.monotonic())
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                index = futures[future]
+                source_name = sources[index][0]
+                try:
+                    standings = future.result()
+                except Exception as e:
+                    print(f"❌ {source_name}: Error - {e}")
+                    results[index] = None
+                    continue
+                if not self.is_valid_standings(standings):
+                    print(f"❌ {source_name}: Insufficient data ({len(standings) if standings else 0} teams)")
+                    standings = None
+                results[index] = standings
+
+            valid = [index for index, standings in results.items() if standings]
+            if not valid:
+                continue
+
+            best = min(valid)
+            higher_done = all(index in results for index in range(best))
+            if deadline is None:
+                deadline = time.monotonic() + self.priority_grace
+            if higher_done or time.monotonic() >= deadline:
+                if not higher_done:
+                    print("⏱️ Not waiting any longer for higher-priority sources")
+                print(f"✅ Successfully scraped {len(results[best])} teams from {sources[best][0]}")
+                return results[best]
+
+        return None
     
+    # Handle common variations - maps to the format used in bolao.json
+    NAME_MAPPINGS = {
+        'Red Bull Bragantino': 'Bragantino',
+        'RB Bragantino': 'Bragantino',
+        'Vasco da Gama': 'Vasco',
+        'Vasco da Gama Saf': 'Vasco',
+        'Atlético-MG': 'Atlético-MG',
+        'Atlético Mineiro': 'Atlético-MG',
+        'Atletico-MG': 'Atlético-MG',
+        'Athletico-PR': 'Atlético-PR',
+        'Athletico Paranaense': 'Atlético-PR',
+        'Atlético-PR': 'Atlético-PR',
+        'Atletico-PR': 'Atlético-PR',
+        'Red Bull Salzburg': 'Bragantino',  # Just in case
+        'Sao Paulo': 'São Paulo',
+        'Sao-Paulo': 'São Paulo',
+        'São Paulo': 'São Paulo',
+        'Vitoria': 'Vitória',
+        'Vitória': 'Vitória',
+        'Gremio': 'Grêmio',
+        'Grêmio': 'Grêmio',
+        'Santos Fc': 'Santos',
+        'Santos FC': 'Santos',
+        'Coritiba SAF': 'Coritiba',
+        'Coritiba': 'Coritiba',
+    }
+
     def normalize_team_name(self, team_name):
         """Normalize team names to match predictions"""
+        if team_name in self.normalized_names:
+            return self.normalized_names[team_name]
+
         # Clean up the team name
-        team_name = team_name.strip()
-        
-        # Handle common variations - maps to the format used in bolao.json
-        name_mappings = {
-            'Red Bull Bragantino': 'Bragantino',
-            'RB Bragantino': 'Bragantino',
-            'Vasco da Gama': 'Vasco',
-            'Vasco da Gama Saf': 'Vasco',
-            'Atlético-MG': 'Atlético-MG',
-            'Atlético Mineiro': 'Atlético-MG',
-            'Atletico-MG': 'Atlético-MG',
-            'Athletico-PR': 'Atlético-PR',
-            'Athletico Paranaense': 'Atlético-PR',
-            'Atlético-PR': 'Atlético-PR',
-            'Atletico-PR': 'Atlético-PR',
-            'Red Bull Salzburg': 'Bragantino',  # Just in case
-            'Sao Paulo': 'São Paulo',
-            'Sao-Paulo': 'São Paulo',
-            'São Paulo': 'São Paulo',
-            'Vitoria': 'Vitória',
-            'Vitória': 'Vitória',
-            'Gremio': 'Grêmio',
-            'Grêmio': 'Grêmio',
-            'Santos Fc': 'Santos',
-            'Santos FC': 'Santos',
-            'Coritiba SAF': 'Coritiba',
-            'Coritiba': 'Coritiba',
-        }
-        
+        name = team_name.strip()
+
         # Check direct mappings
-        if team_name in name_mappings:
-            return name_mappings[team_name]
-        
-        # Check if any mapping key contains the team name or vice versa
-        for key, value in name_mappings.items():
-            if key.lower() in team_name.lower() or team_name.lower() in key.lower():
-                return value
-        
-        return team_name
+        if name in self.NAME_MAPPINGS:
+            normalized = self.NAME_MAPPINGS[name]
+        else:
+            # First mapping key (in order) that contains the team name or vice versa
+            if self.name_alias_index is None:
+                self.name_alias_index = TeamAliasIndex((key.lower(), value) for key, value in self.NAME_MAPPINGS.items())
+            normalized = self.name_alias_index.related_alias(name.lower()) or name
+
+        self.normalized_names[team_name] = normalized
+        return normalized
 
     def normalize_team_key(self, text):
         """Normalize text for matching team names"""
-        text = text.strip().lower()
-        text = unicodedata.normalize("NFD", text)
-        text = "".join(ch for ch in text if unicodedata.category(ch) != "Mn")
-        text = re.sub(r"\s+", " ", text)
-        return text
+        if text in self.team_keys:
+            return self.team_keys[text]
+        key = text.strip().lower()
+        key = unicodedata.normalize("NFD", key)
+        key = "".join(ch for ch in key if unicodedata.category(ch) != "Mn")
+        key = re.sub(r"\s+", " ", key)
+        self.team_keys[text] = key
+        return key
+
+    def get_alias_index(self, team_match_map):
+        """Compiled alias index for a team match map (plain dicts are wrapped once)"""
+        if team_match_map is None or isinstance(team_match_map, TeamAliasIndex):
+            return team_match_map
+        return TeamAliasIndex(team_match_map)
 
     def get_teams_from_predictions(self, predictions):
         """Extract unique team names from predictions"""
@@ -472,8 +2794,8 @@ class BrasileiroScraper:
         return teams
 
     def build_team_match_map(self, teams):
-        """Build a map of normalized team variants to canonical team names"""
-        team_match_map = {}
+        """Build the alias index of normalized team variants to canonical team names"""
+        team_match_map = TeamAliasIndex()
 
         variant_map = {
             'Bragantino': ['Red Bull Bragantino', 'RB Bragantino'],
@@ -555,72 +2877,506 @@ class BrasileiroScraper:
 
         return bonus_points
     
+    def get_scoring_engine(self, predictions):
+        """Scoring engine compiled once per predictions object"""
+        if self.scoring_engine is None or self.scoring_engine[0] is not predictions:
+            self.scoring_engine = (predictions, ScoringEngine(predictions, self.normalize_team_name))
+        return self.scoring_engine[1]
+
+    def build_score_report(self, actual_standings, predictions):
+        """Score every player once and collect the results in a ScoreReport.
+
+        When the same engine already scored a table in this process, only the
+        teams that moved since then are rescored (ScoringEngine.update).
+        """
+        engine = self.get_scoring_engine(predictions)
+        if self.last_score and self.last_score[0] is engine:
+            _, previous_standings, previous = self.last_score
+            diff = self.standings_changed(actual_standings, previous_standings)
+            result = engine.update(previous, previous_standings, actual_standings, diff) if diff else previous
+        else:
+            result = engine.score(actual_standings)
+        self.last_score = (engine, [dict(team_data) for team_data in actual_standings], result)
+        return ScoreReport.from_engine_result(
+            actual_standings,
+            engine.players,
+            result,
+            self.get_current_round(actual_standings),
+            datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        )
+
     def compare_predictions(self, actual_standings, predictions):
         """Compare predictions with actual standings and calculate scores"""
         if not predictions or not actual_standings:
             return
-        
-        # Calculate scores for each player
-        player_scores = {}
-        raw_scores = {}
 
-        # Initialize raw scores for all players
-        for player in predictions.keys():
-            raw_scores[player] = 0
-        
+        report = self.build_score_report(actual_standings, predictions)
+        self.print_score_report(report)
+        # Retorna também os scores brutos para uso na tabela do README
+        return dict(report.normalized_scores), dict(report.raw_scores)
+
+    def print_score_report(self, report):
+        """Print the per-team results table and final scores to the console"""
         print(f"\n🏆 BRASILEIRÃO 2026 - BOLÃO RESULTS")
-        print(f"Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Updated: {report.timestamp}")
         print("=" * 120)
         
         # Header
         print(f"{'Team':<20} {'Actual':<8}", end="")
-        for player in predictions.keys():
+        for player in report.players:
             print(f"{player:<12}", end="")
         print()
         print("-" * 120)
         
         # Process each team
-        for team_data in actual_standings:
+        for row, team_data in enumerate(report.standings):
             original_team_name = team_data['team']
-            team_name = self.normalize_team_name(original_team_name)
             actual_pos = team_data['position']
             
             print(f"{original_team_name:<20} {actual_pos:<8}", end="")
             
-            for player, player_predictions in predictions.items():
-                # Find predicted position for this team
-                predicted_pos = None
-                for pos, predicted_team in player_predictions.items():
-                    if predicted_team == team_name:
-                        predicted_pos = int(pos)
-                        break
-                if predicted_pos is not None:
-                    score = self.calculate_score(predicted_pos, actual_pos)
-                    raw_scores[player] += score
+            for predicted_pos, score in report.row_cells(row):
+                if predicted_pos:
                     print(f"{predicted_pos}°({score}p) ", end="")
                 else:
                     print("--       ", end="")
             
             print()
-
-        # Bonus points: 3 points for correct 1st place and 3 points for hitting 3 of the last 4
-        bonus_points = self.calculate_bonus_points(actual_standings, predictions)
-        for player, bonus in bonus_points.items():
-            raw_scores[player] += bonus
         
-        # Display final scores
+        # Display final scores (bonus points are included)
         print("-" * 120)
         print(f"{'FINAL SCORES:':<20} {'':>8}", end="")
-        player_scores = {}
-        for player in predictions.keys():
-            norm_score = self.normalize_score(raw_scores.get(player, 0))
-            player_scores[player] = norm_score
-            print(f"{norm_score:<12}", end="")
+        for player in report.players:
+            print(f"{report.normalized_scores[player]:<12}", end="")
         print()
-        # Retorna também os scores brutos para uso na tabela do README
-        return player_scores, raw_scores
     
 
+    def score_pool(self, actual_standings, batches, top_k=10):
+        """Score a stream of predictions batches keeping only a top-K leaderboard.
+
+        Each batch is scored like compare_predictions (same raw / normalized
+        scores) and then dropped, so memory stays flat regardless of pool size.
+        Returns a summary dict with the leaderboard (best first) and aggregate stats.
+        """
+        leaderboard = []  # min-heap of (raw, -sequence, player, normalized)
+        sequence = 0
+        count = 0
+        raw_total = 0
+        raw_min = None
+        raw_max = None
+        histogram = [0] * 101
+
+        for batch in batches:
+            engine = ScoringEngine(batch, self.normalize_team_name)
+            result = engine.score(actual_standings)
+            raw_scores = to_list(result['raw'])
+            normalized_scores = to_list(result['normalized'])
+
+            count += len(raw_scores)
+            raw_total += sum(raw_scores)
+            raw_min = min([raw_min] + raw_scores) if raw_min is not None else min(raw_scores)
+            raw_max = max([raw_max] + raw_scores) if raw_max is not None else max(raw_scores)
+            for normalized in normalized_scores:
+                histogram[normalized] += 1
+
+            for player, raw, normalized in zip(engine.players, raw_scores, normalized_scores):
+                # Earlier players win ties, as in the README ranking
+                entry = (raw, -sequence, player, normalized)
+                sequence += 1
+                if len(leaderboard) < top_k:
+                    heapq.heappush(leaderboard, entry)
+                elif entry > leaderboard[0]:
+                    heapq.heapreplace(leaderboard, entry)
+
+        return {
+            'players': count,
+            'leaderboard': [(player, raw, normalized)
+                            for raw, _, player, normalized in sorted(leaderboard, reverse=True)],
+            'raw_mean': raw_total / count if count else 0,
+            'raw_min': raw_min,
+            'raw_max': raw_max,
+            'normalized_histogram': histogram,
+        }
+
+    def merge_pool_summaries(self, summaries, top_k=10):
+        """Merge score_pool summaries of consecutive shards into one summary.
+
+        Shard leaderboards are already best first, so a stable sort by raw score
+        over them in shard order keeps the single-process tie order.
+        """
+        summaries = [summary for summary in summaries if summary['players']]
+        count = sum(summary['players'] for summary in summaries)
+        leaderboard = [entry for summary in summaries for entry in summary['leaderboard']]
+        histogram = [0] * 101
+        for summary in summaries:
+            for normalized, amount in enumerate(summary['normalized_histogram']):
+                histogram[normalized] += amount
+        return {
+            'players': count,
+            'leaderboard': sorted(leaderboard, key=lambda entry: entry[1], reverse=True)[:top_k],
+            'raw_mean': sum(s['raw_mean'] * s['players'] for s in summaries) / count if count else 0,
+            'raw_min': min((s['raw_min'] for s in summaries), default=None),
+            'raw_max': max((s['raw_max'] for s in summaries), default=None),
+            'normalized_histogram': histogram,
+        }
+
+    def score_pool_parallel(self, actual_standings, pool_file, workers, top_k=10, batch_size=10000):
+        """Score a JSONL pool across worker processes and merge their leaderboards.
+
+        The file is split into byte-range shards that each worker reads from its
+        own memory map; the standings are sent once per worker process.
+        """
+        size = os.path.getsize(pool_file)
+        shard_count = max(1, min(workers * 4, size // (1 << 20) + 1))
+        bounds = [size * i // shard_count for i in range(shard_count + 1)]
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_pool_worker,
+                                 initargs=(actual_standings,)) as executor:
+            futures = [executor.submit(score_pool_shard, pool_file, bounds[i], bounds[i + 1], top_k, batch_size)
+                       for i in range(shard_count)]
+            summaries = [future.result() for future in futures]
+        return self.merge_pool_summaries(summaries, top_k)
+
+    def print_pool_summary(self, summary):
+        """Print the top-K leaderboard and aggregate stats of a scored pool"""
+        print(f"\n🏆 BRASILEIRÃO 2026 - BOLÃO ({summary['players']} participantes)")
+        print("=" * 60)
+        for i, (player, raw, normalized) in enumerate(summary['leaderboard'], 1):
+            print(f"{i:>4}. {player:<36} {raw:>5} {normalized:>5}")
+        print("-" * 60)
+        if summary['players']:
+            print(f"Média: {summary['raw_mean']:.1f}  Mín: {summary['raw_min']}  Máx: {summary['raw_max']}")
+
+    def run_pool(self, pool_file, top_k=10, batch_size=10000, workers=1):
+        """Score a large JSONL pool in batches (optionally in worker processes) and print the leaderboard"""
+        try:
+            if not os.path.exists(pool_file):
+                print(f"Pool file not found: {pool_file}")
+                return None
+
+            self.start_run()
+
+            # Team names for the source parsers come from the first batch
+            first_batch = next(self.iter_pool_batches(self.iter_pool_predictions(pool_file), batch_size), {})
+            team_match_map = self.build_team_match_map(self.get_teams_from_predictions(first_batch))
+            current_standings = self.get_current_standings(team_match_map)
+            if not current_standings:
+                print("❌ Failed to load data")
+                return None
+
+            if workers > 1:
+                summary = self.score_pool_parallel(current_standings, pool_file, workers, top_k, batch_size)
+            else:
+                batches = self.iter_pool_batches(self.iter_pool_predictions(pool_file), batch_size)
+                summary = self.score_pool(current_standings, batches, top_k)
+            self.print_pool_summary(summary)
+            return summary
+
+        except Exception as e:
+            print(f"❌ Error: {e}")
+            return None
+
+    def load_batch_pools(self, source, output_dir=None):
+        """Pools of a --batch run: [{'name', 'predictions', 'output'}] with absolute paths.
+
+        source is a directory (every *.json in it is a predictions file, published
+        to a sub-directory named after it) or a JSON manifest: a list (or
+        {"pools": [...]}) of predictions paths or {"name", "predictions", "output"}
+        objects, relative to the manifest. Output directories are relative to
+        output_dir when given, else to the source directory / the manifest's directory.
+        """
+        source = os.path.abspath(source)
+        if os.path.isdir(source):
+            base = source
+            entries = sorted(name for name in os.listdir(source) if name.endswith('.json'))
+        else:
+            base = os.path.dirname(source)
+            with open(source, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            if isinstance(entries, dict):
+                entries = entries.get('pools', [])
+        output_base = os.path.abspath(output_dir) if output_dir else base
+
+        pools = []
+        for entry in entries:
+            if isinstance(entry, str):
+                entry = {'predictions': entry}
+            predictions_file = os.path.join(base, entry['predictions'])
+            name = entry.get('name') or os.path.splitext(os.path.basename(predictions_file))[0]
+            pools.append({
+                'name': name,
+                'predictions': predictions_file,
+                'output': os.path.join(output_base, entry.get('output') or name),
+            })
+        return pools
+
+    def publish_pool(self, pool, current_standings, force_update=False):
+        """Score one --batch pool against already fetched standings.
+
+        The pool gets its own scraper with output_dir=pool['output'], so README.md,
+        last_standings.json, the score history and the chart all live there
+        without changing the working directory; the console output is captured
+        (per thread when sys.stdout is a ThreadOutput) and returned with the result.
+        """
+        import sys
+        if isinstance(sys.stdout, ThreadOutput):
+            capture = sys.stdout.capture()
+        else:
+            capture = contextlib.redirect_stdout(io.StringIO())
+        result = {'name': pool['name'], 'output': pool['output'], 'changed': False,
+                  'readme_written': False, 'leader': None, 'error': None}
+        with capture as log:
+            try:
+                os.makedirs(pool['output'], exist_ok=True)
+                scraper = BrasileiroScraper(attempts_file=None, http_cache_file=None,
+                                            simulations=self.simulations,
+                                            elimination_analysis=self.elimination_analysis,
+                                            chart_backend=self.chart_backend, output_dir=pool['output'])
+                readme_path = scraper.output_path("README.md")
+                if not os.path.exists(readme_path):
+                    self.write_text_atomic(readme_path, f"# {pool['name']}\n")
+                predictions = scraper.load_predictions(pool['predictions'])
+                if not predictions:
+                    raise ValueError(f"no predictions in {pool['predictions']}")
+                outcome = scraper.process_standings(current_standings, predictions, force_update)
+                result.update(changed=outcome['changed'], readme_written=outcome['readme_written'],
+                              leader=outcome['report'].ranking[0] if outcome['report'].ranking else None)
+            except Exception as e:
+                result['error'] = str(e)
+        result['log'] = log.getvalue()
+        return result
+
+    # Threads publishing --batch pools when no --workers processes are asked for
+    BATCH_THREADS = 8
+
+    def run_batch(self, source, workers=1, force_update=False, output_dir=None):
+        """Publish many pools from one standings fetch (--batch).
+
+        The sources are scraped once with an alias map merged from every pool's
+        teams; the pools are then scored concurrently, each into its own output
+        directory: in threads by default, or in worker processes with workers > 1
+        (CPU-bound pools, e.g. with --simulate).
+        """
+        try:
+            pools = self.load_batch_pools(source, output_dir)
+            if not pools:
+                print(f"❌ No pools found in {source}")
+                return None
+
+            self.start_run()
+            teams = set()
+            for pool in pools:
+                teams |= self.get_teams_from_predictions(self.load_predictions(pool['predictions']))
+            current_standings = self.get_current_standings(self.build_team_match_map(teams))
+            if not current_standings:
+                print("❌ Failed to load data")
+                return None
+
+            print(f"\n📦 Publishing {len(pools)} pools from one fetch...")
+            start = time.perf_counter()
+            if workers > 1:
+                from concurrent.futures import ProcessPoolExecutor
+                options = {'simulations': self.simulations, 'elimination_analysis': self.elimination_analysis,
+                           'chart_backend': self.chart_backend}
+                with ProcessPoolExecutor(max_workers=workers, initializer=init_batch_worker,
+                                         initargs=(current_standings, options, force_update)) as executor:
+                    results = list(executor.map(publish_batch_pool, pools))
+            else:
+                import sys
+                from concurrent.futures import ThreadPoolExecutor
+                with contextlib.redirect_stdout(ThreadOutput(sys.stdout)), \
+                        ThreadPoolExecutor(max_workers=min(len(pools), self.BATCH_THREADS)) as executor:
+                    results = list(executor.map(lambda pool: self.publish_pool(pool, current_standings, force_update),
+                                                pools))
+
+            for result in results:
+                print(f"\n===== {result['name']} ({result['output']}) =====")
+                print(result['log'].rstrip())
+            print(f"\n{'Pool':<24} {'Líder':<20} README")
+            print("-" * 60)
+            for result in results:
+                if result['error']:
+                    status = f"❌ {result['error']}"
+                else:
+                    status = "✅ atualizado" if result['readme_written'] else "➖ sem mudanças"
+                print(f"{result['name']:<24} {result['leader'] or '-':<20} {status}")
+            print(f"⏱️  {len(pools)} pools in {time.perf_counter() - start:.1f}s")
+            return results
+
+        except Exception as e:
+            print(f"❌ Error: {e}")
+            return None
+
+    # Remaining-games model for the title simulation
+    SEASON_ROUNDS = 38
+    DRAW_PROBABILITY = 0.26
+    # Games of league-average form mixed into each team's points per game
+    STRENGTH_PRIOR_GAMES = 5
+
+    def build_simulation_model(self, actual_standings, engine):
+        """Arrays the Monte Carlo simulation needs, aligned with the standings rows.
+
+        Team strength is points per game shrunk towards the league average; each
+        remaining game is a win / draw / loss against an average opponent.
+        """
+        points = np.array([self.json_int(team_data, ('points',)) or 0 for team_data in actual_standings], dtype=np.int64)
+        games = np.array([self.json_int(team_data, ('games',)) or 0 for team_data in actual_standings], dtype=np.int64)
+        remaining = np.maximum(0, self.SEASON_ROUNDS - games)
+        league_ppg = points.sum() / games.sum() if games.sum() else 1.35
+        ppg = (points + self.STRENGTH_PRIOR_GAMES * league_ppg) / (games + self.STRENGTH_PRIOR_GAMES)
+        win = np.clip((ppg - self.DRAW_PROBABILITY) / 3, 0.02, 0.98 - self.DRAW_PROBABILITY - 0.02)
+        probabilities = np.stack([win, np.full_like(win, self.DRAW_PROBABILITY), 1 - win - self.DRAW_PROBABILITY], axis=1)
+
+        team_columns = engine.prepare(actual_standings)[0]
+        predicted = np.zeros((len(engine.players), len(actual_standings)), dtype=np.int16)
+        for row, column in enumerate(team_columns):
+            if column >= 0:
+                predicted[:, row] = engine.predicted[:, column]
+        bonus_ids = np.array([engine.bonus_ids.get(self.normalize_team_name(team_data['team']), -2)
+                              for team_data in actual_standings], dtype=np.int32)
+
+        return {
+            'points': points,
+            'remaining': remaining,
+            'probabilities': probabilities,
+            'predicted': predicted,
+            'bonus_ids': bonus_ids,
+            'champions': engine.champions,
+            'bottom_fours': engine.bottom_fours,
+            'min_score': engine.min_score,
+            'max_score': engine.max_score,
+        }
+
+    def simulate_title_odds(self, actual_standings, predictions, simulations=100000, workers=1, seed=None):
+        """Monte Carlo title odds: per player win / top-3 probability and expected final score.
+
+        Simulates the rest of the season from the scraped points and games, scores
+        every simulated final table with the bolão rules (vectorized over the
+        simulations) and spreads chunks of simulations over worker processes.
+        Returns None without NumPy.
+        """
+        if not NUMPY_AVAILABLE:
+            print("⚠️ NumPy não disponível - simulação de chances ignorada")
+            return None
+
+        # The simulation works on the NumPy matrices, whatever the pool size
+        engine = ScoringEngine(predictions, self.normalize_team_name, use_numpy=True)
+        model = self.build_simulation_model(actual_standings, engine)
+        chunk_count = max(1, min(workers * 4, simulations // 5000))
+        counts = [simulations // chunk_count + (1 if i < simulations % chunk_count else 0) for i in range(chunk_count)]
+        seeds = np.random.SeedSequence(seed).spawn(chunk_count)
+
+        if workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers, initializer=init_simulation_worker,
+                                     initargs=(model,)) as executor:
+                totals = list(executor.map(run_simulation_chunk, counts, seeds))
+        else:
+            totals = [simulate_title_chunk(model, count, chunk_seed) for count, chunk_seed in zip(counts, seeds)]
+
+        wins = sum(total['wins'] for total in totals)
+        top3 = sum(total['top3'] for total in totals)
+        normalized = sum(total['normalized'] for total in totals)
+        odds = [{
+            'player': player,
+            'win': float(wins[p]) / simulations,
+            'top3': float(top3[p]) / simulations,
+            'expected_score': float(normalized[p]) / simulations,
+        } for p, player in enumerate(engine.players)]
+        return sorted(odds, key=lambda entry: (entry['win'], entry['expected_score']), reverse=True)
+
+    def score_bounds(self, actual_standings, predictions, node_budget=50000):
+        """Highest and lowest final raw score each player can still reach.
+
+        Uses FinalTableSearch over the final tables reachable from the scraped
+        points and games. A player is eliminated when someone else's minimum is
+        above their maximum, and champion when their minimum is above everyone
+        else's maximum.
+        """
+        engine = self.get_scoring_engine(predictions)
+        team_columns = engine.prepare(actual_standings)[0]
+        points = [self.json_int(team_data, ('points',)) or 0 for team_data in actual_standings]
+        games = [self.json_int(team_data, ('games',)) or 0 for team_data in actual_standings]
+        search = FinalTableSearch(points, [max(0, self.SEASON_ROUNDS - g) for g in games], node_budget)
+        bonus_ids = [engine.bonus_ids.get(self.normalize_team_name(team_data['team']), -2)
+                     for team_data in actual_standings]
+        champions = to_list(engine.champions)
+        bottom_fours = to_list(engine.bottom_fours)
+        ranks = range(1, len(actual_standings) + 1)
+
+        bounds = []
+        for p, player in enumerate(engine.players):
+            positions = engine.player_positions(p, team_columns)
+            values = [[max(0, 20 - abs(predicted_pos - rank)) if predicted_pos else 0 for rank in ranks]
+                      for predicted_pos in positions]
+            picks = [team_id for team_id in bottom_fours[p] if team_id >= 0]
+            highest, exact_high = search.best(values, bonus_ids, champions[p], picks)
+            lowest, exact_low = search.best([[-value for value in row] for row in values],
+                                            bonus_ids, champions[p], picks, bonus=-3)
+            bounds.append({'player': player, 'max': highest, 'min': -lowest, 'exact': exact_high and exact_low})
+            if not (exact_high and exact_low):
+                # Too early in the season for an exact search - the others get the relaxed bounds straight away
+                search.node_budget = 0
+
+        for entry in bounds:
+            others = [other for other in bounds if other is not entry]
+            if others and entry['max'] < max(other['min'] for other in others):
+                entry['status'] = 'eliminated'
+            elif not others or entry['min'] > max(other['max'] for other in others):
+                entry['status'] = 'champion'
+            else:
+                entry['status'] = 'alive'
+        return sorted(bounds, key=lambda entry: (entry['max'], entry['min']), reverse=True)
+
+    def run_elimination_analysis(self, actual_standings, predictions):
+        """Compute and print reachable score ranges when enabled (--bounds)"""
+        if not self.elimination_analysis:
+            return None
+        start = time.perf_counter()
+        bounds = self.score_bounds(actual_standings, predictions)
+        self.print_score_bounds(bounds)
+        print(f"⏱️  {time.perf_counter() - start:.1f}s")
+        return bounds
+
+    def print_score_bounds(self, bounds):
+        """Print reachable score ranges and elimination verdicts"""
+        labels = {'eliminated': '❌ eliminado', 'champion': '🏆 campeão', 'alive': '✅ na disputa'}
+        print(f"\n🧮 PONTUAÇÃO AINDA POSSÍVEL")
+        print(f"{'Player':<20} {'Mín':>6} {'Máx':>6}  Situação")
+        print("-" * 60)
+        for entry in bounds:
+            approx = "" if entry['exact'] else " (limite aproximado)"
+            print(f"{entry['player']:<20} {entry['min']:>6} {entry['max']:>6}  {labels[entry['status']]}{approx}")
+
+    def run_title_simulation(self, actual_standings, predictions):
+        """Simulate and print title odds when enabled (--simulate)"""
+        if not self.simulations:
+            return None
+        start = time.perf_counter()
+        odds = self.simulate_title_odds(actual_standings, predictions, self.simulations, self.workers)
+        if odds:
+            self.print_title_odds(odds, self.simulations)
+            print(f"⏱️  {time.perf_counter() - start:.1f}s")
+        return odds
+
+    def print_title_odds(self, odds, simulations):
+        """Print the simulated title odds table"""
+        print(f"\n🎲 CHANCES DE TÍTULO ({simulations} simulações)")
+        print(f"{'Player':<20} {'Título':>8} {'Top 3':>8} {'Pontos esperados':>18}")
+        print("-" * 60)
+        for entry in odds:
+            print(f"{entry['player']:<20} {entry['win']:>8.1%} {entry['top3']:>8.1%} {entry['expected_score']:>18.1f}")
+
+    def title_odds_lines(self, odds, simulations):
+        """README lines for the simulated title odds"""
+        lines = ["", "### 🎲 Chances de Título", "",
+                 f"*{simulations} simulações das rodadas restantes.*", "",
+                 "| Jogador | Título | Top 3 | Pontuação esperada |",
+                 "|------|------|------|------|"]
+        for entry in odds:
+            lines.append(f"| {entry['player']} | {entry['win']:.1%} | {entry['top3']:.1%} | {entry['expected_score']:.0f} |")
+        return lines
+
     def get_current_round(self, standings):
         """Calculate last completed round based on maximum games played by any team"""
         if not standings:
@@ -647,66 +3403,65 @@ class BrasileiroScraper:
         # Return the last completed round (maximum games played)
         return max_games
 
-    def save_score_history(self, normalized_scores, raw_scores, current_round, force_update=False):
-        """Save current scores to history for graph generation"""
-        history_file = "score_history.json"
+    def save_score_history(self, report, force_update=False):
+        """Save current scores to history for graph generation.
+
+        Returns (should_update_graph, history) with the history as
+        ScoreHistoryColumns, so the graph doesn't have to read it back.
+        """
+        normalized_scores = dict(report.normalized_scores)
+        history = []
         
         try:
-            # Load existing history
-            history = []
-            if os.path.exists(history_file):
-                with open(history_file, 'r', encoding='utf-8') as f:
-                    try:
-                        history = json.load(f)
-                    except json.JSONDecodeError:
-                        print("⚠️ score_history.json inválido ou vazio - reiniciando histórico")
-                        history = []
+            store = self.history_store
+            last_entry = store.last()
             
             # Create new entry
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            timestamp = report.timestamp
+            current_round = report.round
             new_entry = {
                 'timestamp': timestamp,
                 'round': current_round,
                 'normalized_scores': normalized_scores,
-                'raw_scores': raw_scores
+                'raw_scores': dict(report.raw_scores)
             }
             
             # Check if scores have changed from last entry
             scores_changed = True
-            should_add_to_history = True
             
-            if history and len(history) > 0:
-                last_entry = history[-1]
-                
+            if last_entry:
                 # Check if normalized scores are the same
                 if last_entry.get('normalized_scores') == normalized_scores:
                     scores_changed = False
                     
                     # If force_update, update the timestamp of the last entry instead of adding new
-                    if force_update:
+                    # (unless raw scores are unchanged too, so a forced run without news writes nothing)
+                    if force_update and last_entry.get('raw_scores') == new_entry['raw_scores']:
+                        print("📊 Scores unchanged - keeping last history entry")
+                    elif force_update:
                         print("📊 Scores unchanged but force updating - refreshing timestamp")
-                        history[-1]['timestamp'] = timestamp
-                        should_add_to_history = False
+                        last_entry['timestamp'] = timestamp
+                        store.replace_last(last_entry)
                     else:
                         print("📊 Scores unchanged - not adding to history")
-                        should_add_to_history = False
             
             # Add new entry only if scores actually changed
-            if should_add_to_history and scores_changed:
-                history.append(new_entry)
+            if scores_changed:
+                store.append(new_entry)
                 print(f"📈 Score history updated: Rodada {current_round} - {timestamp}")
             
-            # Save updated history (either new entry or updated timestamp)
-            if should_add_to_history or (force_update and not scores_changed):
-                with open(history_file, 'w', encoding='utf-8') as f:
-                    json.dump(history, f, indent=2, ensure_ascii=False)
+            history = self.load_history_columns()
             
             # Always return True if we need to update graph (either scores changed or force update)
-            return scores_changed or force_update
+            return scores_changed or force_update, history
             
         except Exception as e:
             print(f"❌ Error saving score history: {e}")
-            return False
+            return False, history
+
+    def load_history_columns(self):
+        """Columnar view of the score history (synced with the history store)"""
+        return ScoreHistoryColumns.sync(self.history_columns_dir, self.history_store)
 
     def filter_unique_rounds(self, history):
         """Filter history to keep only the latest entry for each round"""
@@ -730,29 +3485,24 @@ class BrasileiroScraper:
         
         return filtered_history
 
-    def generate_score_graph(self):
-        """Generate visual score graph for README"""
-        history_file = "score_history.json"
-        
-        if not os.path.exists(history_file):
-            return ["", "### 📈 Histórico de Desempenho", "", "*Nenhum histórico disponível ainda.*", ""]
-        
+    def generate_score_graph(self, history=None):
+        """Generate visual score graph for README.
+
+        history is a ScoreHistoryColumns or a list of history entries; by default
+        the columns of the history store.
+        """
         try:
-            with open(history_file, 'r', encoding='utf-8') as f:
-                try:
-                    full_history = json.load(f)
-                except json.JSONDecodeError:
-                    return ["", "### 📈 Histórico de Desempenho", "", "*Histórico inválido ou vazio.*", ""]
+            if history is None:
+                history = self.load_history_columns()
+            elif not isinstance(history, ScoreHistoryColumns):
+                history = ScoreHistoryColumns.from_entries(history)
             
-            if not full_history:
+            if not len(history):
                 return ["", "### 📈 Histórico de Desempenho", "", "*Nenhum histórico disponível ainda.*", ""]
             
-            # Filter to get only the latest entry for each round
-            history = self.filter_unique_rounds(full_history)
-            
-            # Get player names from latest entry and sort by current score (descending)
-            latest_entry = history[-1]
-            players_scores = [(player, score) for player, score in latest_entry['normalized_scores'].items()]
+            # Get player names from latest round and sort by current score (descending)
+            latest_scores = history.row(-1)
+            players_scores = [(player, score) for player, score in latest_scores.items()]
             players_scores.sort(key=lambda x: x[1], reverse=True)  # Sort by score descending
             players = [player for player, score in players_scores]
             
@@ -761,11 +3511,14 @@ class BrasileiroScraper:
             graph_lines.append("### 📈 Histórico de Desempenho")
             graph_lines.append("")
             
-            # Generate visual chart if matplotlib is available
-            if MATPLOTLIB_AVAILABLE and len(history) >= 1:
+            # Generate visual chart (matplotlib PNG, or SVG without matplotlib)
+            if len(history) >= 1:
                 try:
-                    self.create_performance_chart(history, players)
-                    graph_lines.append("![Gráfico de Performance](performance_chart.png)")
+                    if self.chart_backend == 'svg' or not MATPLOTLIB_AVAILABLE:
+                        chart_path = self.create_performance_chart_svg(history, players)
+                    else:
+                        chart_path = self.create_performance_chart(history, players)
+                    graph_lines.append(f"![Gráfico de Performance]({chart_path})")
                     graph_lines.append("")
                 except Exception as e:
                     print(f"⚠️ Warning: Could not generate chart: {e}")
@@ -780,14 +3533,13 @@ class BrasileiroScraper:
                 graph_lines.append(separator)
                 
                 # Show last 10 unique rounds to keep table manageable
-                recent_history = history[-10:]
-                
-                for entry in recent_history:
-                    round_num = entry.get('round', 'N/A')
+                rounds = to_list(history.rounds)
+                for index in range(max(0, len(history) - 10), len(history)):
+                    scores = history.row(index)
                     
-                    row = f"| R{round_num} |"
+                    row = f"| R{rounds[index]} |"
                     for player in players:  # Use ordered players
-                        score = entry['normalized_scores'].get(player, 0)
+                        score = scores.get(player, 0)
                         row += f" {score} |"
                     
                     graph_lines.append(row)
@@ -797,8 +3549,8 @@ class BrasileiroScraper:
                 graph_lines.append("**Tendência (últimas 2 medições):**")
                 
                 if len(history) >= 2:
-                    current = history[-1]['normalized_scores']
-                    previous = history[-2]['normalized_scores']
+                    current = latest_scores
+                    previous = history.row(-2)
                     
                     trends = []
                     for player in players:  # Use ordered players
@@ -829,29 +3581,45 @@ class BrasileiroScraper:
             return ["", "### 📈 Histórico de Desempenho", "", f"*Erro ao gerar gráfico: {e}*", ""]
 
     def create_performance_chart(self, history, players):
-        """Create a visual performance chart using matplotlib"""
+        """Create a visual performance chart using matplotlib (history as ScoreHistoryColumns).
+
+        The chart is keyed by a hash of the data it plots: when performance_chart.png
+        was already drawn from the same data it is reused without importing matplotlib.
+        """
         if not MATPLOTLIB_AVAILABLE:
             return
         
+        chart_path = "performance_chart.png"
+        chart_file = self.output_path(chart_path)
+        chart_hash = self.get_chart_hash(history, players)
+        if os.path.exists(chart_file) and self.load_chart_hash() == chart_hash:
+            print(f"📊 Gráfico sem mudanças - reaproveitando {chart_file}")
+            return chart_path
+        
+        # pyplot keeps global state: one chart at a time when --batch pools run in threads
+        with PYPLOT_LOCK:
+            self.draw_performance_chart(history, players, chart_file)
+        self.save_chart_hash(chart_hash)
+        
+        print(f"📊 Gráfico de performance salvo em: {chart_file}")
+        
+        return chart_path
+
+    def draw_performance_chart(self, history, players, chart_file):
+        """Draw the matplotlib performance chart into chart_file"""
         # Configure matplotlib for better appearance
         plt.style.use('default')
         fig, ax = plt.subplots(figsize=(12, 8))
         
         # Colors for each player
-        colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7', '#DDA0DD']
+        colors = self.CHART_COLORS
         
         # Prepare data - use rounds instead of timestamps
-        rounds = []
-        for entry in history:
-            # Get round from entry, or estimate from position if not available
-            round_num = entry.get('round', len(rounds) + 1)
-            rounds.append(round_num)
+        rounds = to_list(history.rounds)
         
         # Plot lines for each player
         for i, player in enumerate(players):
-            scores = []
-            for entry in history:
-                scores.append(entry['normalized_scores'].get(player, 0))
+            scores = history.column(player)
             
             color = colors[i % len(colors)]
             
@@ -894,10 +3662,10 @@ class BrasileiroScraper:
         
         # Highlight the latest scores
         if len(history) > 0:
-            latest_entry = history[-1]
+            latest_scores = history.row(-1)
             latest_round = rounds[-1]
             for i, player in enumerate(players):
-                latest_score = latest_entry['normalized_scores'].get(player, 0)
+                latest_score = latest_scores.get(player, 0)
                 color = colors[i % len(colors)]
                 ax.annotate(f'{latest_score}', 
                            xy=(latest_round, latest_score),
@@ -909,143 +3677,256 @@ class BrasileiroScraper:
         plt.tight_layout()
         
         # Save the chart
-        chart_path = "performance_chart.png"
-        plt.savefig(chart_path, dpi=150, bbox_inches='tight', 
+        plt.savefig(chart_file, dpi=150, bbox_inches='tight', 
                    facecolor='white', edgecolor='none')
         plt.close()
-        
-        print(f"📊 Gráfico de performance salvo em: {chart_path}")
-        
+
+    # Chart colors for each player (shared by the PNG and SVG charts)
+    CHART_COLORS = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7', '#DDA0DD']
+
+    def create_performance_chart_svg(self, history, players, chart_path="performance_chart.svg"):
+        """Draw the performance chart as a plain SVG file, without matplotlib.
+
+        Same content as create_performance_chart: a line per player over the
+        rounds, 0-100 axis, round ticks and the latest score of each player. One
+        element per line with rounded coordinates keeps the file small and easy
+        to diff; the file is only rewritten when its content changes.
+        """
+        width, height = 1200, 800
+        left, right, top, bottom = 80, 40, 70, 70
+        plot_width = width - left - right
+        plot_height = height - top - bottom
+        rounds = to_list(history.rounds)
+        if len(rounds) == 1:
+            x_min, x_max = rounds[0] - 1, rounds[0] + 1
+        else:
+            x_min, x_max = min(rounds) - 0.5, max(rounds) + 0.5
+
+        def x_of(round_num):
+            return left + (round_num - x_min) * plot_width / (x_max - x_min)
+
+        def y_of(score):
+            return top + (100 - score) * plot_height / 100
+
+        lines = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+            f'viewBox="0 0 {width} {height}" font-family="DejaVu Sans, Arial, sans-serif">',
+            f'<rect width="{width}" height="{height}" fill="white"/>',
+            f'<text x="{width / 2:.0f}" y="40" text-anchor="middle" font-size="22" font-weight="bold">'
+            f'Evolução do Desempenho - Bolão Brasileirão 2026</text>',
+        ]
+
+        # Axes, grid and ticks
+        for score in range(0, 101, 20):
+            y = y_of(score)
+            lines.append(f'<line x1="{left}" y1="{y:.1f}" x2="{width - right}" y2="{y:.1f}" '
+                         f'stroke="#ccc" stroke-dasharray="4 4"/>')
+            lines.append(f'<text x="{left - 10}" y="{y + 5:.1f}" text-anchor="end" font-size="13">{score}</text>')
+        # Label at most ~40 rounds so long histories stay readable
+        step = max(1, math.ceil(len(rounds) / 40))
+        for index, round_num in enumerate(rounds):
+            x = x_of(round_num)
+            lines.append(f'<line x1="{x:.1f}" y1="{top}" x2="{x:.1f}" y2="{height - bottom}" '
+                         f'stroke="#ccc" stroke-dasharray="4 4"/>')
+            if index % step == 0 or index == len(rounds) - 1:
+                lines.append(f'<text x="{x:.1f}" y="{height - bottom + 22}" text-anchor="middle" font-size="13">'
+                             f'R{round_num}</text>')
+        lines.append(f'<rect x="{left}" y="{top}" width="{plot_width}" height="{plot_height}" fill="none" stroke="black"/>')
+        lines.append(f'<text x="{left + plot_width / 2:.0f}" y="{height - 20}" text-anchor="middle" '
+                     f'font-size="16" font-weight="bold">Rodada</text>')
+        lines.append(f'<text x="25" y="{top + plot_height / 2:.0f}" text-anchor="middle" font-size="16" font-weight="bold" '
+                     f'transform="rotate(-90 25 {top + plot_height / 2:.0f})">Pontuação Normalizada (0-100)</text>')
+
+        # One line with markers per player
+        latest_scores = history.row(-1)
+        for i, player in enumerate(players):
+            color = self.CHART_COLORS[i % len(self.CHART_COLORS)]
+            points = [(x_of(round_num), y_of(score)) for round_num, score in zip(rounds, history.column(player))]
+            if len(points) > 1:
+                path = " ".join(f"{x:.1f},{y:.1f}" for x, y in points)
+                lines.append(f'<polyline points="{path}" fill="none" stroke="{color}" stroke-width="2.5"/>')
+            for x, y in points:
+                lines.append(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="{7 if len(points) == 1 else 5}" '
+                             f'fill="{color if len(points) == 1 else "white"}" stroke="{color}" stroke-width="2"/>')
+            # Latest score label next to the last point
+            x, y = points[-1]
+            score = latest_scores.get(player, 0)
+            lines.append(f'<rect x="{x + 8:.1f}" y="{y - 26:.1f}" width="{10 + 9 * len(str(score))}" height="20" rx="4" '
+                         f'fill="{color}" fill-opacity="0.7"/>')
+            lines.append(f'<text x="{x + 13:.1f}" y="{y - 11:.1f}" font-size="13" font-weight="bold" fill="white">{score}</text>')
+
+        # Legend (upper left)
+        legend_height = 10 + 22 * len(players)
+        lines.append(f'<rect x="{left + 10}" y="{top + 10}" width="200" height="{legend_height}" rx="4" '
+                     f'fill="white" fill-opacity="0.9" stroke="#999"/>')
+        for i, player in enumerate(players):
+            color = self.CHART_COLORS[i % len(self.CHART_COLORS)]
+            y = top + 26 + 22 * i
+            lines.append(f'<line x1="{left + 20}" y1="{y}" x2="{left + 50}" y2="{y}" stroke="{color}" stroke-width="2.5"/>')
+            lines.append(f'<text x="{left + 58}" y="{y + 5}" font-size="13">{html.escape(player)}</text>')
+        lines.append('</svg>')
+
+        content = "\n".join(lines) + "\n"
+        chart_file = self.output_path(chart_path)
+        try:
+            with open(chart_file, 'r', encoding='utf-8') as f:
+                unchanged = f.read() == content
+        except OSError:
+            unchanged = False
+        if unchanged:
+            print(f"📊 Gráfico sem mudanças - reaproveitando {chart_file}")
+        else:
+            with open(chart_file, 'w', encoding='utf-8') as f:
+                f.write(content)
+            print(f"📊 Gráfico de performance salvo em: {chart_file}")
         return chart_path
 
-    def update_readme(self, actual_standings, predictions, raw_scores, force_update=False):
-        """Update README.md with the latest results"""
+    # Bump when the chart drawing changes, so existing charts are redrawn
+    CHART_VERSION = 1
+    CHART_HASH_FILE = "performance_chart.hash"
+
+    def get_chart_hash(self, history, players):
+        """Hash of everything the performance chart shows"""
+        data = {
+            'version': self.CHART_VERSION,
+            'rounds': to_list(history.rounds),
+            'players': players,
+            'scores': [history.column(player) for player in players],
+        }
+        return hashlib.sha1(json.dumps(data, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+    def load_chart_hash(self):
         try:
-            # Sort players by score (highest first)
-            sorted_players = sorted(raw_scores.items(), key=lambda x: x[1], reverse=True)
-            player_names = [player[0] for player in sorted_players]
-
-            # Calculate normalized scores for graph
-            normalized_scores = {}
-            for player, score in raw_scores.items():
-                normalized_scores[player] = self.normalize_score(score)
-
-            # Generate the results table
-            results_table = []
-            results_table.append("## 🏆 Resultados Atuais")
-            results_table.append("")
-            results_table.append(f"**Última Atualização:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            results_table.append("")
-
-            # Create table header with players sorted by score
-            header = "| Time | Real |"
-            for player in player_names:
-                header += f" {player} |"
-            results_table.append(header)
-
-            # Create separator
-            separator = "|------|------|"
-            for _ in player_names:
-                separator += "------|"
-            results_table.append(separator)
-
-            # Create rows for each team
-            for team_data in actual_standings:
-                original_team_name = team_data['team']
-                team_name = self.normalize_team_name(original_team_name)
-                actual_pos = team_data['position']
-
-                row = f"| {original_team_name} | {actual_pos} |"
-
-                for player in player_names:
-                    player_predictions = predictions[player]
-                    # Find predicted position for this team
-                    predicted_pos = None
-                    for pos, predicted_team in player_predictions.items():
-                        if predicted_team == team_name:
-                            predicted_pos = int(pos)
-                            break
+            with open(self.output_path(self.CHART_HASH_FILE), 'r', encoding='utf-8') as f:
+                return f.read().strip()
+        except OSError:
+            return None
 
-                    if predicted_pos is not None:
-                        score = self.calculate_score(predicted_pos, actual_pos)
-                        row += f" {predicted_pos}°({score}p) |"
-                    else:
-                        row += " -- |"
+    def save_chart_hash(self, chart_hash):
+        with open(self.output_path(self.CHART_HASH_FILE), 'w', encoding='utf-8') as f:
+            f.write(chart_hash + "\n")
 
-                results_table.append(row)
+    # README block rewritten by update_readme: from this heading until the next "## " heading
+    README_RESULTS_HEADING = "## 🏆 Resultados Atuais"
+    README_TIMESTAMP_PREFIX = "**Última Atualização:**"
+
+    def readme_results_lines(self, report):
+        """README lines of the results heading, timestamp and team x player table"""
+        player_names = list(report.ranking)
+        player_columns = [report.players.index(player) for player in player_names]
+        lines = [self.README_RESULTS_HEADING, "", f"{self.README_TIMESTAMP_PREFIX} {report.timestamp}", "",
+                 "| Time | Real | " + " | ".join(player_names) + " |",
+                 "|------|------|" + "------|" * len(player_names)]
+
+        for index, team_data in enumerate(report.standings):
+            cells = report.row_cells(index)
+            row = []
+            for column in player_columns:
+                predicted_pos, score = cells[column]
+                row.append(f"{predicted_pos}°({score}p)" if predicted_pos else "--")
+            lines.append(f"| {team_data['team']} | {team_data['position']} | " + " | ".join(row) + " |")
+
+        # Total scores row (pontuação bruta)
+        lines.append("| **TOTAL** | | " + " | ".join(f"**{report.raw_scores.get(player, 0)}**"
+                                                    for player in player_names) + " |")
+        return lines
+
+    def readme_ranking_lines(self, report):
+        """README lines of the ranking by normalized score"""
+        lines = ["", "### 🏅 Classificação Atual (pontuação normalizada 0-100)", ""]
+        for i, player in enumerate(report.ranking, 1):
+            medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
+            bonus = report.bonus.get(player, 0)
+            bonus_tag = f" (+{bonus})" if bonus in (3, 6) else ""
+            lines.append(f"{medal} **{player}**{bonus_tag}: {report.normalized_scores[player]} pontos<br>")
+        return lines
+
+    def split_readme_sections(self, block):
+        """[(name, text)] of a results block split at its "### " headings"""
+        sections = []
+        for index, text in enumerate(re.split(r'\n(?=### )', block)):
+            name = self.README_RESULTS_HEADING if index == 0 else text.split("\n", 1)[0]
+            sections.append((name, text))
+        return sections
+
+    def readme_section_hash(self, text):
+        """Hash of a README section, ignoring the last-update timestamp and trailing blank lines"""
+        lines = [line for line in text.rstrip().split("\n") if not line.startswith(self.README_TIMESTAMP_PREFIX)]
+        return hashlib.sha1("\n".join(lines).encode('utf-8')).hexdigest()
+
+    def write_text_atomic(self, path, text):
+        """Write a text file through a temp file and a rename (never left half-written)"""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(temp_path, path)
+
+    def update_readme(self, report, force_update=False, title_odds=None):
+        """Update README.md with the latest results from a ScoreReport (and simulated title odds).
+
+        The results block is rendered section by section (results table, ranking,
+        title odds, history) and each section is hashed against the one already
+        in the README; the file is only rewritten, atomically, when a section
+        changed, so the timestamp alone never causes a new commit. Returns True
+        when README.md was written.
+        """
+        try:
+            results_table = self.readme_results_lines(report) + self.readme_ranking_lines(report)
+            if title_odds:
+                results_table.extend(self.title_odds_lines(title_odds, self.simulations))
 
-            # Add total scores row (pontuação bruta)
-            total_row = "| **TOTAL** | |"
-            for player in player_names:
-                total_row += f" **{raw_scores.get(player, 0)}** |"
-            results_table.append(total_row)
-            
-            # Add ranking (pontuação normalizada)
-            results_table.append("")
-            results_table.append("### 🏅 Classificação Atual (pontuação normalizada 0-100)")
-            results_table.append("")
-            bonus_points = self.calculate_bonus_points(actual_standings, predictions)
-            for i, (player, score) in enumerate(sorted_players, 1):
-                norm_score = self.normalize_score(score)
-                medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
-                bonus = bonus_points.get(player, 0)
-                bonus_tag = f" (+{bonus})" if bonus in (3, 6) else ""
-                results_table.append(f"{medal} **{player}**{bonus_tag}: {norm_score} pontos<br>")
-
-            # Calculate current round first
-            current_round = self.get_current_round(actual_standings)
-            
             # Save score history and check if we need to regenerate graph
-            should_update_graph = self.save_score_history(normalized_scores, raw_scores, current_round, force_update)
+            should_update_graph, history = self.save_score_history(report, force_update)
             
             # Generate score graph (always regenerate if scores changed or force update)
             if should_update_graph:
                 print("📊 Generating updated performance chart...")
-            graph_lines = self.generate_score_graph()
-            results_table.extend(graph_lines)
-
-            # Read current README
-            readme_path = "README.md"
-            if os.path.exists(readme_path):
-                with open(readme_path, 'r', encoding='utf-8') as f:
-                    readme_content = f.read()
-
-                # Find and replace the results section
-                results_section = "\n".join(results_table)
-
-                # Check if results section exists
-                import re
-                pattern = r'(## 🏆 Resultados Atuais.*?)(?=\n## |\Z)'
-                if re.search(pattern, readme_content, flags=re.DOTALL):
-                    # Replace existing results section - match everything from results until next ## or end
-                    new_content = re.sub(pattern, results_section, readme_content, flags=re.DOTALL)
-                else:
-                    # Add results section at the beginning after the title
-                    lines = readme_content.split('\n')
-                    title_line = 0
-                    for i, line in enumerate(lines):
-                        if line.startswith('# '):
-                            title_line = i
-                            break
-                    # Insert results after title
-                    lines.insert(title_line + 1, '')
-                    lines.insert(title_line + 2, results_section)
-                    new_content = '\n'.join(lines)
+            results_table.extend(self.generate_score_graph(history))
+            results_section = "\n".join(results_table)
 
-                # Write back to README
-                with open(readme_path, 'w', encoding='utf-8') as f:
-                    f.write(new_content)
+            readme_path = self.output_path("README.md")
+            if not os.path.exists(readme_path):
+                print(f"❌ {readme_path} not found")
+                return False
 
-                print(f"✅ Updated README.md with latest results")
+            with open(readme_path, 'r', encoding='utf-8') as f:
+                readme_content = f.read()
 
+            # Existing results section: everything from the heading until the next ## or the end
+            match = re.search(r'(## 🏆 Resultados Atuais.*?)(?=\n## |\Z)', readme_content, flags=re.DOTALL)
+            if match:
+                old_sections = self.split_readme_sections(match.group(1))
+                new_sections = self.split_readme_sections(results_section)
+                old_hashes = {name: self.readme_section_hash(text) for name, text in old_sections}
+                changed = [name for name, text in new_sections if old_hashes.get(name) != self.readme_section_hash(text)]
+                if not changed and [name for name, _ in old_sections] == [name for name, _ in new_sections]:
+                    print(f"ℹ️  {readme_path} already up to date - not rewritten")
+                    return False
+                new_content = readme_content[:match.start()] + results_section + readme_content[match.end():]
             else:
-                print("❌ README.md not found")
+                # Add results section at the beginning after the title
+                changed = [name for name, _ in self.split_readme_sections(results_section)]
+                lines = readme_content.split('\n')
+                title_line = 0
+                for i, line in enumerate(lines):
+                    if line.startswith('# '):
+                        title_line = i
+                        break
+                lines.insert(title_line + 1, '')
+                lines.insert(title_line + 2, results_section)
+                new_content = '\n'.join(lines)
+
+            self.write_text_atomic(readme_path, new_content)
+            changed = [name.lstrip('# ') for name in changed]
+            print(f"✅ Updated {readme_path} with latest results ({', '.join(changed) or 'section order'})")
+            return True
 
         except Exception as e:
             print(f"❌ Error updating README: {e}")
     
     def save_last_standings(self, standings, filename="last_standings.json"):
-        """Save current standings to a file for comparison"""
+        """Save current standings to a file (inside output_dir) for comparison"""
+        filename = self.output_path(filename)
         try:
             with open(filename, 'w', encoding='utf-8') as f:
                 json.dump(standings, f, indent=2, ensure_ascii=False)
@@ -1053,7 +3934,8 @@ class BrasileiroScraper:
             print(f"❌ Error saving last standings: {e}")
     
     def load_last_standings(self, filename="last_standings.json"):
-        """Load last standings from file"""
+        """Load last standings from file (inside output_dir)"""
+        filename = self.output_path(filename)
         try:
             if os.path.exists(filename):
                 with open(filename, 'r', encoding='utf-8') as f:
@@ -1063,35 +3945,96 @@ class BrasileiroScraper:
         return None
     
     def standings_changed(self, current_standings, last_standings):
-        """Check if standings have changed since last update"""
+        """Diff standings against the last update (a StandingsDiff, falsy if nothing changed)"""
         if not last_standings:
-            return True  # No previous data, so it's a change
+            return StandingsDiff(structural=True)  # No previous data, so it's a change
         
-        if len(current_standings) != len(last_standings):
-            return True  # Different number of teams
+        last_by_team = {team_data['team']: team_data for team_data in last_standings}
+        current_teams = [team_data['team'] for team_data in current_standings]
+        if (len(current_standings) != len(last_standings) or len(last_by_team) != len(last_standings)
+                or set(current_teams) != set(last_by_team)):
+            return StandingsDiff(structural=True)  # Teams added, removed or repeated
         
-        # Compare each team's position
-        for i, current_team in enumerate(current_standings):
-            if i >= len(last_standings):
-                return True  # More teams than before
-            
-            last_team = last_standings[i]
-            if (current_team['position'] != last_team['position'] or 
-                current_team['team'] != last_team['team'] or
-                current_team['points'] != last_team['points']):
-                return True  # Position, team, or points changed
+        # Compare each team's position and points
+        moves = []
+        points_changed = []
+        for current_team in current_standings:
+            last_team = last_by_team[current_team['team']]
+            if current_team['position'] != last_team['position']:
+                moves.append((current_team['team'], last_team['position'], current_team['position']))
+            if current_team['points'] != last_team['points']:
+                points_changed.append(current_team['team'])
+        reordered = current_teams != [team_data['team'] for team_data in last_standings]
         
-        return False  # No changes detected
+        return StandingsDiff(moves=tuple(moves), points_changed=tuple(points_changed), reordered=reordered)
+
+    def describe_standings_diff(self, diff):
+        """Console lines for the teams that moved"""
+        lines = []
+        for team, old_position, new_position in diff.moves:
+            change = int(old_position) - int(new_position)
+            arrow = "⬆️" if change > 0 else "⬇️"
+            lines.append(f"   {arrow} {team}: {old_position}° → {new_position}° ({change:+d})")
+        return lines
     
+    def process_standings(self, current_standings, predictions, force_update=False, report_unchanged=True):
+        """Score freshly fetched standings and publish them when they changed.
+
+        Diffs against last_standings.json, prints the score table and, on a change
+        (or forced), updates README.md and the saved standings. Returns the
+        ScoreReport and whether the standings changed / README.md was written;
+        with report_unchanged=False an unchanged table is neither scored nor
+        printed (report None).
+        """
+        last_standings = self.load_last_standings()
+        standings_diff = self.standings_changed(current_standings, last_standings)
+        changed = bool(force_update or standings_diff)
+        readme_written = False
+        if changed:
+            if force_update:
+                print("📢 Forçando atualização do README...")
+            else:
+                print("📊 Standings have changed - updating README...")
+                for line in self.describe_standings_diff(standings_diff):
+                    print(line)
+            report = self.build_score_report(current_standings, predictions)
+            self.print_score_report(report)
+            title_odds = self.run_title_simulation(current_standings, predictions)
+            self.run_elimination_analysis(current_standings, predictions)
+            readme_written = self.update_readme(report, force_update, title_odds)
+            self.save_last_standings(current_standings)
+            print(f"\n✅ Successfully compared {len(current_standings)} teams")
+            print(f"✅ Calculated scores for {len(predictions)} players")
+            if readme_written:
+                print("✅ README updated with new standings")
+            else:
+                print("ℹ️  README content unchanged - file not rewritten")
+        elif not report_unchanged:
+            print("📊 No changes in standings - README not updated")
+            report = None
+        else:
+            print("📊 No changes in standings - README not updated")
+            print("🔄 Standings remain the same as last update")
+            report = self.build_score_report(current_standings, predictions)
+            self.print_score_report(report)
+            self.run_title_simulation(current_standings, predictions)
+            self.run_elimination_analysis(current_standings, predictions)
+            print(f"\n✅ Successfully compared {len(current_standings)} teams")
+            print(f"✅ Calculated scores for {len(predictions)} players")
+            print("ℹ️  Use existing README for current results")
+        return {'report': report, 'changed': changed, 'readme_written': bool(readme_written)}
+
     def run_comparison(self, predictions_file="bolao.json"):
         """Main method to run the comparison"""
         try:
             import sys
             force_update = False
-            # Aceita 'force' como segundo argumento OU como primeiro argumento se não houver arquivo customizado
-            if (len(sys.argv) > 1 and sys.argv[1].lower() == "force") or (len(sys.argv) > 2 and sys.argv[2].lower() == "force"):
+            # Aceita 'force' em qualquer posição (antes ou depois do arquivo customizado e das opções --)
+            if any(arg.lower() == "force" for arg in sys.argv[1:]):
                 force_update = True
 
+            self.start_run()
+
             # Load predictions
             predictions = self.load_predictions(predictions_file)
             team_match_map = self.build_team_match_map(self.get_teams_from_predictions(predictions))
@@ -1100,37 +4043,606 @@ class BrasileiroScraper:
             current_standings = self.get_current_standings(team_match_map)
 
             if current_standings and predictions:
-                last_standings = self.load_last_standings()
-                if force_update or self.standings_changed(current_standings, last_standings):
-                    if force_update:
-                        print("📢 Forçando atualização do README...")
-                    else:
-                        print("📊 Standings have changed - updating README...")
-                    player_scores, raw_scores = self.compare_predictions(current_standings, predictions)
-                    self.update_readme(current_standings, predictions, raw_scores, force_update)
-                    self.save_last_standings(current_standings)
-                    print(f"\n✅ Successfully compared {len(current_standings)} teams")
-                    print(f"✅ Calculated scores for {len(predictions)} players")
-                    print("✅ README updated with new standings")
-                else:
-                    print("📊 No changes in standings - README not updated")
-                    print("🔄 Standings remain the same as last update")
-                    player_scores, raw_scores = self.compare_predictions(current_standings, predictions)
-                    print(f"\n✅ Successfully compared {len(current_standings)} teams")
-                    print(f"✅ Calculated scores for {len(predictions)} players")
-                    print("ℹ️  Use existing README for current results")
+                self.process_standings(current_standings, predictions, force_update)
             else:
                 print("❌ Failed to load data")
 
         except Exception as e:
             print(f"❌ Error: {e}")
 
+    # --daemon polling intervals (seconds): tight while matches are being played, backing
+    # off exponentially to hours between rounds
+    DAEMON_MIN_INTERVAL = 120
+    DAEMON_ROUND_INTERVAL = 1800
+    DAEMON_MAX_INTERVAL = 4 * 3600
+    # A change in games played within this window means matches are likely in play
+    DAEMON_ACTIVE_WINDOW = 3 * 3600
+
+    def next_poll_interval(self, polls):
+        """Seconds until the next --daemon poll from the recent polls.
+
+        polls holds (time, games played per team) of the last polls. Games
+        played changing recently means matches are in play: poll every
+        DAEMON_MIN_INTERVAL. Teams with different games played mean the round is
+        still under way: at most DAEMON_ROUND_INTERVAL. Otherwise the interval
+        doubles with every quiet poll up to DAEMON_MAX_INTERVAL.
+        """
+        if not polls:
+            return self.DAEMON_MIN_INTERVAL
+        polls = list(polls)
+        now, games = polls[-1]
+        quiet_polls = 0
+        for index in range(len(polls) - 1, 0, -1):
+            poll_time, current_games = polls[index]
+            if polls[index - 1][1] != current_games:
+                if now - poll_time <= self.DAEMON_ACTIVE_WINDOW:
+                    return self.DAEMON_MIN_INTERVAL
+                break
+            quiet_polls += 1
+
+        interval = min(self.DAEMON_MAX_INTERVAL, self.DAEMON_MIN_INTERVAL * 2 ** quiet_polls)
+        if games and len(set(games)) > 1:
+            interval = min(interval, self.DAEMON_ROUND_INTERVAL)
+        return interval
+
+    def run_daemon(self, predictions_file="bolao.json", force_update=False, max_polls=None, on_update=None):
+        """Poll the sources forever in this process (--daemon).
+
+        The scraper stays warm between polls: keep-alive connections, the HTTP
+        cache, compiled alias index, predictions (reloaded only when the file
+        changes) and the scoring engine. Every poll goes through
+        process_standings, so README.md is updated exactly as in a single run;
+        on_update(outcome) is called after each poll that found a change.
+        """
+        polls = deque(maxlen=16)
+        predictions = None
+        predictions_mtime = None
+        team_match_map = None
+        poll_count = 0
+        print(f"🔁 Daemon mode - polling {predictions_file} (Ctrl+C to stop)")
+        try:
+            while max_polls is None or poll_count < max_polls:
+                poll_count += 1
+                try:
+                    mtime = os.path.getmtime(predictions_file) if os.path.exists(predictions_file) else None
+                    if predictions is None or mtime != predictions_mtime:
+                        predictions = self.load_predictions(predictions_file)
+                        predictions_mtime = mtime
+                        team_match_map = self.build_team_match_map(self.get_teams_from_predictions(predictions))
+
+                    self.start_run()
+                    print(f"\n🕒 Poll {poll_count} at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+                    current_standings = self.get_current_standings(team_match_map)
+                    if current_standings and predictions:
+                        outcome = self.process_standings(current_standings, predictions, force_update,
+                                                         report_unchanged=False)
+                        force_update = False
+                        if outcome['changed'] and on_update:
+                            on_update(outcome)
+                        polls.append((time.monotonic(), tuple(self.json_int(team_data, ('games',)) or 0
+                                                              for team_data in current_standings)))
+                    else:
+                        print("❌ Failed to load data")
+                except Exception as e:
+                    print(f"❌ Error: {e}")
+
+                if max_polls is not None and poll_count >= max_polls:
+                    break
+                interval = self.next_poll_interval(polls)
+                print(f"💤 Next poll in {interval // 60} min")
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            print("\n👋 Daemon stopped")
+        finally:
+            self.connection_pool.close()
+
+
+class LeaderboardServer:
+    """Local read-only HTTP API with the leaderboard as JSON (--serve).
+
+    Every response body is rendered once into an in-memory snapshot (path ->
+    (ETag, bytes)) from the saved standings at startup and again only when
+    they change: pushed by the poll loop with --daemon, or, when serving alone,
+    when the saved standings / history / predictions files change on disk
+    (checked at most every WATCH_INTERVAL seconds). A read is otherwise a dict
+    lookup; If-None-Match is answered with 304. The server never writes to
+    disk. Plain asyncio streams with keep-alive, no external services.
+    """
+
+    # Seconds between checks of the saved files when serving without --daemon
+    WATCH_INTERVAL = 1.0
+
+    def __init__(self, scraper, predictions_file="bolao.json", host="127.0.0.1", port=8000):
+        self.scraper = scraper
+        self.predictions_file = predictions_file
+        self.host = host
+        self.port = port
+        self.snapshot = {}
+        self.watch_files = False
+        self.files_stamp = None
+        self.next_check = 0.0
+
+    def saved_files_stamp(self):
+        """(mtime, size) of every file the snapshot is built from"""
+        stamp = []
+        for path in (self.scraper.output_path("last_standings.json"), self.scraper.history_store.path,
+                     self.predictions_file):
+            try:
+                stat = os.stat(path)
+                stamp.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def refresh_if_changed(self):
+        """Rebuild the snapshot when a saved file changed since it was built"""
+        now = time.monotonic()
+        if not self.watch_files or now < self.next_check:
+            return
+        self.next_check = now + self.WATCH_INTERVAL
+        if self.saved_files_stamp() != self.files_stamp:
+            print("🔄 Saved standings changed - refreshing the leaderboard")
+            self.refresh_from_disk()
+
+    def refresh_from_disk(self):
+        """Build the snapshot from last_standings.json and the predictions (no network)"""
+        self.files_stamp = self.saved_files_stamp()
+        standings = self.scraper.load_last_standings()
+        predictions = self.scraper.load_predictions(self.predictions_file)
+        if standings and predictions:
+            self.update(self.scraper.build_score_report(standings, predictions))
+        else:
+            print("⚠️ No saved standings yet - serving an empty leaderboard until the first update")
+            self.update(None)
+
+    def update(self, report):
+        """Render every endpoint for a ScoreReport and swap the snapshot in one assignment"""
+        documents = {'/': {'updated': None, 'round': None, 'endpoints': [
+            '/standings', '/scores', '/teams', '/bonuses', '/history', '/players', '/players/<nome>']}}
+        if report is not None:
+            documents['/'].update(updated=report.timestamp, round=report.round)
+            rank = {player: i for i, player in enumerate(report.ranking, 1)}
+            cells = [report.row_cells(row) for row in range(len(report.standings))]
+            columns = {player: column for column, player in enumerate(report.players)}
+
+            def player_document(player):
+                column = columns[player]
+                return {
+                    'player': player,
+                    'rank': rank[player],
+                    'raw': report.raw_scores[player],
+                    'normalized': report.normalized_scores[player],
+                    'bonus': report.bonus.get(player, 0),
+                    'teams': [{'team': team_data['team'], 'position': team_data['position'],
+                               'predicted': cells[row][column][0] or None, 'points': cells[row][column][1]}
+                              for row, team_data in enumerate(report.standings)],
+                }
+
+            documents['/standings'] = report.standings
+            documents['/scores'] = [{key: value for key, value in player_document(player).items() if key != 'teams'}
+                                    for player in report.ranking]
+            documents['/bonuses'] = {player: report.bonus.get(player, 0) for player in report.ranking}
+            documents['/teams'] = [{
+                'team': team_data['team'],
+                'position': team_data['position'],
+                'predictions': {player: {'predicted': cells[row][columns[player]][0] or None,
+                                         'points': cells[row][columns[player]][1]} for player in report.ranking},
+            } for row, team_data in enumerate(report.standings)]
+            documents['/players'] = list(report.ranking)
+            for player in report.ranking:
+                documents[f'/players/{player}'] = player_document(player)
+        documents['/history'] = self.history_document()
+
+        snapshot = {}
+        for path, document in documents.items():
+            body = json.dumps(document, ensure_ascii=False).encode('utf-8')
+            snapshot[path] = (f'"{hashlib.sha1(body).hexdigest()[:16]}"', body)
+        self.snapshot = snapshot
+
+    def history_document(self):
+        """Rounds and per-player normalized / raw scores (null where a player has none)"""
+        try:
+            # Fresh read-only view of the history: no index or column files are written
+            store = ScoreHistoryStore(self.scraper.history_store.path, legacy_path=None, read_only=True)
+            history = ScoreHistoryColumns.sync(self.scraper.history_columns_dir, store, save=False)
+        except Exception as e:
+            print(f"⚠️ Could not load score history: {e}")
+            return {'rounds': [], 'timestamps': [], 'players': {}}
+        rows = {field: [history.row(index, field) for index in range(len(history))] for field in ScoreHistoryColumns.FIELDS}
+        return {
+            'rounds': to_list(history.rounds),
+            'timestamps': [t.decode('utf-8') if isinstance(t, bytes) else t for t in to_list(history.timestamps)],
+            'players': {player: {field: [row.get(player) for row in rows[field]] for field in ScoreHistoryColumns.FIELDS}
+                        for player in history.players},
+        }
+
+    def respond(self, method, target, headers):
+        """(status, extra headers, body) for one request"""
+        if method not in ('GET', 'HEAD'):
+            return 405, [('Allow', 'GET, HEAD')], b'{"error": "method not allowed"}'
+        self.refresh_if_changed()
+        path = urllib.parse.unquote(urllib.parse.urlsplit(target).path).rstrip('/') or '/'
+        entry = self.snapshot.get(path)
+        if entry is None:
+            return 404, [], b'{"error": "not found"}'
+        etag, body = entry
+        if etag in (tag.strip() for tag in headers.get('if-none-match', '').split(',')):
+            return 304, [('ETag', etag)], b''
+        return 200, [('ETag', etag), ('Cache-Control', 'no-cache')], body
+
+    async def handle_client(self, reader, writer):
+        """Serve requests on one connection until the client closes it (HTTP/1.1 keep-alive)"""
+        import asyncio
+        reasons = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed'}
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                parts = request_line.decode('latin-1').split()
+                if len(parts) == 3:
+                    method, target, version = parts
+                    status, extra_headers, body = self.respond(method, target, headers)
+                    connection = headers.get('connection', '').lower()
+                    keep_alive = connection == 'keep-alive' if version == 'HTTP/1.0' else connection != 'close'
+                else:
+                    method, version = 'GET', 'HTTP/1.1'
+                    status, extra_headers, body = 400, [], b'{"error": "bad request"}'
+                    keep_alive = False
+                # Request bodies are not read, so only body-less requests keep the connection
+                keep_alive = keep_alive and status != 405
+
+                head = [f"HTTP/1.1 {status} {reasons[status]}",
+                        "Content-Type: application/json; charset=utf-8",
+                        f"Content-Length: {len(body)}",
+                        "Access-Control-Allow-Origin: *",
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+                head.extend(f"{name}: {value}" for name, value in extra_headers)
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode('latin-1'))
+                if method != 'HEAD':
+                    writer.write(body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self):
+        import asyncio
+        server = await asyncio.start_server(self.handle_client, self.host, self.port)
+        print(f"🌐 Serving the leaderboard at http://{self.host}:{self.port}/")
+        async with server:
+            await server.serve_forever()
+
+    def serve_forever(self):
+        import asyncio
+        asyncio.run(self.serve())
+
+    def run(self, poll=False, force_update=False, max_polls=None):
+        """Serve the saved leaderboard; with poll=True keep polling (--daemon) and
+        refresh the snapshot whenever the standings change; without it, watch the
+        files another process (a scheduled run or daemon) writes."""
+        self.refresh_from_disk()
+        try:
+            if not poll:
+                self.watch_files = True
+                self.serve_forever()
+                return
+            threading.Thread(target=self.serve_forever, daemon=True).start()
+            self.scraper.run_daemon(self.predictions_file, force_update, max_polls=max_polls,
+                                    on_update=lambda outcome: self.update(outcome['report']))
+        except KeyboardInterrupt:
+            print("\n👋 Server stopped")
+        except OSError as e:
+            print(f"❌ Could not start the server: {e}")
+
+
+# Per-process state of --workers pool scoring
+pool_worker = {}
+
+
+def init_pool_worker(actual_standings):
+    """Worker process initializer: keep the standings and one scraper for every shard"""
+    pool_worker['standings'] = actual_standings
+    pool_worker['scraper'] = BrasileiroScraper(attempts_file=None, http_cache_file=None)
+
+
+def score_pool_shard(pool_file, start, end, top_k, batch_size):
+    """Score the pool lines starting in [start, end) inside a worker process"""
+    scraper = pool_worker['scraper']
+    records = scraper.iter_pool_predictions(pool_file, start, end)
+    return scraper.score_pool(pool_worker['standings'], scraper.iter_pool_batches(records, batch_size), top_k)
+
+
+# Per-process state of the --batch workers
+batch_worker = {}
+
+
+def init_batch_worker(actual_standings, options, force_update):
+    """Worker process initializer: keep the shared standings and the scraper options"""
+    batch_worker['standings'] = actual_standings
+    batch_worker['force_update'] = force_update
+    batch_worker['scraper'] = BrasileiroScraper(attempts_file=None, http_cache_file=None, **options)
+
+
+def publish_batch_pool(pool):
+    """Publish one --batch pool inside a worker process"""
+    return batch_worker['scraper'].publish_pool(pool, batch_worker['standings'], batch_worker['force_update'])
+
+
+# Per-process state of the --simulate workers
+simulation_worker = {}
+
+
+def init_simulation_worker(model):
+    """Worker process initializer: keep the simulation model for every chunk"""
+    simulation_worker['model'] = model
+
+
+def run_simulation_chunk(simulations, seed):
+    """Simulate one chunk inside a worker process"""
+    return simulate_title_chunk(simulation_worker['model'], simulations, seed)
+
+
+def simulate_title_chunk(model, simulations, seed, batch_size=5000):
+    """Simulate final tables and score them; returns per-player win / top-3 / score sums"""
+    rng = np.random.default_rng(seed)
+    predicted = model['predicted']
+    player_count, team_count = predicted.shape
+    totals = {key: np.zeros(player_count) for key in ('wins', 'top3', 'normalized')}
+    predicted_mask = predicted > 0
+    ranks = np.arange(1, team_count + 1, dtype=np.int16)
+
+    done = 0
+    while done < simulations:
+        count = min(batch_size, simulations - done)
+        done += count
+
+        # Final points; random fractions break ties in points
+        final = np.tile(model['points'].astype(np.float64), (count, 1))
+        for team in range(team_count):
+            outcomes = rng.multinomial(model['remaining'][team], model['probabilities'][team], size=count)
+            final[:, team] += 3 * outcomes[:, 0] + outcomes[:, 1]
+        final += rng.random(final.shape) * 0.5
+        order = np.argsort(-final, axis=1)
+        positions = np.empty((count, team_count), dtype=np.int16)
+        np.put_along_axis(positions, order, np.broadcast_to(ranks, (count, team_count)), axis=1)
+
+        # Bolão scores of every player in every simulated table
+        raw = np.zeros((count, player_count), dtype=np.int64)
+        for team in range(team_count):
+            diff = np.abs(positions[:, team:team + 1] - predicted[None, :, team])
+            raw += np.where(predicted_mask[None, :, team], np.maximum(0, 20 - diff), 0)
+        champion_ids = model['bonus_ids'][order[:, 0]]
+        raw += 3 * (model['champions'][None, :] == champion_ids[:, None])
+        if team_count >= 20:
+            bottom_ids = model['bonus_ids'][order[:, 16:20]]
+            bottom_hits = sum((model['bottom_fours'][None, :, column:column + 1] == bottom_ids[:, None, :]).any(axis=2)
+                              for column in range(4))
+            raw += 3 * (bottom_hits >= 3)
+
+        best = raw.max(axis=1, keepdims=True)
+        winners = raw == best
+        totals['wins'] += (winners / winners.sum(axis=1, keepdims=True)).sum(axis=0)
+        third = np.sort(raw, axis=1)[:, -min(3, player_count)][:, None]
+        totals['top3'] += (raw >= third).sum(axis=0)
+        span = model['max_score'] - model['min_score']
+        normalized = np.clip(np.round((raw - model['min_score']) * 100 / span), 0, 100) if span > 0 else np.zeros_like(raw)
+        totals['normalized'] += normalized.sum(axis=0)
+
+    return totals
+
+
+# Latency budget of a "poll, nothing changed, exit" run, network time excluded (ms)
+STARTUP_BUDGET_MS = 150
+
+
+def measure_ms(function, *args, **kwargs):
+    """(result, milliseconds) of one call"""
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def profile_imports(module_name="scrape_brasileirao_simple"):
+    """Interpreter startup and import times of module_name in fresh processes (ms).
+
+    Returns (interpreter, import total, module body, [(module, cumulative)]) for
+    the modules module_name imports directly, from `python -X importtime`.
+    """
+    import subprocess
+    import sys
+    directory = os.path.dirname(os.path.abspath(__file__))
+    interpreter_ms = min(measure_ms(subprocess.run, [sys.executable, "-c", "pass"], cwd=directory)[1]
+                         for _ in range(3))
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+                               cwd=directory, capture_output=True, text=True)
+
+    # Children are reported before their parent, indented two spaces per level
+    modules = []
+    for line in completed.stderr.splitlines():
+        fields = line.partition("import time:")[2].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        name = name.strip()
+        if level == 1:
+            modules.append((name, int(fields[1]) / 1000))
+        elif level == 0 and name == module_name:
+            modules.sort(key=lambda entry: entry[1], reverse=True)
+            return interpreter_ms, int(fields[1]) / 1000, int(fields[0]) / 1000, modules
+        elif level == 0:
+            modules = []
+    return interpreter_ms, None, None, []
+
+
+def profile_startup(predictions_file="bolao.json", budget_ms=STARTUP_BUDGET_MS):
+    """--profile-startup: import and init costs of a poll that finds nothing changed.
+
+    Measures interpreter startup, per-module import times, the local steps of the
+    poll (everything but the network) and the first-use cost of each lazily
+    imported module, then checks the poll path against the latency budget.
+    Returns True when it fits.
+    """
+    import sys
+    rows = []  # (label, ms, counted in the poll path)
+
+    interpreter_ms, import_ms, body_ms, modules = profile_imports()
+    rows.append(("Interpreter startup", interpreter_ms, True))
+    if import_ms is None:
+        print("❌ Could not measure import times")
+        return False
+    rows.append(("import scrape_brasileirao_simple", import_ms, True))
+    rows.extend((f"  {name}", ms, None) for name, ms in modules)
+    rows.append(("  (module body)", body_ms, None))
+
+    # A script run as `python scrape_brasileirao_simple.py` is compiled on every start;
+    # `python -m scrape_brasileirao_simple` reuses the cached bytecode
+    with open(__file__, 'r', encoding='utf-8') as f:
+        source = f.read()
+    as_script = getattr(sys.modules.get("__main__"), "__spec__", None) is None
+    rows.append(("Compile script (not with python -m)", measure_ms(compile, source, __file__, "exec")[1], as_script))
+
+    scraper, ms = measure_ms(BrasileiroScraper)
+    rows.append(("BrasileiroScraper()", ms, True))
+    predictions, ms = measure_ms(scraper.load_predictions, predictions_file)
+    rows.append(("load_predictions", ms, True))
+    teams = scraper.get_teams_from_predictions(predictions)
+    rows.append(("build_team_match_map", measure_ms(scraper.build_team_match_map, teams)[1], True))
+    rows.append(("load_http_cache", measure_ms(scraper.load_http_cache)[1], True))
+    last_standings, ms = measure_ms(scraper.load_last_standings)
+    rows.append(("load_last_standings", ms, True))
+    if last_standings and predictions:
+        rows.append(("standings_changed", measure_ms(scraper.standings_changed, last_standings, last_standings)[1], True))
+        rows.append(("build_score_report", measure_ms(scraper.build_score_report, last_standings, predictions)[1], True))
+
+    # First use of the lazily imported modules; HTTP/TLS is needed by every network poll
+    lazy_modules = [(http_client, True), (ssl, True), (unicodedata, True), (np, False), (plt, False)]
+    for module, on_poll_path in lazy_modules:
+        if module.name in sys.modules:
+            continue
+        if module is np and not NUMPY_AVAILABLE or module is plt and not MATPLOTLIB_AVAILABLE:
+            continue
+        rows.append((f"first use: import {module.name}", measure_ms(importlib.import_module, module.name)[1], on_poll_path))
+    rows.append(("first use: SSL context", measure_ms(scraper.create_ssl_context)[1], True))
+
+    total_ms = sum(ms for _, ms, counted in rows if counted)
+    print("⏱️  Startup profile (ms) - * = poll path, network excluded")
+    print("-" * 56)
+    for label, ms, counted in rows:
+        marker = "*" if counted else " "
+        print(f"{marker} {label:<44} {ms:>8.1f}")
+    print("-" * 56)
+    within_budget = total_ms <= budget_ms
+    print(f"{'✅' if within_budget else '⚠️'} Poll path: {total_ms:.1f} ms (budget {budget_ms} ms)")
+    return within_budget
+
+
+# Command line options that take a value (e.g. --timeout 10)
+OPTIONS_WITH_VALUE = {"--timeout", "--deadline", "--retries", "--hedge", "--record", "--replay",
+                      "--pool", "--top", "--batch-size", "--workers", "--simulate", "--chart", "--batch",
+                      "--max-polls", "--host", "--port", "--output"}
+
+
+def parse_args(argv):
+    """Split command line into positional arguments and --options"""
+    positional = []
+    options = {}
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in OPTIONS_WITH_VALUE and i + 1 < len(argv):
+            options[arg] = argv[i + 1]
+            i += 2
+            continue
+        if arg.startswith("--"):
+            options[arg] = True
+        elif arg.lower() != "force":
+            positional.append(arg)
+        i += 1
+    return positional, options
+
+
 def main():
-    scraper = BrasileiroScraper()
     import sys
-    # Detect 'force' argument and set predictions file correctly
-    args = [arg for arg in sys.argv[1:] if arg.lower() != "force"]
+    args, options = parse_args(sys.argv[1:])
+    if "--profile-startup" in options:
+        # --profile-startup: import / init costs of a poll against STARTUP_BUDGET_MS
+        profile_startup(args[0] if args else "bolao.json")
+        return
+    # --output <dir>: write README.md, last_standings.json, the history and the chart there;
+    # a replayed run never touches the live files and publishes to <archive>_replay/ by default
+    output_dir = options.get("--output")
+    if "--replay" in options and not output_dir:
+        output_dir = f"{os.path.splitext(options['--replay'])[0]}_replay"
+    scraper = BrasileiroScraper(
+        # --sequential: query the sources one after another instead of all at once
+        concurrent_fetch="--sequential" not in options,
+        # --no-cache: always download full pages (no If-None-Match / If-Modified-Since)
+        http_cache_file=None if "--no-cache" in options or "--replay" in options else "http_cache.json",
+        # Replayed runs don't say anything about the live sources' health
+        source_health_file=None if "--replay" in options else "source_health.json",
+        # --record <archive>: keep raw responses; --replay <archive>: run offline from them
+        record_archive=options.get("--record"),
+        replay_archive=options.get("--replay"),
+        request_timeout=float(options.get("--timeout", 15)),
+        run_deadline=float(options["--deadline"]) if "--deadline" in options else None,
+        max_retries=int(options.get("--retries", 2)),
+        hedge_percentile=float(options["--hedge"]) if "--hedge" in options else None,
+        # --simulate <n>: Monte Carlo title odds over n simulated season endings
+        simulations=int(options.get("--simulate", 0)),
+        workers=int(options.get("--workers", 1)),
+        # --bounds: highest / lowest score still reachable and who is eliminated
+        elimination_analysis="--bounds" in options,
+        # --chart svg|png: chart backend (svg is used anyway when matplotlib is missing)
+        chart_backend=options.get("--chart"),
+        output_dir=output_dir if "--batch" not in options else None,
+    )
+    if output_dir and "--batch" not in options:
+        scraper.prepare_output_dir()
+    if "--source-health" in options:
+        # --source-health: recorded success rate / latency per source and the resulting order
+        scraper.print_source_health()
+        return
+    if "--pool" in options:
+        # --pool <file.jsonl>: stream a large pool, keeping only the --top K leaderboard
+        scraper.run_pool(options["--pool"], top_k=int(options.get("--top", 10)),
+                         batch_size=int(options.get("--batch-size", 10000)),
+                         workers=scraper.workers)
+        return
+    if "--batch" in options:
+        # --batch <dir|manifest.json> [--output <dir>]: one fetch, then every pool published
+        # to its own directory
+        force_update = any(arg.lower() == "force" for arg in sys.argv[1:])
+        scraper.run_batch(options["--batch"], workers=scraper.workers, force_update=force_update,
+                          output_dir=output_dir)
+        return
     predictions_file = args[0] if args else "bolao.json"
+    if "--serve" in options:
+        # --serve [--host H] [--port N]: local JSON API; with --daemon it also keeps polling
+        server = LeaderboardServer(scraper, predictions_file, host=options.get("--host", "127.0.0.1"),
+                                   port=int(options.get("--port", 8000)))
+        server.run(poll="--daemon" in options,
+                   force_update=any(arg.lower() == "force" for arg in sys.argv[1:]),
+                   max_polls=int(options["--max-polls"]) if "--max-polls" in options else None)
+        return
+    if "--daemon" in options:
+        # --daemon: keep polling in this process on an adaptive schedule (--max-polls N to stop)
+        force_update = any(arg.lower() == "force" for arg in sys.argv[1:])
+        scraper.run_daemon(predictions_file, force_update,
+                           max_polls=int(options["--max-polls"]) if "--max-polls" in options else None)
+        return
     scraper.run_comparison(predictions_file)
 
 if __name__ == "__main__":
@@ -0,0 +1,25 @@
+import json
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import scrape_brasileirao_simple  # noqa: E402
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    """Scraper working in an empty directory, without attempts or HTTP cache files"""
+    monkeypatch.chdir(tmp_path)
+    return scrape_brasileirao_simple.BrasileiroScraper(attempts_file=None, http_cache_file=None)
+
+
+@pytest.fixture
+def teams():
+    """The 20 teams of the bundled bolao.json"""
+    with open(os.path.join(ROOT, 'bolao.json'), 'r', encoding='utf-8') as f:
+        predictions = json.load(f)
+    return list(next(iter(predictions.values())).values())
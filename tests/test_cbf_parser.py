@@ -0,0 +1,42 @@
+import pytest
+
+from scrape_brasileirao_simple import CBFStandingsParser
+
+
+def cbf_page(teams, before='', after=''):
+    """Page in the CBF markup: group heading, then one marked row per team"""
+    rows = "".join(
+        f'<tr><td class="styles_teamPosition__CFIvz"><strong class="styles_position__x">{position}</strong>'
+        f'<strong class="styles_teamName__x">{team}</strong></td><td>{60 - 2 * position}</td><td>23</td>'
+        f'<td>10</td></tr>'
+        for position, team in enumerate(teams, 1))
+    return (f'<html><body>{before}<h2>GRUPO ÚNICO</h2><table><tbody>{rows}</tbody></table>'
+            f'{after}</body></html>')
+
+
+def stream(page, chunk_size):
+    parser = CBFStandingsParser()
+    for start in range(0, len(page), chunk_size):
+        if parser.feed(page[start:start + chunk_size]):
+            break
+    return parser
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 64, 1000, 65536])
+def test_stream_matches_regex_across_chunk_boundaries(scraper, teams, chunk_size):
+    filler = '<div class="filler"><p>Notícias &amp; destaques</p><h2>Grupo de notícias</h2></div>' * 30
+    page = cbf_page(teams, before=filler, after=filler)
+    parser = stream(page, chunk_size)
+
+    assert parser.done
+    expected = scraper.parse_cbf_standings_regex(page)
+    assert len(expected) == 20
+    assert scraper.build_cbf_standings(parser.rows) == expected
+
+
+def test_stops_at_the_group_table(scraper, teams):
+    # A second table after the group one (same chunk) must not leak into the rows
+    later_table = cbf_page(list(reversed(teams)))
+    parser = stream(cbf_page(teams, after=later_table), 65536)
+    assert parser.done
+    assert [team for _, team, _ in parser.rows] == teams
@@ -0,0 +1,41 @@
+import json
+
+import pytest
+
+from scrape_brasileirao_simple import EmbeddedJSONScanner
+
+
+def next_data_page(teams):
+    """Page with the table only in __NEXT_DATA__ (nested team objects, Portuguese keys)"""
+    rows = [{'posicao': position, 'equipe': {'nome_popular': team}, 'pontos': 60 - 2 * position, 'jogos': 23}
+            for position, team in enumerate(teams, 1)]
+    data = {'props': {'pageProps': {'artilheiros': [{'nome': 'Fulano', 'gols': 12}],
+                                    'classificacao': {'grupos': [{'tabela': rows}]}}}}
+    return ('<html><head><script src="/app.js"></script>'
+            f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(data, ensure_ascii=False)}</script>'
+            '</head><body><p>sem tabela em HTML</p></body></html>')
+
+
+@pytest.mark.parametrize('chunk_size', [1, 5, 100, 100000])
+def test_scanner_collects_blocks_across_chunk_boundaries(teams, chunk_size):
+    page = next_data_page(teams)
+    whole = EmbeddedJSONScanner()
+    whole.feed(page)
+    chunked = EmbeddedJSONScanner()
+    for start in range(0, len(page), chunk_size):
+        chunked.feed(page[start:start + chunk_size])
+
+    assert len(whole.blocks) == 1
+    assert chunked.blocks == whole.blocks
+
+
+def test_find_json_standings(scraper, teams):
+    standings = scraper.parse_embedded_json_standings(next_data_page(teams))
+    assert [(row['position'], row['team'], row['points'], row['games']) for row in standings] == [
+        (position, scraper.normalize_team_name(team), str(60 - 2 * position), '23')
+        for position, team in enumerate(teams, 1)]
+
+
+def test_lists_that_are_not_a_table_are_ignored(scraper):
+    players = [{'posicao': i, 'nome': f'Jogador {i}', 'gols': 20 - i} for i in range(1, 21)]
+    assert scraper.find_json_standings({'artilharia': players}) is None
@@ -0,0 +1,18 @@
+from scrape_brasileirao_simple import BrasileiroScraper
+
+
+def test_attempts_log_is_capped(tmp_path):
+    path = tmp_path / 'fetch_attempts.jsonl'
+    scraper = BrasileiroScraper(attempts_file=str(path), http_cache_file=None, source_health_file=None)
+    scraper.ATTEMPTS_MAX_BYTES = 4000
+    scraper.ATTEMPTS_TAIL_BYTES = 1000
+    for i in range(200):
+        scraper.record_fetch_attempt(f'https://example.com/{i % 3}', 0, 'ok', i / 1000)
+        assert path.stat().st_size <= scraper.ATTEMPTS_MAX_BYTES + 200
+
+    # Only whole lines are kept, and the latest attempts are the ones read back
+    latencies = BrasileiroScraper(attempts_file=str(path), http_cache_file=None,
+                                  source_health_file=None).load_fetch_latencies()
+    assert latencies['https://example.com/1'][-1] == 0.199
+    lines = path.read_text(encoding='utf-8').splitlines()
+    assert all(line.startswith('{') and line.endswith('}') for line in lines)
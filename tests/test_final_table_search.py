@@ -0,0 +1,67 @@
+import itertools
+import random
+
+from scrape_brasileirao_simple import FinalTableSearch
+
+
+def reachable(remaining):
+    """Extra points a team can still make in its remaining games"""
+    return sorted({3 * wins + draws for wins in range(remaining + 1) for draws in range(remaining + 1 - wins)})
+
+
+def brute_force_best(points, remaining, values, bonus_ids, champion, bottom_picks, bonus=3):
+    """Best total over every final table: every reachable total, every tie order"""
+    best = None
+    for finals in itertools.product(*[[p + extra for extra in reachable(r)] for p, r in zip(points, remaining)]):
+        order = sorted(range(len(points)), key=lambda team: -finals[team])
+        groups = [list(group) for _, group in itertools.groupby(order, key=lambda team: finals[team])]
+        for tie_orders in itertools.product(*[itertools.permutations(group) for group in groups]):
+            table = [team for group in tie_orders for team in group]
+            total = sum(values[team][rank] for rank, team in enumerate(table))
+            if bonus_ids[table[0]] == champion:
+                total += bonus
+            if sum(1 for team in table[16:20] if bonus_ids[team] in bottom_picks) >= 3:
+                total += bonus
+            best = total if best is None else max(best, total)
+    return best
+
+
+def late_season_table(rng):
+    """20 teams with a couple of tied totals and 2-4 teams with games left"""
+    points = sorted(rng.sample(range(20, 80), 19), reverse=True)
+    points.insert(rng.randrange(19), points[rng.randrange(19)])
+    points.sort(reverse=True)
+    remaining = [0] * 20
+    for team in rng.sample(range(20), rng.randint(2, 4)):
+        remaining[team] = rng.choice([1, 1, 2])
+    return points, remaining
+
+
+def test_best_matches_brute_force():
+    rng = random.Random(11)
+    for _ in range(30):
+        points, remaining = late_season_table(rng)
+        values = [[rng.randint(0, 20) for _ in range(20)] for _ in range(20)]
+        bonus_ids = list(range(20))
+        champion = rng.randrange(20)
+        bottom_picks = rng.sample(range(20), 4)
+        search = FinalTableSearch(points, remaining)
+
+        highest, exact = search.best(values, bonus_ids, champion, bottom_picks)
+        assert exact
+        assert highest == brute_force_best(points, remaining, values, bonus_ids, champion, bottom_picks)
+
+        negated = [[-value for value in row] for row in values]
+        lowest, exact = search.best(negated, bonus_ids, champion, bottom_picks, bonus=-3)
+        assert exact
+        assert lowest == brute_force_best(points, remaining, negated, bonus_ids, champion, bottom_picks, bonus=-3)
+
+
+def test_exhausted_budget_is_an_upper_bound():
+    rng = random.Random(5)
+    points, remaining = late_season_table(rng)
+    values = [[rng.randint(0, 20) for _ in range(20)] for _ in range(20)]
+    bonus_ids = list(range(20))
+    highest, exact = FinalTableSearch(points, remaining, node_budget=0).best(values, bonus_ids, 0, [16, 17, 18, 19])
+    assert not exact
+    assert highest >= brute_force_best(points, remaining, values, bonus_ids, 0, [16, 17, 18, 19])
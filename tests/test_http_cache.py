@@ -0,0 +1,65 @@
+import http.server
+import threading
+
+import pytest
+
+from scrape_brasileirao_simple import BrasileiroScraper
+
+PAGE = b'<html><body>standings</body></html>'
+ETAG = '"v1"'
+
+
+@pytest.fixture
+def server():
+    """Local page with an ETag that answers 304 to a matching If-None-Match"""
+    requests = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests.append(dict(self.headers))
+            if self.headers.get('If-None-Match') == ETAG:
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('ETag', ETAG)
+            self.send_header('Content-Length', str(len(PAGE)))
+            self.end_headers()
+            self.wfile.write(PAGE)
+
+        def log_message(self, *args):
+            pass
+
+    httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{httpd.server_address[1]}/tabela', requests
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_not_modified_reuses_cached_standings(tmp_path, server):
+    url, requests = server
+    standings = [{'position': 1, 'team': 'Flamengo', 'points': '50', 'games': '23'}]
+    parsed = []
+
+    def parser(html_content, team_match_map):
+        parsed.append(html_content)
+        return standings
+
+    cache_file = str(tmp_path / 'http_cache.json')
+    first = BrasileiroScraper(attempts_file=None, http_cache_file=cache_file)
+    assert first.fetch_standings(url, parser) == standings
+    assert len(parsed) == 1
+    # Written through a temp file and a rename
+    assert [path.name for path in tmp_path.iterdir()] == ['http_cache.json']
+
+    # A new run loads the validators from disk, revalidates and skips parsing
+    second = BrasileiroScraper(attempts_file=None, http_cache_file=cache_file)
+    assert second.fetch_standings(url, parser) == standings
+    assert len(parsed) == 1
+    assert requests[-1].get('If-None-Match') == ETAG
+
+    # Another team match map can't reuse the cached rows: full download
+    second.fetch_standings(url, parser, {'flamengo': 'Flamengo'})
+    assert len(parsed) == 2
+    assert 'If-None-Match' not in requests[-1]
@@ -0,0 +1,39 @@
+import json
+import os
+
+import pytest
+
+from conftest import ROOT
+from scrape_brasileirao_simple import LeaderboardServer
+
+
+@pytest.fixture
+def server(scraper, teams):
+    predictions_file = os.path.join(ROOT, 'bolao.json')
+    standings = [{'position': position, 'team': team, 'points': str(60 - 2 * position), 'games': '23'}
+                 for position, team in enumerate(teams, 1)]
+    server = LeaderboardServer(scraper, predictions_file)
+    server.update(scraper.build_score_report(standings, scraper.load_predictions(predictions_file)))
+    return server
+
+
+def test_etag_and_not_modified(server):
+    status, headers, body = server.respond('GET', '/scores', {})
+    assert status == 200
+    etag = dict(headers)['ETag']
+    scores = json.loads(body)
+    assert [entry['rank'] for entry in scores] == list(range(1, len(scores) + 1))
+
+    status, headers, body = server.respond('GET', '/scores?x=1', {'if-none-match': f'"other", {etag}'})
+    assert (status, body) == (304, b'')
+    assert dict(headers)['ETag'] == etag
+
+
+def test_players_and_errors(server):
+    status, _, body = server.respond('GET', '/players', {})
+    player = json.loads(body)[0]
+    status, _, body = server.respond('GET', f'/players/{player}', {})
+    assert status == 200 and json.loads(body)['player'] == player
+
+    assert server.respond('GET', '/nada', {})[0] == 404
+    assert server.respond('POST', '/scores', {})[0] == 405
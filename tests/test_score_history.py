@@ -0,0 +1,69 @@
+import json
+
+from scrape_brasileirao_simple import ScoreHistoryStore
+
+
+def entry(round_num, timestamp, score):
+    return {'timestamp': timestamp, 'round': round_num,
+            'normalized_scores': {'Ana': score, 'Bia': 100 - score},
+            'raw_scores': {'Ana': 200 + score, 'Bia': 300 - score}}
+
+
+def store_at(tmp_path, legacy_path=None):
+    return ScoreHistoryStore(str(tmp_path / 'score_history.jsonl'), legacy_path=legacy_path)
+
+
+def log_lines(store):
+    with open(store.path, 'r', encoding='utf-8') as f:
+        return f.read().splitlines()
+
+
+def test_migrates_legacy_json(tmp_path):
+    legacy = tmp_path / 'score_history.json'
+    history = [entry(1, '2026-04-01 10:00:00', 40), entry(2, '2026-04-08 10:00:00', 45),
+               entry(2, '2026-04-09 10:00:00', 47)]
+    legacy.write_text(json.dumps(history), encoding='utf-8')
+
+    store = store_at(tmp_path, str(legacy))
+    assert store.latest_per_round() == [history[0], history[2]]
+    assert len(log_lines(store)) == 3
+    assert legacy.exists()
+
+
+def test_index_catches_up_with_other_writers(tmp_path):
+    store = store_at(tmp_path)
+    store.append(entry(1, '2026-04-01 10:00:00', 40))
+    assert store.last()['round'] == 1
+
+    # Another process appends; this store only reads the new lines
+    other = store_at(tmp_path)
+    other.append(entry(2, '2026-04-08 10:00:00', 45))
+    assert store.last()['round'] == 2
+    assert [e['round'] for e in store.latest_per_round()] == [1, 2]
+    assert store_at(tmp_path).load_index() == store.load_index()
+
+    # A log that shrank (rewritten by hand) rebuilds the index
+    with open(store.path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(entry(5, '2026-05-01 10:00:00', 50)) + '\n')
+    assert [e['round'] for e in store.latest_per_round()] == [5]
+
+
+def test_replace_last(tmp_path):
+    store = store_at(tmp_path)
+    store.append(entry(1, '2026-04-01 10:00:00', 40))
+    store.append(entry(2, '2026-04-08 10:00:00', 45))
+
+    # Same round and line length: rewritten in place
+    store.replace_last(entry(2, '2026-04-08 11:00:00', 46))
+    assert len(log_lines(store)) == 2
+    assert store.last()['normalized_scores']['Ana'] == 46
+
+    # Another line length: appended, the index points at the new line
+    store.replace_last(entry(2, '2026-04-08 12:00:00', 5))
+    assert len(log_lines(store)) == 3
+    assert store_at(tmp_path).last()['normalized_scores']['Ana'] == 5
+
+    # Another round: appended, the previous round is kept
+    store.replace_last(entry(3, '2026-04-15 10:00:00', 47))
+    assert len(log_lines(store)) == 4
+    assert [e['round'] for e in store_at(tmp_path).latest_per_round()] == [1, 2, 3]
@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from scrape_brasileirao_simple import NUMPY_AVAILABLE, ScoreHistoryColumns, ScoreHistoryStore, to_list
+
+
+def random_entry(rng, round_num, players):
+    scores = {player: rng.randint(0, 100) for player in rng.sample(players, rng.randint(1, len(players)))}
+    return {'timestamp': f'2026-05-{rng.randint(1, 28):02d} {rng.randint(0, 23):02d}:00:00', 'round': round_num,
+            'normalized_scores': scores, 'raw_scores': {player: 200 + score for player, score in scores.items()}}
+
+
+def as_lists(columns):
+    """Rounds and every player's columns (player order is not compared)"""
+    return (to_list(columns.rounds), to_list(columns.timestamps),
+            {player: (columns.column(player), columns.column(player, 'raw')) for player in columns.players})
+
+
+def test_sync_matches_from_entries(tmp_path):
+    rng = random.Random(2)
+    store = ScoreHistoryStore(str(tmp_path / 'score_history.jsonl'), legacy_path=None)
+    directory = str(tmp_path / 'score_history.columns')
+    players = ['Ana', 'Bia', 'Caio']
+    for step in range(25):
+        if step % 7 == 6:
+            players.append(f'Novo{step}')
+        store.append(random_entry(rng, rng.randint(1, 10), players))
+        columns = ScoreHistoryColumns.sync(directory, store)
+        assert as_lists(columns) == as_lists(ScoreHistoryColumns.from_entries(store.latest_per_round()))
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason='numpy not installed')
+def test_saved_columns_reload(tmp_path):
+    rng = random.Random(4)
+    store = ScoreHistoryStore(str(tmp_path / 'score_history.jsonl'), legacy_path=None)
+    directory = str(tmp_path / 'score_history.columns')
+    for round_num in range(1, 6):
+        store.append(random_entry(rng, round_num, ['Ana', 'Bia']))
+    columns = ScoreHistoryColumns.sync(directory, store)
+    assert as_lists(ScoreHistoryColumns.load(directory)) == as_lists(columns)
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason='numpy not installed')
+def test_saves_never_replace_mapped_files(tmp_path):
+    rng = random.Random(6)
+    store = ScoreHistoryStore(str(tmp_path / 'score_history.jsonl'), legacy_path=None)
+    directory = tmp_path / 'score_history.columns'
+    for round_num in range(1, 4):
+        store.append(random_entry(rng, round_num, ['Ana', 'Bia']))
+    first = ScoreHistoryColumns.sync(str(directory), store)
+    before = as_lists(first)
+
+    store.append(random_entry(rng, 4, ['Ana', 'Bia', 'Caio']))
+    second = ScoreHistoryColumns.sync(str(directory), store)
+
+    # The first mapping still reads its own generation; the new one went to new files
+    assert as_lists(first) == before
+    assert to_list(second.rounds) == [1, 2, 3, 4]
+    assert all(name.endswith('.2.npy') for name in (path.name for path in directory.iterdir())
+               if name.endswith('.npy'))
@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from scrape_brasileirao_simple import NUMPY_AVAILABLE, ScoringEngine, to_list
+
+BACKENDS = [pytest.param(True, id='numpy', marks=pytest.mark.skipif(not NUMPY_AVAILABLE, reason='numpy not installed')),
+            pytest.param(False, id='loops')]
+# Names the scraper maps to the canonical ones (predictions use the canonical names)
+ALIASES = ['Vasco da Gama', 'Sao Paulo', 'Gremio', 'Sport', 'Ceará']
+
+
+def random_predictions(rng, teams, players):
+    """Predictions with the odd repeated team, missing position or aliased name"""
+    predictions = {}
+    for i in range(players):
+        picks = rng.sample(teams + ALIASES, 20)
+        if rng.random() < 0.2:
+            picks[rng.randrange(20)] = rng.choice(picks)
+        player_predictions = {str(position): team for position, team in enumerate(picks, 1)}
+        if rng.random() < 0.1:
+            del player_predictions[str(rng.randint(1, 20))]
+        predictions[f'P{i}'] = player_predictions
+    return predictions
+
+
+def random_standings(rng, teams):
+    standings = [{'position': position, 'team': team, 'points': str(60 - position), 'games': '30'}
+                 for position, team in enumerate(rng.sample(teams + ALIASES, 20), 1)]
+    if rng.random() < 0.2:
+        standings = standings[:rng.randint(15, 20)]
+    return standings
+
+
+def reference_scores(scraper, standings, predictions):
+    """Raw scores the way the scraper computed them before ScoringEngine"""
+    raw = {player: 0 for player in predictions}
+    for team_data in standings:
+        team_name = scraper.normalize_team_name(team_data['team'])
+        for player, player_predictions in predictions.items():
+            for position, predicted_team in player_predictions.items():
+                if predicted_team == team_name:
+                    raw[player] += scraper.calculate_score(int(position), team_data['position'])
+                    break
+    for player, bonus in scraper.calculate_bonus_points(standings, predictions).items():
+        raw[player] += bonus
+    return raw
+
+
+@pytest.mark.parametrize('use_numpy', BACKENDS)
+def test_score_matches_calculate_score(scraper, teams, use_numpy):
+    rng = random.Random(3)
+    for _ in range(100):
+        predictions = random_predictions(rng, teams, rng.randint(1, 30))
+        standings = random_standings(rng, teams)
+        engine = ScoringEngine(predictions, scraper.normalize_team_name, use_numpy=use_numpy)
+        result = engine.score(standings)
+
+        expected = reference_scores(scraper, standings, predictions)
+        assert dict(zip(engine.players, to_list(result['raw']))) == expected
+        assert dict(zip(engine.players, to_list(result['normalized']))) == {
+            player: scraper.normalize_score(raw) for player, raw in expected.items()}
+
+
+@pytest.mark.parametrize('use_numpy', BACKENDS)
+def test_update_matches_score(scraper, teams, use_numpy):
+    rng = random.Random(7)
+    for _ in range(100):
+        predictions = random_predictions(rng, teams, rng.randint(1, 30))
+        engine = ScoringEngine(predictions, scraper.normalize_team_name, use_numpy=use_numpy)
+        previous_standings = [{'position': position, 'team': team, 'points': str(60 - position), 'games': '30'}
+                              for position, team in enumerate(rng.sample(teams, 20), 1)]
+        # A few teams swap places (sometimes the champion or the bottom four)
+        order = [team_data['team'] for team_data in previous_standings]
+        for _ in range(rng.randint(1, 4)):
+            a, b = rng.randrange(20), rng.randrange(20)
+            order[a], order[b] = order[b], order[a]
+        standings = [{'position': position, 'team': team, 'points': str(60 - position), 'games': '31'}
+                     for position, team in enumerate(order, 1)]
+
+        previous = engine.score(previous_standings)
+        diff = scraper.standings_changed(standings, previous_standings)
+        updated = engine.update(previous, previous_standings, standings, diff)
+        expected = engine.score(standings)
+        for key in ('predicted', 'team_scores', 'base', 'bonus', 'raw', 'normalized'):
+            assert to_list(updated[key]) == to_list(expected[key]), key
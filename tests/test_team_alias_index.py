@@ -0,0 +1,50 @@
+import random
+
+from scrape_brasileirao_simple import BrasileiroScraper, TeamAliasIndex
+
+
+def linear_related(mapping, text):
+    """The old normalize_team_name scan: first key that contains text or is contained in it"""
+    for key, value in mapping.items():
+        if key in text or text in key:
+            return value
+    return None
+
+
+def linear_contained(mapping, text):
+    for key, value in mapping.items():
+        if key in text:
+            return value
+    return None
+
+
+def random_text(rng, alphabet='abcab ', low=1, high=6):
+    return ''.join(rng.choice(alphabet) for _ in range(rng.randint(low, high)))
+
+
+def test_lookups_match_linear_scan():
+    rng = random.Random(1)
+    for _ in range(200):
+        mapping = {random_text(rng): f'T{i}' for i in range(rng.randint(1, 12))}
+        index = TeamAliasIndex(mapping)
+        for _ in range(20):
+            text = random_text(rng, high=9)
+            assert index.related_alias(text) == linear_related(mapping, text), (mapping, text)
+            assert index.alias_in(text) == linear_contained(mapping, text), (mapping, text)
+
+
+def test_name_mappings_match_linear_scan(teams):
+    mapping = {key.lower(): value for key, value in BrasileiroScraper.NAME_MAPPINGS.items()}
+    index = TeamAliasIndex(mapping)
+    names = teams + ['Vasco da Gama', 'sao', 'Atlético Mineiro', 'Sport Recife', 'fc', 'a', 'Santos FC SAF', 'xyz']
+    for name in names:
+        text = name.lower()
+        assert index.related_alias(text) == linear_related(mapping, text), name
+
+
+def test_changes_recompile():
+    index = TeamAliasIndex({'gremio': 'Grêmio'})
+    assert index.related_alias('gremio fbpa') == 'Grêmio'
+    index['fbpa'] = 'FBPA'
+    del index['gremio']
+    assert index.related_alias('gremio fbpa') == 'FBPA'
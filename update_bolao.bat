@@ -74,10 +74,11 @@ echo [1/5] Executando script do bolao...
 echo Mudando para o diretorio do projeto...
 
 REM Se o primeiro argumento for -f, força atualização ignorando checagem
+REM (python -m reaproveita o bytecode compilado em __pycache__ a cada execução)
 if "%1"=="-f" (
-    python "D:\Documentos\Pyhton Scripts\bolao_br26\scrape_brasileirao_simple.py" force
+    python -m scrape_brasileirao_simple force
 ) else (
-    python "D:\Documentos\Pyhton Scripts\bolao_br26\scrape_brasileirao_simple.py"
+    python -m scrape_brasileirao_simple
 )
 if %errorlevel% neq 0 (
     echo ❌ ERRO: Falha ao executar o script Python